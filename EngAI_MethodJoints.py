@@ -2,29 +2,23 @@ import streamlit as st
 import time
 from datetime import timedelta
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import grade_mcq, within, count_canvas_lines, solve_joints_truss, load_glossary
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_diagram, units_check, what_if
 
 st.set_page_config(page_title="STATICS Method — Truss Analysis", page_icon="🏗️", layout="centered")
+PROBLEM_ID = "truss_joints"
+render = RenderTimer(PROBLEM_ID)
 
 # ==========================================
 # 1. PROBLEM DEFINITION & IMAGE
 # ==========================================
 st.title("Truss Analysis: Method of Joints")
 
-# --- 🖼️ PASTE YOUR IMAGE URL BELOW ---
-# Replace the URL inside the quotes with the direct link to your problem image.
-PROBLEM_IMAGE_URL = "https://i.imgur.com/QpHoGiS.jpeg"
-# ------------------------------------
-
+# Diagram is vendored in statics_core/data/diagrams (see statics_core/assets.py)
 try:
-    st.image(PROBLEM_IMAGE_URL, caption="Problem Diagram", use_container_width=True)
+    show_diagram("truss_joints", caption="Problem Diagram", width="stretch")
 except Exception:
-    st.error("Could not load image. Please check the PROBLEM_IMAGE_URL variable in the code.")
+    st.error("Could not load image. Please check statics_core/data/diagrams.json.")
 
 st.info("📄 **Reference:** Look at the diagram above showing a right-angled truss with a 500 N horizontal load.")
 
@@ -43,84 +37,68 @@ st.divider()
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-if "step_idx" not in st.session_state:
-    st.session_state.step_idx = 0
-if "start_time" not in st.session_state:
-    st.session_state.start_time = None
-if "timer_finished" not in st.session_state:
-    st.session_state.timer_finished = False
-if "vocab_idx" not in st.session_state:
-    st.session_state.vocab_idx = 0
-if "s_given_sel" not in st.session_state:
-    st.session_state.s_given_sel = set()
-if "angle_correct" not in st.session_state: 
-    st.session_state.angle_correct = False
-if "bc_correct" not in st.session_state: 
-    st.session_state.bc_correct = False
-if "ab_correct" not in st.session_state: 
-    st.session_state.ab_correct = False
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
 STUDY_DURATION = 180 
 
-VOCAB = [
-    {"term": "Method of Joints", "def": "A process of analyzing a truss by finding equilibrium at each individual pin (joint). You must choose a starting joint carefully based on the number of unknowns."},
-    {"term": "Tension (T)", "def": "A force that pulls a member apart. In a joint FBD, a tension force arrow points AWAY from the joint."},
-    {"term": "Compression (C)", "def": "A force that squeezes a member. In a joint FBD, a compression force arrow points TOWARDS the joint."},
-    {"term": "Two-Force Member", "def": "A truss member with pins at each end and no loads in between. Forces can only act strictly along the axis of the member."}
-]
+# Reference answers (tension positive, compression negative)
+TRUSS = solve_joints_truss(P=500.0, height=2.0, base=2.0)
+
+VOCAB = load_glossary().cards(PROBLEM_ID)  # shared, read-only cards
 
 # ----------------------------
 # 3. SIDEBAR RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
 # ----------------------------
 # STEP 0: START
 # ----------------------------
-if st.session_state.step_idx == 0:
+if S.step_idx == 0:
     if st.button("▶️ Begin S.T.A.T.I.C.S. Method"):
-        st.session_state.step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.step_idx >= 1:
+if S.step_idx >= 1:
+    render.step(1)
     st.header("S — Study the Problem")
     st.caption("Read carefully and visualize what’s happening physically.")
     
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining.")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
     with st.container(border=True):
-        st.subheader(f"Vocabulary Card {st.session_state.vocab_idx + 1}/{len(VOCAB)}")
-        card = VOCAB[st.session_state.vocab_idx]
+        st.subheader(f"Vocabulary Card {S.vocab_idx + 1}/{len(VOCAB)}")
+        card = VOCAB[S.vocab_idx]
         st.markdown(f"**{card['term']}**")
         st.write(card['def'])
         c1, c2 = st.columns(2)
-        if c1.button("⬅️ Prev") and st.session_state.vocab_idx > 0:
-            st.session_state.vocab_idx -= 1
-            st.rerun()
-        if c2.button("Next ➡️") and st.session_state.vocab_idx < len(VOCAB)-1:
-            st.session_state.vocab_idx += 1
-            st.rerun()
+        if c1.button("⬅️ Prev") and S.vocab_idx > 0:
+            S.vocab_idx -= 1
+            render.rerun()
+        if c2.button("Next ➡️") and S.vocab_idx < len(VOCAB)-1:
+            S.vocab_idx += 1
+            render.rerun()
 
     st.write("#### Identify Key Parameters")
     GIVEN_OPTS = [
@@ -133,26 +111,26 @@ if st.session_state.step_idx >= 1:
     cols_g = st.columns(2)
     for i, (txt, is_correct) in enumerate(GIVEN_OPTS):
         with cols_g[i % 2]:
-            if st.checkbox(txt, value=(txt in st.session_state.s_given_sel), key=f"g_{i}"):
-                st.session_state.s_given_sel.add(txt)
+            if st.checkbox(txt, value=(txt in S.s_given_sel), key=f"g_{i}"):
+                S.s_given_sel.add(txt)
             else:
-                st.session_state.s_given_sel.discard(txt)
+                S.s_given_sel.discard(txt)
 
-    if st.session_state.step_idx == 1 and st.session_state.timer_finished:
+    if S.step_idx == 1 and S.timer_finished:
         if st.button("Check & Continue to T"):
-            correct = sum(1 for t, c in GIVEN_OPTS if c and t in st.session_state.s_given_sel)
-            wrongs = sum(1 for t, c in GIVEN_OPTS if not c and t in st.session_state.s_given_sel)
-            if correct == 3 and wrongs == 0:
+            all_ok, _, _, _ = grade_mcq(S.s_given_sel, GIVEN_OPTS)
+            if record_attempt(PROBLEM_ID, 1, "Check & Continue to T", all_ok):
                 st.success("Correct! Understanding the specific reaction capabilities of Pins vs Rollers is crucial.")
-                st.session_state.step_idx = 2
-                st.rerun()
+                S.step_idx = 2
+                render.rerun()
             else:
                 st.warning("Please review the support types carefully in your textbook before proceeding.")
 
 # ======================================================
 # T — TRANSLATE TO DIAGRAM (Step 2: FBD)
 # ======================================================
-if st.session_state.step_idx >= 2:
+if S.step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate to a Diagram (FBD)")
 
@@ -172,18 +150,21 @@ if st.session_state.step_idx >= 2:
         st.subheader("2. Draw FBD of Joint B")
         st.info("Use the **Line Tool** to draw the Free Body Diagram of **Joint B** only.")
         
-        if _canvas_ok:
+        st_canvas = load_canvas()  # imported on first use
+        if st_canvas is not None:
             canvas_fbd = st_canvas(
                 stroke_width=3, stroke_color="#000", background_color="#fff",
-                height=300, width=500, drawing_mode="line", display_toolbar=True, key="canvas_fbd_jointb"
+                height=300, width=500, drawing_mode="line", key="canvas_fbd_jointb",
+                initial_drawing=initial_strokes("canvas_fbd_jointb")
             )
+            remember_strokes("canvas_fbd_jointb", canvas_fbd.json_data)
 
             if st.button("Check FBD"):
-                num_lines = len(canvas_fbd.json_data["objects"]) if canvas_fbd.json_data else 0
-                if 3 <= num_lines <= 5:
+                num_lines = count_canvas_lines(canvas_fbd.json_data)
+                if record_attempt(PROBLEM_ID, 2, "Check FBD", 3 <= num_lines <= 5):
                     st.success("FBD detected. Proceed to Assign.")
-                    st.session_state.step_idx = 3
-                    st.rerun()
+                    S.step_idx = 3
+                    render.rerun()
                 else:
                     st.error(f"Detected {num_lines} lines. Think about all external loads and connected members at Joint B.")
     elif joint_guess:
@@ -192,7 +173,8 @@ if st.session_state.step_idx >= 2:
 # ======================================================
 # A — ASSIGN (Step 3: Coordinates & Assumptions)
 # ======================================================
-if st.session_state.step_idx >= 3:
+if S.step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Coordinates and Assumptions")
     
@@ -206,17 +188,18 @@ if st.session_state.step_idx >= 3:
                          "Guess based on visual inspection"])
     
     if st.button("Acknowledge Assumptions"):
-        if "Tension" in q_assume:
+        if record_attempt(PROBLEM_ID, 3, "Acknowledge Assumptions", "Tension" in q_assume):
             st.success("Correct! Assuming Tension means a positive math result confirms Tension, and a negative math result means Compression. This keeps signs consistent.")
-            st.session_state.step_idx = 4
-            st.rerun()
+            S.step_idx = 4
+            render.rerun()
         else:
             st.warning("While you *can* guess, assuming Tension universally prevents sign errors later. Try selecting the standard assumption.")
 
 # ======================================================
 # T — TRANSLATE TO COMPONENTS (Step 4: Breakdown)
 # ======================================================
-if st.session_state.step_idx >= 4:
+if S.step_idx >= 4:
+    render.step(4)
     st.divider()
     st.header("T — Translate Forces to Components")
     st.caption("Break each force into x- and y-components using trigonometry.")
@@ -233,13 +216,13 @@ if st.session_state.step_idx >= 4:
     angle_in = st.number_input("What is the interior angle of Member BC relative to the horizontal (degrees)?", min_value=0.0, max_value=90.0)
     
     if st.button("Check Angle"):
-        if abs(angle_in - 45.0) < 0.1:
+        if record_attempt(PROBLEM_ID, 4, "Check Angle", within(angle_in, TRUSS["angle_bc"], 0.1)):
             st.success("Correct. The geometry forms a 45-45-90 right triangle.")
-            st.session_state.angle_correct = True
+            S.angle_correct = True
         else:
             st.error("Check your trigonometry. Set up the ratio of opposite over adjacent and find the inverse.")
 
-    if st.session_state.get("angle_correct"):
+    if S.angle_correct:
         st.subheader("2. Define Components of $F_{BC}$")
         st.write("Assume $F_{BC}$ is in **Tension**.")
         st.info("💡 **Tip:** Use the $45^{\\circ}$ angle at the **bottom** of the triangle (Joint C) to define your components via alternate interior angles.")
@@ -254,17 +237,18 @@ if st.session_state.step_idx >= 4:
                             ["+F_BC * sin(45°)", "-F_BC * sin(45°)", "-F_BC * cos(45°)"])
                             
         if st.button("Verify Components"):
-            if "+F_BC * cos(45°)" in q_x_comp and "-F_BC * sin(45°)" in q_y_comp:
+            if record_attempt(PROBLEM_ID, 4, "Verify Components", "+F_BC * cos(45°)" in q_x_comp and "-F_BC * sin(45°)" in q_y_comp):
                 st.success("Correct. Tension pulls down and right, meaning $+X$ and $-Y$.")
-                st.session_state.step_idx = 5
-                st.rerun()
+                S.step_idx = 5
+                render.rerun()
             else:
                 st.error("Review your quadrant signs and trig functions. If it pulls away from the top-left joint, where is it heading?")
 
 # ======================================================
 # I — IMPLEMENT (Step 5: Equilibrium Equations)
 # ======================================================
-if st.session_state.step_idx >= 5:
+if S.step_idx >= 5:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equilibrium Equations")
     st.caption("Apply $\\sum F_x = 0$ and $\\sum F_y = 0$ at Joint B.")
@@ -279,17 +263,18 @@ if st.session_state.step_idx >= 5:
                        ["Sum of Forces in Y = 0", "Sum of Forces in X = 0"])
     
     if st.button("Confirm Equation Strategy"):
-        if strat_q == "Sum of Forces in X = 0":
+        if record_attempt(PROBLEM_ID, 5, "Confirm Equation Strategy", strat_q == "Sum of Forces in X = 0"):
             st.success("Correct. Since $F_{AB}$ is purely vertical, the X-equation only contains the external load and the horizontal component of $F_{BC}$.")
-            st.session_state.step_idx = 6
-            st.rerun()
+            S.step_idx = 6
+            render.rerun()
         else:
             st.error("Evaluate the variables in the Y-equation. Can you solve an equation with two unknown variables?")
 
 # ======================================================
 # C — COMPUTE (Step 6: Guided Math)
 # ======================================================
-if st.session_state.step_idx >= 6:
+if S.step_idx >= 6:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
     st.caption("Solve algebraically for unknown magnitudes and angles.")
@@ -306,14 +291,14 @@ if st.session_state.step_idx >= 6:
     f_bc_state = col2.selectbox("State of BC:", ["Tension (T)", "Compression (C)"], key="bc_state")
     
     if st.button("Check BC"):
-        if abs(f_bc_val - 707.1) < 2.0 and f_bc_state == "Compression (C)":
+        if record_attempt(PROBLEM_ID, 6, "Check BC", within(f_bc_val, abs(TRUSS["F_BC"]), 2.0) and f_bc_state == "Compression (C)"):
             st.success("Correct! $F_{BC} = 707.1$ N (C).")
-            st.session_state.bc_correct = True
+            S.bc_correct = True
         else:
             st.error("Check your algebra. If your calculated value is negative, what does that mean for the state of the member?")
 
     # --- Part 2: Member AB ---
-    if st.session_state.get("bc_correct"):
+    if S.bc_correct:
         st.divider()
         st.subheader("Part 2: Force in Member AB")
         st.write("Now set up your $\\sum F_y = 0$ equation at Joint B and solve.")
@@ -326,14 +311,14 @@ if st.session_state.step_idx >= 6:
         f_ab_state = col4.selectbox("State of AB:", ["Tension (T)", "Compression (C)"], key="ab_state")
         
         if st.button("Check AB"):
-            if abs(f_ab_val - 500.0) < 1.0 and f_ab_state == "Tension (T)":
+            if record_attempt(PROBLEM_ID, 6, "Check AB", within(f_ab_val, abs(TRUSS["F_AB"]), 1.0) and f_ab_state == "Tension (T)"):
                 st.success("Correct! $F_{AB} = 500$ N (T).")
-                st.session_state.ab_correct = True
+                S.ab_correct = True
             else:
                 st.error("Think carefully about the signs. If $F_{BC}$ is in compression, it pushes *up* on Joint B. What must $F_{AB}$ do to keep the joint from flying upwards?")
 
     # --- Part 3: Member AC (Final Calculation) ---
-    if st.session_state.get("ab_correct"):
+    if S.ab_correct:
         st.divider()
         st.subheader("Part 3: Force in Member AC")
         st.write("Move your analysis to **Joint C** to find the force in the bottom member.")
@@ -346,17 +331,18 @@ if st.session_state.step_idx >= 6:
         f_ac_state = col6.selectbox("State of AC:", ["Tension (T)", "Compression (C)"], key="ac_state")
         
         if st.button("Check AC and Finish"):
-            if abs(f_ac_val - 500.0) < 1.0 and f_ac_state == "Tension (T)":
+            if record_attempt(PROBLEM_ID, 6, "Check AC and Finish", within(f_ac_val, abs(TRUSS["F_AC"]), 1.0) and f_ac_state == "Tension (T)"):
                 st.balloons()
-                st.session_state.step_idx = 7
-                st.rerun()
+                S.step_idx = 7
+                render.rerun()
             else:
                 st.error("Look at the horizontal forces at Joint C. If the diagonal member is pushing down and to the right, what must the bottom horizontal member do to stop Joint C from moving right?")
 
 # ======================================================
 # S — SANITY CHECK (Step 7)
 # ======================================================
-if st.session_state.step_idx >= 7:
+if S.step_idx >= 7:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     st.caption("Do the results make physical sense?")
@@ -378,6 +364,12 @@ if st.session_state.step_idx >= 7:
     
     st.info("You have successfully applied the Method of Joints using the S.T.A.T.I.C.S. approach.")
     
+    units_check(PROBLEM_ID)
+    
+    what_if(PROBLEM_ID)
+
     if st.button("Start New Problem"):
-        st.session_state.clear()
-        st.rerun()
\ No newline at end of file
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
+
+render.finish()
\ No newline at end of file
@@ -1,12 +1,19 @@
 import streamlit as st
-from io import BytesIO
-from PIL import Image
 import math
-import re
 import time
 from datetime import timedelta
 
+from statics_core import (
+    ang_diff, signed_ang_diff, extract_lines, angle_rel_axes,
+    included_angle_deg, law_of_cosines, clamp_unit, grade_mcq, within,
+    solve_force_triangle, solve_ring_components, load_glossary,
+    within_pct, solve_ring_3d, RING_3D_ANCHORS, solve_cables_batch, components, Sum,
+)
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_rendered, units_check, what_if, equation_input
+
 st.set_page_config(page_title="STATICS Method — Study", page_icon="🧱", layout="centered")
+PROBLEM_ID = "ring"
+render = RenderTimer(PROBLEM_ID)
 
 # ----------------------------
 # PROBLEM (outside of STATICS method)
@@ -21,6 +28,7 @@ PROBLEM_TEXT = (
 
 st.title("Force Triangle Excercise")
 st.write(PROBLEM_TEXT)
+show_rendered("ring", caption="Forces on the ring at O")
 
 st.divider()
 st.header("STATICS Method")
@@ -28,97 +36,55 @@ st.header("STATICS Method")
 # ----------------------------
 # KEYWORDS & DEFINITIONS
 # ----------------------------
-KEY_DEFS = {
-    "equilibrium": "The pulls and pushes on the ring balance each other so that the ring stays still (it doesn’t start moving or rotating).",
-    "force triangle": "A way to show three forces that keep an object still by drawing them head-to-tail so they form a closed triangle. The last side that closes the triangle represents the third force needed to balance the other two.",
-    "head-to-tail": "Place tail of one vector at head of previous; closing side gives the resultant/opposite.",
-    "smooth ring": "Idealized contact with negligible friction; cable forces pass through the ring center.",
-    "cable": "Tension-only member; force acts along the cable, away from the body.",
-    "magnitude": "Size/length of a vector (e.g., newtons).",
-    "direction": "Orientation/angle of a vector (e.g., degrees CCW from +x).",
-}
-# Only show terms actually present in the problem (simple scan)
-TERMS_IN_PROBLEM = [k for k in KEY_DEFS if re.search(rf"\b{re.escape(k)}\b", PROBLEM_TEXT, re.IGNORECASE)]
-CORE_TERMS = {"equilibrium", "force triangle"}  # must be acknowledged by student
-
-# Expected patterns for pass/fail checking (lightweight, forgiving)
-GIVEN_PATTERNS = {
-    "F1 magnitude": r"f1[^0-9]*400\s*?n",
-    "F1 direction": r"30\s*°|\b30\s*deg|\b30\s*degrees",
-    "F2 magnitude": r"f2[^0-9]*250\s*?n",
-    "F2 direction": r"135\s*°|\b135\s*deg|\b135\s*degrees",
-    "equilibrium": r"\bequilibrium\b",
-    # helpful but optional: smooth ring
-}
-TARGET_PATTERNS = {
-    "F3 magnitude": r"f3.*(magnitude|find|compute|solve)",
-    "F3 direction": r"f3.*(direction|angle|theta|θ)",
-    # helpful but optional: ΣF = 0 / closes triangle
-}
+GLOSSARY = load_glossary()  # parsed once per process, shared read-only
+KEY_DEFS = GLOSSARY.definitions(PROBLEM_ID)
+CORE_TERMS = GLOSSARY.core_terms(PROBLEM_ID)  # must be acknowledged by student
+
+# Only show terms actually present in the problem (cached single-pass scan, aliases included)
+TERMS_IN_PROBLEM = GLOSSARY.terms_in_text(PROBLEM_ID, PROBLEM_TEXT)
 
 # ----------------------------
 # SESSION STATE
 # ----------------------------
-def init_state():
-    defaults = {
-        "method_started": False,
-        # Study substep 1 (timer)
-        "s_timer_started": False,
-        "s_timer_start_time": None,
-        "s_timer_done": False,
-        # Study substep 2 (vocab)
-        "s_vocab_ack": {t: False for t in TERMS_IN_PROBLEM},  # “I understand” ticks
-        # Study substep 3 (identifier)
-        "givens_text": "",
-        "target_text": "",
-        "s_identifier_pass": False,
-        # Overall S completion & unlock for T
-        "S_done": False,
-        "unlock_T": False,
-    }
-    for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
-
-init_state()
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
 STUDY_SECONDS = 3 * 60  # 3 minutes
 
 def seconds_left():
-    if not st.session_state.s_timer_started or st.session_state.s_timer_start_time is None:
+    if not S.s_timer_started or S.s_timer_start_time is None:
         return STUDY_SECONDS
-    return max(0, STUDY_SECONDS - int(time.time() - st.session_state.s_timer_start_time))
+    return max(0, STUDY_SECONDS - int(time.time() - S.s_timer_start_time))
 
 # ----------------------------
 # Start/Reset Controls
 # ----------------------------
 c_start, c_reset = st.columns([1, 1])
 with c_start:
-    if not st.session_state.method_started:
+    if not S.method_started:
         if st.button("▶️ Start STATICS Method"):
-            st.session_state.method_started = True
+            S.method_started = True
             # Gate to S substep 1 (timer)
-            st.session_state.s_timer_started = True
-            st.session_state.s_timer_start_time = time.time()
-            st.rerun()
+            S.s_timer_started = True
+            S.s_timer_start_time = time.time()
+            render.rerun()
 with c_reset:
     if st.button("🔄 Reset All"):
-        for k in list(st.session_state.keys()):
-            del st.session_state[k]
-        init_state()
-        st.rerun()
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
 
-if not st.session_state.method_started:
+if not S.method_started:
     st.info("Click **Start STATICS Method** to begin Step S — Study.")
-    st.stop()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Substep 1): Focus timer (only this visible)
 # ======================================================
+render.step(1)
 st.subheader("S — Study (1/3): 3-minute quiet focus")
-if not st.session_state.s_timer_done:
+if not S.s_timer_done:
     left = seconds_left()
-    if st.session_state.s_timer_started:
+    if S.s_timer_started:
         pct = (STUDY_SECONDS - left) / STUDY_SECONDS
         st.progress(min(max(pct, 0.0), 1.0))
         mmss = str(timedelta(seconds=left))[2:7] if left >= 60 else f"00:{left:02d}"
@@ -127,23 +93,22 @@ if not st.session_state.s_timer_done:
         c1, c2 = st.columns([1, 1])
         with c1:
             if st.button("⏭️ I'm done early"):
-                st.session_state.s_timer_done = True
-                st.rerun()
+                S.s_timer_done = True
+                render.rerun()
         with c2:
             if st.button("⏸️ Pause"):
-                st.session_state.s_timer_started = False
-                st.rerun()
+                S.s_timer_started = False
+                render.rerun()
 
-        if left > 0 and st.session_state.s_timer_started:
-            time.sleep(1)
-            st.rerun()
+        if left > 0 and S.s_timer_started:
+            render.tick()
         else:
             # time up
-            st.session_state.s_timer_done = True
-            st.rerun()
+            S.s_timer_done = True
+            render.rerun()
     else:
         st.warning("Timer paused. Click **Start STATICS Method** again to resume.")
-    st.stop()  # do not reveal later substeps yet
+    render.stop()  # do not reveal later substeps yet
 
 st.success("✅ Focus timer complete.")
 
@@ -164,20 +129,20 @@ else:
                 st.write(KEY_DEFS[term])
 
             # student acknowledgement
-            st.session_state.s_vocab_ack[term] = st.checkbox(
+            S.s_vocab_ack[term] = st.checkbox(
                 f"I understand **{term}**",
-                value=st.session_state.s_vocab_ack.get(term, False),
+                value=S.s_vocab_ack.get(term, False),
                 key=f"ack_{term}"
             )
 
 # Require core vocab acknowledged
-core_ok = all(st.session_state.s_vocab_ack.get(t, False) for t in CORE_TERMS if t in st.session_state.s_vocab_ack)
+core_ok = all(S.s_vocab_ack.get(t, False) for t in CORE_TERMS if t in S.s_vocab_ack)
 
 # Only allow proceeding if core terms acknowledged
 if not core_ok:
-    missing = [t for t in CORE_TERMS if not st.session_state.s_vocab_ack.get(t, False)]
+    missing = [t for t in CORE_TERMS if not S.s_vocab_ack.get(t, False)]
     st.warning(f"Please acknowledge the core terms: {', '.join(missing)}")
-    st.stop()
+    render.stop()
 
 st.success("✅ Core vocabulary acknowledged.")
 
@@ -212,48 +177,34 @@ TARGET_ITEMS = [
 ]
 
 # --- Session state for selections ---
-if "s_given_sel" not in st.session_state:
-    st.session_state.s_given_sel = set()
-if "s_target_sel" not in st.session_state:
-    st.session_state.s_target_sel = set()
 
 # --- Render checklists ---
 st.markdown("#### Givens — select all statements that are provided in the problem")
 cols_g = st.columns(2)
 for i, (label, _) in enumerate(GIVEN_ITEMS):
     with cols_g[i % 2]:
-        checked = st.checkbox(label, value=(label in st.session_state.s_given_sel), key=f"given_{i}")
+        checked = st.checkbox(label, value=(label in S.s_given_sel), key=f"given_{i}")
         if checked:
-            st.session_state.s_given_sel.add(label)
+            S.s_given_sel.add(label)
         else:
-            st.session_state.s_given_sel.discard(label)
+            S.s_given_sel.discard(label)
 
 st.markdown("#### Target — select what we are asked to determine")
 cols_t = st.columns(2)
 for j, (label, _) in enumerate(TARGET_ITEMS):
     with cols_t[j % 2]:
-        checked = st.checkbox(label, value=(label in st.session_state.s_target_sel), key=f"target_{j}")
+        checked = st.checkbox(label, value=(label in S.s_target_sel), key=f"target_{j}")
         if checked:
-            st.session_state.s_target_sel.add(label)
+            S.s_target_sel.add(label)
         else:
-            st.session_state.s_target_sel.discard(label)
-
-# --- Grade selections (no model answers shown beforehand) ---
-def grade_mcq(selected_labels: set, items: list[tuple[str, bool]]):
-    """Returns (all_correct: bool, num_correct_picked: int, num_false_picked: int, total_true: int)."""
-    truth = {label: is_true for label, is_true in items}
-    num_true_total = sum(truth.values())
-    num_correct_picked = sum(1 for lab in selected_labels if truth.get(lab, False))
-    num_false_picked = sum(1 for lab in selected_labels if truth.get(lab, False) is False)
-    # all-correct means: picked every true item and picked no false items
-    all_correct = (num_correct_picked == num_true_total) and (num_false_picked == 0)
-    return all_correct, num_correct_picked, num_false_picked, num_true_total
+            S.s_target_sel.discard(label)
 
+# --- Grade selections (no model answers shown beforehand; see statics_core.grade_mcq) ---
 c_chk, c_clear = st.columns([1, 1])
 with c_chk:
     if st.button("✅ Check"):
-        g_ok, g_hit, g_fp, g_total = grade_mcq(st.session_state.s_given_sel, GIVEN_ITEMS)
-        t_ok, t_hit, t_fp, t_total = grade_mcq(st.session_state.s_target_sel, TARGET_ITEMS)
+        g_ok, g_hit, g_fp, g_total = grade_mcq(S.s_given_sel, GIVEN_ITEMS)
+        t_ok, t_hit, t_fp, t_total = grade_mcq(S.s_target_sel, TARGET_ITEMS)
 
         # Feedback without revealing which specific ones were missed
         st.markdown("**Givens:**")
@@ -268,63 +219,33 @@ with c_chk:
         else:
             st.warning(f"Not quite. You selected {t_hit}/{t_total} correct and {t_fp} incorrect. Adjust your choices and try again.")
 
-        st.session_state.s_identifier_pass = bool(g_ok and t_ok)
-        if st.session_state.s_identifier_pass:
-            st.session_state.S_done = True
-            st.session_state.unlock_T = True
+        S.s_identifier_pass = record_attempt(PROBLEM_ID, 1, "✅ Check", g_ok and t_ok)
+        if S.s_identifier_pass:
+            S.S_done = True
+            S.unlock_T = True
             st.success("🎉 Step S (Study) complete. The **Translate (T)** section is now unlocked.")
-            st.rerun()
+            render.rerun()
         else:
             st.info("Make corrections and re-check.")
 
 with c_clear:
     if st.button("🗑️ Clear selections"):
-        st.session_state.s_given_sel = set()
-        st.session_state.s_target_sel = set()
-        st.session_state.s_identifier_pass = False
-        st.rerun()
-
-
-# Try to import drawable canvas (assuming this is done at the top of your actual script)
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    # Handle the case where the user hasn't installed the library
-    _canvas_ok = False
-except Exception:
-    _canvas_ok = False
+        S.s_given_sel = set()
+        S.s_target_sel = set()
+        S.s_identifier_pass = False
+        render.rerun()
 
 
 # ===============================
 # T — TRANSLATE: Diagram / FBD
 # ===============================
 
-# --- Define angle diff helper ---
-def ang_diff(a, b):
-    d = (a - b + 180) % 360 - 180
-    return abs(d)
-
-# --- Define line extraction helper ---
-def extract_lines(canvas_json):
-    objs = (canvas_json or {}).get("objects", [])
-    lines = []
-    for obj in objs:
-        if obj.get("type") == "line":
-            x1, y1 = obj["x1"], obj["y1"]
-            x2, y2 = obj["x2"], obj["y2"]
-            dx, dy_canvas = x2 - x1, y2 - y1
-            ang = math.degrees(math.atan2(-dy_canvas, dx))  
-            if ang <= -180: ang += 360
-            if ang > 180: ang -= 360
-            L = math.hypot(dx, dy_canvas)
-            lines.append({"p1": (x1, y1), "p2": (x2, y2),
-                          "angle": ang, "length": L})
-    return lines
+# ang_diff / extract_lines live in statics_core.geometry
 
 
 # --- Main Section ---
-if st.session_state.get("unlock_T", False):
+if S.unlock_T:
+    render.step(2)
     st.header("T — Translate: Draw a Force Triangle")
 
     # Given forces
@@ -333,13 +254,7 @@ if st.session_state.get("unlock_T", False):
     F2 = 250.0
     th2 = 135.0
 
-    th1r = math.radians(th1)
-    th2r = math.radians(th2)
-    F1x, F1y = F1*math.cos(th1r), F1*math.sin(th1r)
-    F2x, F2y = F2*math.cos(th2r), F2*math.sin(th2r)
-    Sx, Sy = F1x + F2x, F1y + F2y
-    F3x, F3y = -Sx, -Sy
-    th3 = math.degrees(math.atan2(F3y, F3x))
+    th3 = solve_force_triangle(F1, th1, F2, th2)["th3"]
 
     st.markdown(
         "Please **draw your Force Triangle** on the canvas below. "
@@ -354,7 +269,8 @@ if st.session_state.get("unlock_T", False):
     uploaded = None
 
     # --- Drawing canvas only ---
-    if not _canvas_ok:
+    st_canvas = load_canvas()  # imported on first use
+    if st_canvas is None:
         st.warning("Install drawing tool: `pip install streamlit-drawable-canvas`")
     else:
         st.caption("Draw **lines** for F1, F2, and F3.")
@@ -374,8 +290,10 @@ if st.session_state.get("unlock_T", False):
             height=height,
             width=700,
             drawing_mode="line",
-            key="translate_canvas"
+            key="translate_canvas",
+            initial_drawing=initial_strokes("translate_canvas")
         )
+        remember_strokes("translate_canvas", canvas.json_data)
 
     # Labeling
     lines = extract_lines(canvas.json_data)
@@ -460,19 +378,16 @@ if st.session_state.get("unlock_T", False):
             else:
                 ok_ratio = True
 
-            if ok_ang1 and ok_ang2 and ok_ang3 and ok_ratio:
+            if record_attempt(PROBLEM_ID, 2, "✅ Check my diagram", ok_ang1 and ok_ang2 and ok_ang3 and ok_ratio):
                 st.success("Diagram looks correct — proceeding!")
                 passed = True
             else:
                 st.warning("Some items need correction.")
 
     # Gate next section
-    if "T_done" not in st.session_state:
-        st.session_state["T_done"] = False
-
     if passed:
-        st.session_state["T_done"] = True
-        st.session_state["unlock_A"] = True
+        S.T_done = True
+        S.unlock_A = True
         st.success("🎉 **Translate (T)** complete! Next step unlocked.")
     else:
         st.info("Finish this step to continue.")
@@ -482,7 +397,8 @@ if st.session_state.get("unlock_T", False):
 # ===============================
 # A — ASSIGN: Axes & Assumed Directions
 # ===============================
-if st.session_state.get("unlock_A", False):
+if S.unlock_A:
+    render.step(3)
     st.header("A — Assign: Define your axes & assume directions")
 
     # Given forces from previous section
@@ -492,13 +408,7 @@ if st.session_state.get("unlock_A", False):
     th2 = 135.0
 
     # Compute expected F3 direction
-    th1r = math.radians(th1)
-    th2r = math.radians(th2)
-    F1x, F1y = F1 * math.cos(th1r), F1 * math.sin(th1r)
-    F2x, F2y = F2 * math.cos(th2r), F2 * math.sin(th2r)
-    Sx, Sy = F1x + F2x, F1y + F2y
-    F3x, F3y = -Sx, -Sy
-    th3 = math.degrees(math.atan2(F3y, F3x))
+    th3 = solve_force_triangle(F1, th1, F2, th2)["th3"]
 
     st.markdown(
         "In this step, you will **set up your coordinate system** and "
@@ -526,9 +436,9 @@ if st.session_state.get("unlock_A", False):
         )
 
     # Compute angles relative to chosen axes
-    th1_rel = (th1 - beta + 360) % 360
-    th2_rel = (th2 - beta + 360) % 360
-    th3_rel = (th3 - beta + 360) % 360
+    th1_rel = angle_rel_axes(th1, beta)
+    th2_rel = angle_rel_axes(th2, beta)
+    th3_rel = angle_rel_axes(th3, beta)
 
     colA1, colA2, colA3 = st.columns(3)
     with colA1:
@@ -575,32 +485,29 @@ if st.session_state.get("unlock_A", False):
     F3y_assume = st.session_state.get("F3y_assumption", True)
 
     if save_btn or finish_btn:
-        st.session_state["A_done"] = True
+        S.A_done = True
         # Save safe copies under new names (to avoid widget conflicts)
-        st.session_state["A_axis_mode_saved"] = axis_mode_val
-        st.session_state["A_beta_saved"] = beta_val
-        st.session_state["A_F3x_assume_saved"] = F3x_assume
-        st.session_state["A_F3y_assume_saved"] = F3y_assume
+        S.A_axis_mode_saved = axis_mode_val
+        S.A_beta_saved = beta_val
+        S.A_F3x_assume_saved = F3x_assume
+        S.A_F3y_assume_saved = F3y_assume
 
         # Unlock next section (example)
-        st.session_state["unlock_C"] = True  # You can rename for next phase
+        S.unlock_C = True  # You can rename for next phase
         st.success("🎉 Step A (Assign) complete — your coordinate system and sign assumptions are saved!")
 
-    if not st.session_state.get("A_done"):
+    if not S.A_done:
         st.info("Set your axes and sign assumptions, then click **Finish A** to continue.")
 
 
 # ===============================
 # T — Translate forces to components (optional for force triangle)
 # ===============================
-if st.session_state.get("unlock_C", False):  # <-- this should be set when A (Assign) is finished
+if S.unlock_C:  # <-- this should be set when A (Assign) is finished
+    render.step(4)
     st.header("T — Translate forces to components")
 
     # ---- Robust gates for this section ----
-    if "T_components_done" not in st.session_state:
-        st.session_state["T_components_done"] = False
-    if "unlock_I" not in st.session_state:
-        st.session_state["unlock_I"] = False
 
     st.info(
         "For **this force-triangle** problem, you can solve with pure geometry (head-to-tail). "
@@ -611,25 +518,21 @@ if st.session_state.get("unlock_C", False):  # <-- this should be set when A (As
     # ----------- Givens / from previous steps -----------
     F1, th1 = 400.0, 30.0     # deg CCW from +x
     F2, th2 = 250.0, 135.0
-    beta = st.session_state.get("A_beta_saved", 0.0)  # axis rotation (deg CCW)
+    beta = S.A_beta_saved  # axis rotation (deg CCW)
     # Angles relative to chosen axes (rotate axes by +β -> subtract β)
-    th1_rel = (th1 - beta + 360.0) % 360.0
-    th2_rel = (th2 - beta + 360.0) % 360.0
+    th1_rel = angle_rel_axes(th1, beta)
+    th2_rel = angle_rel_axes(th2, beta)
 
     # Helpers
-    def comp(F, theta_deg):
-        t = math.radians(theta_deg)
-        return F*math.cos(t), F*math.sin(t)  # (Fx, Fy)
-
     def fmt(x): 
         return f"{x:.2f}"
 
     # ---------- Path A: Skip components (always available) ----------
     st.success("You may **skip components** for this triangle problem and continue.")
     if st.button("➡️ Continue without components", key="T2_btn_continue_without_components"):
-        st.session_state["T_components_done"] = True
-        st.session_state["unlock_I"] = True      # ← unlock I ONLY here
-        st.rerun()
+        S.T_components_done = True
+        S.unlock_I = True      # ← unlock I ONLY here
+        render.rerun()
 
     st.divider()
 
@@ -638,8 +541,9 @@ if st.session_state.get("unlock_C", False):  # <-- this should be set when A (As
         st.caption(f"Enter components relative to your chosen axes (β = {beta:.1f}° CCW).")
 
         # Truth for checking
-        F1x_true, F1y_true = comp(F1, th1_rel)
-        F2x_true, F2y_true = comp(F2, th2_rel)
+        comps = solve_ring_components(F1, th1, F2, th2, beta)
+        F1x_true, F1y_true = comps["F1x"], comps["F1y"]
+        F2x_true, F2y_true = comps["F2x"], comps["F2y"]
 
         coltol = st.columns(1)
         with coltol[0]:
@@ -658,9 +562,6 @@ if st.session_state.get("unlock_C", False):  # <-- this should be set when A (As
             F2x_user = st.number_input("F₂ₓ (N)", value=0.0, step=1.0, key="T2_input_F2x")
             F2y_user = st.number_input("F₂ᵧ (N)", value=0.0, step=1.0, key="T2_input_F2y")
 
-        def within(a, b, tol): 
-            return abs(a - b) <= tol
-
         if st.button("✅ Check my components", key="T2_btn_check_components"):
             ok1x = within(F1x_user, F1x_true, abs_tol)
             ok1y = within(F1y_user, F1y_true, abs_tol)
@@ -674,26 +575,27 @@ if st.session_state.get("unlock_C", False):  # <-- this should be set when A (As
             st.write(f"F₂ᵧ: entered {fmt(F2y_user)} → {'✅' if ok2y else '❌'} (Expected: {fmt(F2y_true)})")
 
             all_ok = ok1x and ok1y and ok2x and ok2y
-            if all_ok:
+            if record_attempt(PROBLEM_ID, 4, "✅ Check my components", all_ok):
                 st.success("Great—your components match the expected values.")
-                st.session_state["T_components_done"] = True
-                st.session_state["unlock_I"] = True   # ← unlock I ONLY here
-                st.rerun()
+                S.T_components_done = True
+                S.unlock_I = True   # ← unlock I ONLY here
+                render.rerun()
             else:
                 st.warning("Some components differ from the expected values. Adjust and check again.")
 
     # IMPORTANT FIX: Prevent later sections (like I) from rendering
     # unless T_components_done has been set by either the skip button or the check button.
-    if not st.session_state.get("T_components_done"):
-        st.stop() 
+    if not S.T_components_done:
+        render.stop() 
 
-# I — IMPLEMENT section will now run if st.session_state.get("unlock_I", False) is True
+# I — IMPLEMENT section will now run if S.unlock_I is True
 
 
 # ===============================
 # I — IMPLEMENT: Write equilibrium equations (placeholder)
 # ===============================
-if st.session_state.get("unlock_I", False):
+if S.unlock_I:
+    render.step(5)
     st.header("I — Implement: Write the equilibrium equations")
 
     st.info(
@@ -717,30 +619,46 @@ if st.session_state.get("unlock_I", False):
     # --- Skip option for triangle problems ---
     if mode_I.startswith("Skip"):
         if st.button("➡️ Continue (skip I for this triangle)", key="I_btn_skip_continue"):
-            st.session_state["I_done"] = True
-            st.session_state["unlock_C_next"] = True   # gate your next phase
+            S.I_done = True
+            S.unlock_C_next = True   # gate your next phase
             st.success("I — Implement skipped for triangle case. Next step unlocked.")
-            st.rerun()
+            render.rerun()
         # **REMOVED st.stop() HERE**
     # --- Practice mode (no numeric answers revealed) ---
     elif mode_I.startswith("Practice"):
         st.subheader("Practice: Record your equilibrium equations")
 
-        beta_saved = st.session_state.get("A_beta_saved", 0.0)
-        st.caption(f"Write equations **relative to your chosen axes** (β = {beta_saved:.1f}° CCW).")
+        beta_saved = S.A_beta_saved
+        st.caption(f"Write equations **relative to your chosen axes** (β = {beta_saved:.1f}° CCW). "
+                   "Use F1, F2, θ1 and θ2 (measured from your x-axis) for the givens and F3x, F3y for the unknown.")
+
+        # The givens, and the sums each box should hold, on the student's axes
+        F1, th1 = 400.0, 30.0
+        F2, th2 = 250.0, 135.0
+        comps = solve_ring_components(F1, th1, F2, th2, beta_saved)
+        ring_solution = {"F3x": -(comps["F1x"] + comps["F2x"]), "F3y": -(comps["F1y"] + comps["F2y"])}
+        ring_knowns = {"F1": F1, "F2": F2,
+                       "theta1": angle_rel_axes(th1, beta_saved), "theta2": angle_rel_axes(th2, beta_saved)}
+        b = math.radians(beta_saved)
+        ring_lines = (("F3x", (0.0, 0.0), (math.cos(b), math.sin(b))),
+                      ("F3y", (0.0, 0.0), (-math.sin(b), math.cos(b))))
+        ring_loads = (((0.0, 0.0), components(F1, th1)), ((0.0, 0.0), components(F2, th2)))
+        ring_sums = [Sum(kind, ring_lines, ring_loads, beta_saved) for kind in ("Fx", "Fy", "M")]
 
         col_eq = st.columns(2)
         with col_eq[0]:
-            fx_text = st.text_area("ΣFx = 0", height=90, key="I_text_fx",
-                                   placeholder="Example: F1 cosθ1 + F2 cosθ2 + F3x = 0")
+            fx_eq = equation_input("ΣFx = 0", "I_text_fx", ("F3x", "F3y"), ring_solution, ring_knowns,
+                                   placeholder="Example: F1 cos(θ1) + F2 cos(θ2) + F3x = 0", expect=ring_sums[0])
         with col_eq[1]:
-            fy_text = st.text_area("ΣFy = 0", height=90, key="I_text_fy",
-                                   placeholder="Example: F1 sinθ1 + F2 sinθ2 + F3y = 0")
+            fy_eq = equation_input("ΣFy = 0", "I_text_fy", ("F3x", "F3y"), ring_solution, ring_knowns,
+                                   placeholder="Example: F1 sin(θ1) + F2 sin(θ2) + F3y = 0", expect=ring_sums[1])
 
         use_moments = st.checkbox("Include a moment equation (ΣM = 0)?", value=False, key="I_chk_use_moments")
         if use_moments:
-            M_text = st.text_area("ΣM = 0", height=80, key="I_text_M",
-                                  placeholder="Example: ∑(r×F) = 0 about point O")
+            st.caption("All three forces act at O, so every moment about O is zero. "
+                       "Pick another point, e.g. 1 m along your y-axis.")
+            equation_input("ΣM = 0", "I_text_M", ("F3x", "F3y"), ring_solution, ring_knowns,
+                           placeholder="Example: -F1 cos(θ1)(1) - F2 cos(θ2)(1) - F3x(1) = 0", expect=ring_sums[2])
 
         st.markdown("#### Self-check before continuing")
         c1, c2, c3 = st.columns(3)
@@ -749,68 +667,52 @@ if st.session_state.get("unlock_I", False):
         with c3: chk_unknowns = st.checkbox("Unknowns are identifiable", key="I_chk_unknowns_id")
 
         if st.button("✅ Mark as complete", key="I_btn_mark_complete"):
-            if (fx_text.strip() == "") or (fy_text.strip() == ""):
+            if fx_eq is None or fy_eq is None:
                 st.warning("Please enter both ΣFx and ΣFy (or choose Skip above).")
+            elif not all(eq.holds(ring_solution) and want.matches(eq)
+                         for eq, want in zip((fx_eq, fy_eq), ring_sums)):
+                st.warning("Fix the equations marked ✗ first (or choose Skip above).")
             elif not (chk_signs and chk_forces and chk_unknowns):
                 st.info("Check all three boxes to proceed.")
             else:
-                st.session_state["I_done"] = True
-                st.session_state["unlock_C_next"] = True
+                S.I_done = True
+                S.unlock_C_next = True
                 st.success("🎉 Implement step completed. Next step unlocked.")
-                st.rerun()
+                render.rerun()
     
     # We only stop if the section is not yet completed, otherwise we fall through to C.
-    if not st.session_state.get("I_done", False):
-        st.stop()
+    if not S.I_done:
+        render.stop()
 
 
 # ===============================
 # C — COMPUTE / CONCLUDE
 # Start only after I is complete
 # ===============================
-if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next", False):
+if S.I_done or S.unlock_C_next:
+    render.step(6)
     st.header("C — Compute / Conclude")
 
     # --- givens (same as earlier) ---
     F1, th1 = 400.0, 30.0      # deg CCW from +x
     F2, th2 = 250.0, 135.0
-    beta = st.session_state.get("A_beta_saved", 0.0)  # axis rotation (deg CCW, if you used it earlier)
+    beta = S.A_beta_saved  # axis rotation (deg CCW, if you used it earlier)
 
     # ---------- helpers ----------
-    def included_angle_deg(a, b):
-        """Smallest included angle between directions a and b (deg)."""
-        d = (a - b + 180) % 360 - 180
-        return abs(d)
-
-    def law_of_cosines(Fa, Fb, gamma_deg):
-        g = math.radians(gamma_deg)
-        return math.sqrt(Fa**2 + Fb**2 - 2*Fa*Fb*math.cos(g))
-
-    def clamp01(x):  # for safe arcsin
-        return max(-1.0, min(1.0, x))
-
     def fmt(x): return f"{x:.3f}"
 
     # expected geometry (used internally, but not revealed when wrong)
+    ring = solve_force_triangle(F1, th1, F2, th2)
     d_tail = included_angle_deg(th1, th2)        # tail-to-tail angle between F1 and F2
-    gamma_expected = 180.0 - d_tail              # interior angle in the force triangle
+    gamma_expected = ring["gamma"]               # interior angle in the force triangle
 
     # expected F3 from components (for reference / checks)
-    th1r = math.radians(th1); th2r = math.radians(th2)
-    F1x, F1y = F1*math.cos(th1r), F1*math.sin(th1r)
-    F2x, F2y = F2*math.cos(th2r), F2*math.sin(th2r)
-    Sx, Sy   = F1x + F2x, F1y + F2y
-    F3x, F3y = -Sx, -Sy
-    F3_true  = math.hypot(F3x, F3y)
-    th3_true = math.degrees(math.atan2(F3y, F3x))  # this is in [-180, 180]
+    F3_true  = ring["F3"]
+    th3_true = ring["th3"]  # this is in [-180, 180]
 
     # ---------- init C-state ----------
-    if "C_gamma_ok" not in st.session_state: st.session_state["C_gamma_ok"] = False
-    if "C_F3_ok"    not in st.session_state: st.session_state["C_F3_ok"]    = False
-    if "C_dir_ok"   not in st.session_state: st.session_state["C_dir_ok"]   = False
-    if "C_done"     not in st.session_state: st.session_state["C_done"]     = False
-    if "C_gamma_val" not in st.session_state: st.session_state["C_gamma_val"] = gamma_expected
-    if "C_F3_val"    not in st.session_state: st.session_state["C_F3_val"]    = F3_true
+    if S.C_gamma_val is None: S.C_gamma_val = gamma_expected
+    if S.C_F3_val is None:    S.C_F3_val    = F3_true
 
     # ============================
     # C1 — Find included angle γ
@@ -841,10 +743,10 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
 
     if st.button("Check γ", key="C_btn_check_gamma"):
         diff = abs(gamma_guess - gamma_expected)
-        if diff <= tol_g:
+        if record_attempt(PROBLEM_ID, 6, "Check γ", diff <= tol_g):
             st.success("✅ Your γ looks reasonable for the interior angle between F₁ and F₂ in the triangle.")
-            st.session_state["C_gamma_ok"] = True
-            st.session_state["C_gamma_val"] = gamma_guess
+            S.C_gamma_ok = True
+            S.C_gamma_val = gamma_guess
         else:
             st.warning(
                 "γ doesn’t look quite right.  \n"
@@ -854,10 +756,10 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
             )
 
     # gate: must get γ right before moving on
-    if not st.session_state["C_gamma_ok"]:
-        st.stop()
+    if not S.C_gamma_ok:
+        render.stop()
 
-    gamma_used = st.session_state["C_gamma_val"]
+    gamma_used = S.C_gamma_val
 
     # ============================
     # C2 — Law of Cosines for |F₃|
@@ -890,10 +792,10 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
     F3_lawcos = law_of_cosines(F1, F2, gamma_used)
 
     if st.button("Check |F₃|", key="C_btn_check_F3"):
-        if abs(F3_user - F3_lawcos) <= tol_F3:
+        if record_attempt(PROBLEM_ID, 6, "Check |F₃|", abs(F3_user - F3_lawcos) <= tol_F3):
             st.success("✅ Your |F₃| is consistent with the Law of Cosines for this triangle.")
-            st.session_state["C_F3_ok"] = True
-            st.session_state["C_F3_val"] = F3_user
+            S.C_F3_ok = True
+            S.C_F3_val = F3_user
         else:
             st.warning(
                 "|F₃| doesn’t look consistent with your γ and the side lengths.  \n"
@@ -904,10 +806,10 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
             )
 
     # gate: must get |F3| right
-    if not st.session_state["C_F3_ok"]:
-        st.stop()
+    if not S.C_F3_ok:
+        render.stop()
 
-    F3_for_sines = st.session_state["C_F3_val"]
+    F3_for_sines = S.C_F3_val
 
     # ============================
     # C3 — Law of Sines for θ₃
@@ -923,7 +825,7 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
         st.markdown("[Law of Sines (YouTube)](https://www.youtube.com/watch?v=9fS0uA4iLxI)")
 
     # interior angle between line1 and line3 by Law of Sines (internal help, not a 'given answer')
-    s = clamp01((F1 * math.sin(math.radians(gamma_used))) / max(F3_for_sines, 1e-9))
+    s = clamp_unit((F1 * math.sin(math.radians(gamma_used))) / max(F3_for_sines, 1e-9))
     alpha_13 = math.degrees(math.asin(s))  # interior angle between F1 and F3 inside the triangle
 
     st.caption(
@@ -953,11 +855,11 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
     if st.button("Check θ₃", key="C_btn_check_th3"):
         theta3_norm = theta3_guess % 360.0
         th3_norm    = th3_true % 360.0
-        diff = (theta3_norm - th3_norm + 180.0) % 360.0 - 180.0  # signed smallest diff
+        diff = signed_ang_diff(theta3_norm, th3_norm)  # signed smallest diff
 
-        if abs(diff) <= tol_th3:
+        if record_attempt(PROBLEM_ID, 6, "Check θ₃", abs(diff) <= tol_th3):
             st.success("✅ Your θ₃ is consistent with the expected direction of F₃ for equilibrium.")
-            st.session_state["C_dir_ok"] = True
+            S.C_dir_ok = True
         else:
             st.warning(
                 "θ₃ doesn’t look quite right.  \n"
@@ -967,17 +869,18 @@ if st.session_state.get("I_done", False) or st.session_state.get("unlock_C_next"
                 "- Make sure you measured θ₃ **counterclockwise from the +x-axis** and wrapped it into 0°–360°."
             )
 
-    if st.session_state["C_gamma_ok"] and st.session_state["C_F3_ok"] and st.session_state["C_dir_ok"]:
+    if S.C_gamma_ok and S.C_F3_ok and S.C_dir_ok:
         st.success("🎉 C — Compute/Conclude complete.")
-        st.session_state["C_done"] = True
-        st.session_state["unlock_next_stage"] = True
+        S.C_done = True
+        S.unlock_next_stage = True
 
 
 # ===============================
 # S — SANITY CHECK (no components shown)
 # Start only after C is complete
 # ===============================
-if st.session_state.get("C_done", False):
+if S.C_done:
+    render.step(7)
     st.header("S — Sanity check")
 
     st.markdown(
@@ -991,7 +894,7 @@ if st.session_state.get("C_done", False):
     F2, th2 = 250.0, 135.0     # N, deg CCW from +x
 
     # --- student's F3 result from C ---
-    F3_mag_student = st.session_state.get("C_F3_val", 0.0)
+    F3_mag_student = S.C_F3_val
     theta3_student = st.session_state.get("C_theta3_guess", 0.0)  # deg
     theta3_student_norm = theta3_student % 360.0
 
@@ -1007,19 +910,9 @@ if st.session_state.get("C_done", False):
     )
 
     # --- internal reference for sanity (not shown explicitly) ---
-    th1r = math.radians(th1)
-    th2r = math.radians(th2)
-    F1x, F1y = F1 * math.cos(th1r), F1 * math.sin(th1r)
-    F2x, F2y = F2 * math.cos(th2r), F2 * math.sin(th2r)
-    Sx, Sy   = F1x + F2x, F1y + F2y
-    F3x_true = -Sx
-    F3y_true = -Sy
-    F3_true  = math.hypot(F3x_true, F3y_true)
-    th3_true = math.degrees(math.atan2(F3y_true, F3x_true)) % 360.0  # 0–360, used only for hidden checks
-
-    # Helper: smallest signed angle difference between a and b (deg)
-    def small_angle_diff(a, b):
-        return (a - b + 180.0) % 360.0 - 180.0
+    ring = solve_force_triangle(F1, th1, F2, th2)
+    F3_true  = ring["F3"]
+    th3_true = ring["th3"] % 360.0  # 0–360, used only for hidden checks
 
     # ============================
     # 2️⃣ Direction sanity check
@@ -1033,12 +926,12 @@ if st.session_state.get("C_done", False):
     )
 
     if st.button("Check the direction of my F₃", key="S_btn_check_direction"):
-        diff_dir = abs(small_angle_diff(theta3_student_norm, th3_true))
+        diff_dir = abs(signed_ang_diff(theta3_student_norm, th3_true))
 
         # Quadrant expectation: for this problem F3 should be down and left (3rd quadrant, 180–270°)
         in_down_left_quadrant = 180.0 < theta3_student_norm < 270.0
 
-        if in_down_left_quadrant and diff_dir <= dir_tol:
+        if record_attempt(PROBLEM_ID, 7, "Check the direction of my F₃", in_down_left_quadrant and diff_dir <= dir_tol):
             st.success(
                 "✅ Your F₃ points generally **down and to the left**, and its angle is consistent with "
                 "what we’d expect from the force triangle."
@@ -1134,12 +1027,71 @@ if st.session_state.get("C_done", False):
         )
 
     if st.button("✅ Mark sanity check as complete", key="S_btn_complete"):
-        if chk_quadrant and chk_triangle and chk_values:
+        if record_attempt(PROBLEM_ID, 7, "✅ Mark sanity check as complete", chk_quadrant and chk_triangle and chk_values):
             st.success("🎓 S — Sanity check complete. You’ve finished the full STATICS method on this problem.")
-            st.session_state["S_done"] = True
-            st.session_state["unlock_summary"] = True  # if you want a final summary step
+            S.S_done = True
+            S.unlock_summary = True  # if you want a final summary step
         else:
             st.info(
                 "Before marking this step complete, make sure you’ve checked the direction, triangle closure, "
                 "and that your numbers match your picture."
             )
+
+    if S.unlock_summary:
+        units_check(PROBLEM_ID)
+        what_if(PROBLEM_ID)
+
+# ======================================================
+# 3D MODE — the same ring held by three cables in space
+# ======================================================
+if S.unlock_summary:
+    st.divider()
+    st.header("🧊 3D mode: the ring in space")
+    st.markdown(
+        "Now F₁ and F₂ still act in the xy-plane, a **300 N** weight hangs from the ring at O = (0, 0, 0), "
+        "and instead of a single F₃ the ring is held by three cables to anchors "
+        "**A (−6, −3, 2) m**, **B (3, −6, 2) m** and **C (−2, −3, 6) m**. "
+        "Find the tension in each cable."
+    )
+    RING_3D = solve_ring_3d(W=300.0, anchors=RING_3D_ANCHORS)
+    F1x, F1y = components(400.0, 30.0)
+    F2x, F2y = components(250.0, 135.0)
+
+    with st.expander("Need a hint?"):
+        st.write("Each tension acts along its cable: write it as T times the unit vector from O to the anchor, "
+                 "u = r / |r|. Then ΣFx = 0, ΣFy = 0 and ΣFz = 0 give three equations in T_A, T_B, T_C.")
+        for name, anchor in zip("ABC", RING_3D_ANCHORS):
+            ux, uy, uz = RING_3D[f"u_{name}"]
+            st.write(f"- |r_O{name}| = {math.dist((0, 0, 0), anchor):g} m, "
+                     f"u_O{name} = ({ux:.3f}, {uy:.3f}, {uz:.3f})")
+
+    c1, c2, c3 = st.columns(3)
+    tA = c1.number_input("T_A (N)", min_value=0.0, format="%.1f", key="3d_TA")
+    tB = c2.number_input("T_B (N)", min_value=0.0, format="%.1f", key="3d_TB")
+    tC = c3.number_input("T_C (N)", min_value=0.0, format="%.1f", key="3d_TC")
+
+    if st.button("Check tensions", key="3d_check"):
+        oks = [within_pct(v, RING_3D[f"T_{n}"], 1.0) for v, n in zip((tA, tB, tC), "ABC")]
+        if record_attempt(PROBLEM_ID, 7, "Check tensions", all(oks)):
+            st.success(f"Correct! T_A = {RING_3D['T_A']:.1f} N, T_B = {RING_3D['T_B']:.1f} N, "
+                       f"T_C = {RING_3D['T_C']:.1f} N.")
+        else:
+            wrong = ", ".join(f"T_{n}" for ok, n in zip(oks, "ABC") if not ok)
+            st.error(f"Check {wrong}. Write each cable force as T u, add the known forces, "
+                     "and solve the three component equations together.")
+
+    if st.toggle("Show how the tensions change with the hanging weight", key="3d_sweep"):
+        # Every weight below shares the one cached cable solver for this geometry
+        weights = [10.0 * i for i in range(61)]
+        known = [(F1x + F2x, F1y + F2y, -w) for w in weights]
+        sweep = [(w, sol.tensions) for w, sol in
+                 zip(weights, solve_cables_batch((0.0, 0.0, 0.0), RING_3D_ANCHORS, known))]
+        # A cable can only pull: drop the weights that would need one to push
+        taut = [(w, t) for w, t in sweep if min(t) >= 0.0]
+        st.caption(f"For W lighter than about {taut[0][0]:g} N cable C would have to push, so it goes slack "
+                   "and the ring is no longer held by all three cables; the chart starts there.")
+        st.line_chart({"weight W (N)": [w for w, _ in taut],
+                       **{f"T_{n}": [t[i] for _, t in taut] for i, n in enumerate("ABC")}},
+                      x="weight W (N)")
+
+render.finish()
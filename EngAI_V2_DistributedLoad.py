@@ -2,14 +2,16 @@ import streamlit as st
 import time
 from datetime import timedelta
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import (
+    within, count_canvas_lines, solve_gate_hydrostatic, pressure_profile, specific_weight,
+    resolve_load, describe_load, get_matcher,
+    SupportModel, pin, roller, restrained_axes, check_moment_point,
+)
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_rendered, units_check, what_if, water_level_panel
 
 st.set_page_config(page_title="STATICS Method — Canal Gate", page_icon="🌊", layout="centered")
+PROBLEM_ID = "gate"
+render = RenderTimer(PROBLEM_ID)
 
 # ==========================================
 # 1. PROBLEM DEFINITION & DIAGRAM
@@ -34,65 +36,68 @@ PROBLEM_TEXT = (
     "3. Solve for the Horizontal Reaction Forces ($A_x$ and $B_x$) to determine which part of the frame needs the strongest bolts."
 )
 st.markdown(PROBLEM_TEXT)
+show_rendered("gate", caption="Gate AB under the hydrostatic load")
 st.divider()
 
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-def init_state():
-    defaults = {
-        "step_idx": 0,
-        "start_time": None,
-        "timer_finished": False,
-        "fr_correct": False,
-        "loc_correct": False,
-        "ax_correct": False,
-        "bx_correct": False
-    }
-    for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
-init_state()
 STUDY_DURATION = 180 
 
+# Reference answers: 3.0 m vertical gate, water flush with A. The 45 kN/m at
+# the sill is γ_w (3.0 m) b, which fixes the gate width b.
+GATE_HEIGHT = 3.0
+GATE_WIDTH = 45.0 / (specific_weight() * GATE_HEIGHT)
+GATE = solve_gate_hydrostatic(length=GATE_HEIGHT, upstream=GATE_HEIGHT, width=GATE_WIDTH)
+GATE_LOAD = pressure_profile(GATE_HEIGHT, upstream=GATE_HEIGHT, width=GATE_WIDTH)
+GATE_RESULTANT = resolve_load(GATE_LOAD)
+
+# Pin A at the top rail, roller B on the sill pushing horizontally (y up from B)
+GATE_MODEL = SupportModel([pin("A", (0.0, 3.0)), roller("B", (0.0, 0.0), normal=0.0)])
+GATE_PIVOTS = GATE_MODEL.moment_points(target="Bx")  # A first: removes Ax and Ay from ΣM
+AXES_LABEL = {("x",): "X only", ("y",): "Y only", ("x", "y"): "Both X and Y"}
+RESTRAINS = {s.name: AXES_LABEL[restrained_axes(s)] for s in GATE_MODEL.supports}
+
 # ----------------------------
 # 3. SIDEBAR RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
 # ----------------------------
 # STEP 0: START
 # ----------------------------
-if st.session_state.step_idx == 0:
+if S.step_idx == 0:
     if st.button("▶️ Begin S.T.A.T.I.C.S. Method"):
-        st.session_state.step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.step_idx >= 1:
+if S.step_idx >= 1:
+    render.step(1)
     st.header("S — Study the Problem")
     st.caption("Read carefully and extract the physical parameters.")
     
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining.")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
@@ -107,19 +112,20 @@ if st.session_state.step_idx >= 1:
         support_a = st.selectbox("Support A (Pin) restricts movement in:", ["Select...", "X only", "Y only", "Both X and Y"])
         support_b = st.selectbox("Support B (Roller on vertical wall) restricts movement in:", ["Select...", "X only", "Y only", "Both X and Y"])
 
-    if st.session_state.step_idx == 1 and st.session_state.timer_finished:
+    if S.step_idx == 1 and S.timer_finished:
         if st.button("Check Givens & Continue"):
-            if gate_h == 3.0 and max_load == 45.0 and support_a == "Both X and Y" and support_b == "X only":
+            if record_attempt(PROBLEM_ID, 1, "Check Givens & Continue", gate_h == 3.0 and max_load == 45.0 and support_a == RESTRAINS["A"] and support_b == RESTRAINS["B"]):
                 st.success("Correct! Understanding the specific restrictions of Pins vs Rollers is crucial.")
-                st.session_state.step_idx = 2
-                st.rerun()
+                S.step_idx = 2
+                render.rerun()
             else:
                 st.error("Review the problem text. Check your dimensions, load intensities, and what axes a roller on a vertical wall actually restricts.")
 
 # ======================================================
 # T — TRANSLATE TO DIAGRAM (Step 2: FBD)
 # ======================================================
-if st.session_state.step_idx >= 2:
+if S.step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate to a Diagram (FBD)")
 
@@ -132,25 +138,29 @@ if st.session_state.step_idx >= 2:
     st.info("Using the canvas toolbar (Line Tool), draw the simplified FBD of the gate.")
     st.caption("Draw the Gate as a vertical line. Draw the Equivalent Water Force as a horizontal arrow pushing on the gate. Finally, draw the reaction force vectors at supports A and B.")
     
-    if _canvas_ok:
+    st_canvas = load_canvas()  # imported on first use
+    if st_canvas is not None:
         canvas_fbd = st_canvas(
             stroke_width=3, stroke_color="#000", background_color="#fff",
-            height=300, width=500, drawing_mode="line", display_toolbar=True, key="canvas_fbd_gate"
+            height=300, width=500, drawing_mode="line", key="canvas_fbd_gate",
+            initial_drawing=initial_strokes("canvas_fbd_gate")
         )
+        remember_strokes("canvas_fbd_gate", canvas_fbd.json_data)
 
         if st.button("Check FBD"):
-            num_lines = len(canvas_fbd.json_data["objects"]) if canvas_fbd.json_data else 0
-            if 4 <= num_lines <= 8:
+            num_lines = count_canvas_lines(canvas_fbd.json_data)
+            if record_attempt(PROBLEM_ID, 2, "Check FBD", 4 <= num_lines <= 8):
                 st.success("FBD looks populated. Proceed to Assign.")
-                st.session_state.step_idx = 3
-                st.rerun()
+                S.step_idx = 3
+                render.rerun()
             else:
                 st.error(f"Detected {num_lines} lines. Think about the gate itself, the single water force arrow, and the reaction arrows at A and B.")
 
 # ======================================================
 # A — ASSIGN (Step 3: Coordinates & Assumptions)
 # ======================================================
-if st.session_state.step_idx >= 3:
+if S.step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Coordinates and Assumptions")
     
@@ -167,13 +177,14 @@ if st.session_state.step_idx >= 3:
     st.info("Assume the reaction forces at A and B push *against* the water to keep the gate in place (Leftward / Negative X direction). If your math yields a negative number later, it means your assumption was backward.")
     
     if st.button("Acknowledge Assumptions"):
-        st.session_state.step_idx = 4
-        st.rerun()
+        S.step_idx = 4
+        render.rerun()
 
 # ======================================================
 # T — TRANSLATE TO COMPONENTS (Step 4: Breakdown)
 # ======================================================
-if st.session_state.step_idx >= 4:
+if S.step_idx >= 4:
+    render.step(4)
     st.divider()
     st.header("T — Translate Forces to Components")
     st.caption("Verify the active directions for each force before writing equilibrium equations.")
@@ -187,17 +198,18 @@ if st.session_state.step_idx >= 4:
     q_roller_y = st.checkbox("The Roller at B has a Y-component.", value=False)
 
     if st.button("Verify Components"):
-        if q_water and q_pin_x and q_pin_y and q_roller_x and not q_roller_y:
+        if record_attempt(PROBLEM_ID, 4, "Verify Components", q_water and (q_pin_x, q_pin_y, q_roller_x, q_roller_y) == tuple(n in GATE_MODEL.unknowns for n in ("Ax", "Ay", "Bx", "By"))):
             st.success("Correct! Water and the Roller act purely horizontally. The Pin acts in both directions.")
-            st.session_state.step_idx = 5
-            st.rerun()
+            S.step_idx = 5
+            render.rerun()
         else:
             st.error("Review the support types. A roller on a vertical wall provides NO vertical friction or support.")
 
 # ======================================================
 # I — IMPLEMENT (Step 5: Equilibrium Strategy & Equations)
 # ======================================================
-if st.session_state.step_idx >= 5:
+if S.step_idx >= 5:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equilibrium Equations")
     st.caption("Map out your strategy and identify the equilibrium conditions needed.")
@@ -226,20 +238,22 @@ if st.session_state.step_idx >= 5:
     chk_m = st.checkbox("We must use **$\\sum M_A = 0$** (Sum of Moments) to mathematically isolate and solve for $B_x$.", key="I_chk_m")
     
     if st.button("Validate Logic & Equations"):
-        if "area" in mag_ans and "centroid" in loc_ans and pivot_ans == "Point A":
+        concepts = get_matcher(patterns={"area": r"area", "centroid": r"centroid"})
+        if record_attempt(PROBLEM_ID, 5, "Validate Logic & Equations", "area" in concepts.match_patterns(mag_ans) and "centroid" in concepts.match_patterns(loc_ans) and check_moment_point(GATE_PIVOTS, pivot_ans.split()[-1]).ok):
             if not (chk_fx and chk_m):
                 st.warning("Please acknowledge the core equilibrium equations needed ($\\sum F_x = 0$ and $\\sum M = 0$) to proceed.")
             else:
                 st.success("Excellent! Strategy is sound. You are ready to compute.")
-                st.session_state.step_idx = 6
-                st.rerun()
+                S.step_idx = 6
+                render.rerun()
         else:
             st.error("Review your strategy concepts above. What is the center of a shape called? Which support has the most unknown forces to eliminate?")
 
 # ======================================================
 # C — COMPUTE (Step 6: Guided Math)
 # ======================================================
-if st.session_state.step_idx >= 6:
+if S.step_idx >= 6:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
     st.caption("Solve algebraically for unknown magnitudes and locations.")
@@ -247,39 +261,51 @@ if st.session_state.step_idx >= 6:
     # --- Part 1: Resultant Force ---
     st.subheader("Part 1: Calculate the Resultant Force ($F_R$)")
     with st.expander("Need a hint?"):
-        st.write("Apply your strategy: Calculate the area of a triangle. What is the base intensity? What is the height?")
+        st.write("Apply your strategy: split the load diagram into simple shapes and add up their areas. What is each shape's height (intensity) and length?")
+        for line in describe_load(GATE_RESULTANT, detail="shape"):
+            st.write(f"- {line}")
         st.write("Youtube (Area of Triangle): https://www.youtube.com/watch?v=pvMuDPVOm7Y")
 
     fr_val = st.number_input("Resultant Force $F_R$ (kN):", min_value=0.0, format="%.1f")
     
     if st.button("Check F_R"):
-        if abs(fr_val - 67.5) < 0.5:
+        if record_attempt(PROBLEM_ID, 6, "Check F_R", within(fr_val, GATE["FR"], 0.5)):
             st.success("Correct! $F_R$ = 67.5 kN.")
-            st.session_state.fr_correct = True
+            S.fr_correct = True
         else:
-            st.error("Check your math. Did you remember the 1/2 in the triangle area formula?")
+            if any(p.kind == "triangle" for p in GATE_RESULTANT.pieces):
+                st.error("Check your math. Did you remember the 1/2 in the triangle area formula?")
+            else:
+                st.error("Check your math. Each rectangle's area is its length times its intensity.")
 
     # --- Part 2: Centroid Location ---
-    if st.session_state.get("fr_correct"):
+    if S.fr_correct:
         st.divider()
         st.subheader("Part 2: Calculate Force Location ($\\bar{y}$)")
         st.write("Enter the distance from **Point A (Top)** to the line of action.")
         
         with st.expander("Need a hint?"):
-            st.write("The centroid of a right triangle is located 1/3 of the distance from the heavy flat base. Since Point A is at the pointy tip, how far is it from the top?")
+            for line in describe_load(GATE_RESULTANT, detail="centroid"):
+                st.write(f"- {line}")
+            if len(GATE_RESULTANT.pieces) > 1:
+                st.write("Combine the pieces with $\\bar{y} = \\sum A_i \\bar{y}_i / \\sum A_i$.")
+            st.write("Distances here are measured down from Point A. How far is the line of action from the top?")
             st.write("Youtube (Centroid of Right Triangle): https://www.youtube.com/watch?v=BT5dbFATUnQ")
         
         loc_val = st.number_input("Distance from Point A (meters):", min_value=0.0, max_value=3.0, format="%.2f")
         
         if st.button("Check Location"):
-            if abs(loc_val - 2.0) < 0.1:
+            if record_attempt(PROBLEM_ID, 6, "Check Location", within(loc_val, GATE["y_bar"], 0.1)):
                 st.success("Correct! The force acts 2.0 m down from Point A.")
-                st.session_state.loc_correct = True
+                S.loc_correct = True
             else:
-                st.error("Calculate 2/3 of the total height of the gate.")
+                if len(GATE_RESULTANT.pieces) == 1:
+                    st.error("Calculate 2/3 of the total height of the gate.")
+                else:
+                    st.error("Weight each piece's centroid by its area, measuring every distance down from Point A.")
 
     # --- Part 3: Reactions ---
-    if st.session_state.get("loc_correct"):
+    if S.loc_correct:
         st.divider()
         st.subheader("Part 3: Solve for Reactions ($A_x$ and $B_x$)")
         
@@ -296,13 +322,13 @@ if st.session_state.step_idx >= 6:
         ax_val = st.number_input("Calculate $A_x$ (kN):", min_value=0.0, format="%.1f")
         
         if st.button("Check Reactions and Finish"):
-            ok_bx = abs(bx_val - 45.0) < 0.5
-            ok_ax = abs(ax_val - 22.5) < 0.5
+            ok_bx = within(bx_val, GATE["Bx"], 0.5)
+            ok_ax = within(ax_val, GATE["Ax"], 0.5)
             
-            if ok_bx and ok_ax:
+            if record_attempt(PROBLEM_ID, 6, "Check Reactions and Finish", ok_bx and ok_ax):
                 st.balloons()
-                st.session_state.step_idx = 7
-                st.rerun()
+                S.step_idx = 7
+                render.rerun()
             else:
                 if not ok_bx:
                     st.error("Check $B_x$. Set up your moment equation: $(F_R \\times \\text{distance to A}) = (B_x \\times \\text{total height})$.")
@@ -312,7 +338,8 @@ if st.session_state.step_idx >= 6:
 # ======================================================
 # S — SANITY CHECK (Step 7)
 # ======================================================
-if st.session_state.step_idx >= 7:
+if S.step_idx >= 7:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     
@@ -334,5 +361,12 @@ if st.session_state.step_idx >= 7:
         st.info("You have successfully applied the S.T.A.T.I.C.S. approach to a distributed loading problem. Great job!")
         
         if st.button("Start New Problem"):
-            st.session_state.clear()
-            st.rerun()
+            S = reset_state(PROBLEM_ID)
+            render.rerun()
+
+    units_check(PROBLEM_ID)
+
+    what_if(PROBLEM_ID)
+    water_level_panel(PROBLEM_ID, GATE_HEIGHT, width=GATE_WIDTH, target=GATE["Bx"])
+
+render.finish()
@@ -2,14 +2,15 @@ import streamlit as st
 import time
 from datetime import timedelta
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import (
+    within, count_canvas_lines, solve_beam_reactions, load_glossary, check_system, Sum,
+    SupportModel, pin, roller, check_moment_point,
+)
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_rendered, equation_input, units_check, what_if, moving_load_panel
 
 st.set_page_config(page_title="STATICS Method — Beam Reactions", page_icon="🏗️", layout="centered")
+PROBLEM_ID = "beam"
+render = RenderTimer(PROBLEM_ID)
 
 # ----------------------------
 # 1. PROBLEM DEFINITION (Always Visible)
@@ -23,111 +24,126 @@ PROBLEM_TEXT = (
     "Determine the reactions at supports A and B."
 )
 st.info(PROBLEM_TEXT)
+show_rendered("beam", caption="Beam with a roller at A and a pin at B")
 st.divider()
 
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-if "current_step_idx" not in st.session_state:
-    st.session_state.current_step_idx = 0
-if "start_time" not in st.session_state:
-    st.session_state.start_time = None
-if "timer_finished" not in st.session_state:
-    st.session_state.timer_finished = False
-if "vocab_idx" not in st.session_state:
-    st.session_state.vocab_idx = 0
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
 STUDY_DURATION = 180 
 
-VOCAB = [
-    {"term": "Roller Support", "def": "Allows rotation and horizontal movement. Prevents vertical movement. Result: 1 Vertical Reaction (Ay)."},
-    {"term": "Pin Support", "def": "Prevents translation in any direction. Result: 2 Reactions (Vertical By & Horizontal Bx)."},
-    {"term": "Static Determinacy", "def": "A structure is determinate if the number of unknowns equals the number of available equilibrium equations."},
-    {"term": "Moment (M)", "def": "M = Force × Perpendicular Distance. It is the 'twist' applied to a point."}
-]
+# Reference answers: roller at A (x=0), pin at B (x=9 ft), loads as (x ft, kips)
+BEAM_LOADS = ((3.0, 15.0), (11.0, 6.0), (13.0, 6.0))
+BEAM = solve_beam_reactions(x_A=0.0, x_B=9.0, loads=BEAM_LOADS)
+# Moving-load mode: trains as (offset ft, kips); at position 0 the exercise loads sit as drawn
+TRAINS = {
+    "The exercise loads (15k, 6k, 6k)": BEAM_LOADS,
+    "A single 1 kip load (influence lines)": ((0.0, 1.0),),
+}
+BEAM_MODEL = SupportModel([roller("A", (0.0, 0.0)), pin("B", (9.0, 0.0))])
+BEAM_UNKNOWNS = BEAM_MODEL.unknowns                 # Ay, Bx, By
+BEAM_FORCES = tuple(((x, 0.0), (0.0, -P)) for x, P in BEAM_LOADS)
+BEAM_SUMS = tuple(Sum(kind, BEAM_MODEL.reactions, BEAM_FORCES) for kind in ("Fx", "Fy", "M"))
+AY_POINTS = BEAM_MODEL.moment_points(target="Ay")
+PIVOT = AY_POINTS[0]                                # B: removes Bx and By from ΣM
+
+
+def tex(name):
+    """Reaction name as inline LaTeX: Ay -> $A_{y}$."""
+    return f"${name}$" if "_" in name else f"${name[0]}_{{{name[1:]}}}$"
+
+VOCAB = load_glossary().cards(PROBLEM_ID)  # shared, read-only cards
 
 # ----------------------------
 # 3. NAVIGATION / RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
-if st.session_state.current_step_idx == 0:
+if S.current_step_idx == 0:
     if st.button("▶️ Begin STATICS Method"):
-        st.session_state.current_step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.current_step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.current_step_idx >= 1:
+if S.current_step_idx >= 1:
+    render.step(1)
     st.header("S — Study & Vocabulary")
     
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining.")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
     with st.container(border=True):
-        card = VOCAB[st.session_state.vocab_idx]
+        card = VOCAB[S.vocab_idx]
         st.subheader(card["term"])
         st.write(card["def"])
         c1, c2 = st.columns(2)
-        if c1.button("⬅️ Prev") and st.session_state.vocab_idx > 0:
-            st.session_state.vocab_idx -= 1
-            st.rerun()
-        if c2.button("Next ➡️") and st.session_state.vocab_idx < len(VOCAB)-1:
-            st.session_state.vocab_idx += 1
-            st.rerun()
-
-    if st.session_state.current_step_idx == 1 and st.session_state.timer_finished:
+        if c1.button("⬅️ Prev") and S.vocab_idx > 0:
+            S.vocab_idx -= 1
+            render.rerun()
+        if c2.button("Next ➡️") and S.vocab_idx < len(VOCAB)-1:
+            S.vocab_idx += 1
+            render.rerun()
+
+    if S.current_step_idx == 1 and S.timer_finished:
         if st.button("Move to T — Translate"):
-            st.session_state.current_step_idx = 2
-            st.rerun()
+            S.current_step_idx = 2
+            render.rerun()
 
 # ======================================================
 # T — TRANSLATE (Step 2)
 # ======================================================
-if st.session_state.current_step_idx >= 2:
+if S.current_step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate (FBD)")
     st.write("Draw your Free Body Diagram. Include the beam, the 3 applied loads, and the reaction forces at A and B.")
     
     
-    if _canvas_ok:
+    st_canvas = load_canvas()  # imported on first use
+    if st_canvas is not None:
         canvas_result = st_canvas(
             stroke_width=3, stroke_color="#000", background_color="#eee",
-            height=250, width=650, drawing_mode="line", key="fbd_draw_v6"
+            height=250, width=650, drawing_mode="line", key="fbd_draw_v6",
+            initial_drawing=initial_strokes("fbd_draw_v6")
         )
+        remember_strokes("fbd_draw_v6", canvas_result.json_data)
         
-        if st.session_state.current_step_idx == 2:
+        if S.current_step_idx == 2:
             if st.button("Check Drawing"):
-                num_lines = len(canvas_result.json_data["objects"]) if canvas_result.json_data else 0
-                if 6 <= num_lines <= 9:
+                num_lines = count_canvas_lines(canvas_result.json_data)
+                if record_attempt(PROBLEM_ID, 2, "Check Drawing", 6 <= num_lines <= 9):
                     st.success("FBD looks solid. Let's assign coordinates.")
-                    st.session_state.current_step_idx = 3
-                    st.rerun()
+                    S.current_step_idx = 3
+                    render.rerun()
                 else:
                     st.error(f"Detection: {num_lines} lines. Did you include the beam + all loads and reactions?")
 
 # ======================================================
 # A — ASSIGN (Step 3: Reference Axes)
 # ======================================================
-if st.session_state.current_step_idx >= 3:
+if S.current_step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Reference Axes")
     st.write("Before implementing equations, define your positive directions.")
@@ -136,15 +152,16 @@ if st.session_state.current_step_idx >= 3:
     y_axis = col1.selectbox("Positive Vertical Direction:", ["Upward (+y)", "Downward (-y)"])
     m_axis = col2.selectbox("Positive Rotation:", ["Counter-Clockwise (+M)", "Clockwise (-M)"])
     
-    if st.session_state.current_step_idx == 3:
+    if S.current_step_idx == 3:
         if st.button("Set Axes"):
-            st.session_state.current_step_idx = 4
-            st.rerun()
+            S.current_step_idx = 4
+            render.rerun()
 
 # ======================================================
 # I — IMPLEMENT (Step 4: Logic of Unknowns)
 # ======================================================
-if st.session_state.current_step_idx >= 4:
+if S.current_step_idx >= 4:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equations")
     
@@ -154,20 +171,37 @@ if st.session_state.current_step_idx >= 4:
     q1 = st.number_input("How many unknown reaction forces are in this problem?", min_value=0, step=1)
     q2 = st.multiselect("Which equations will we need to solve for all unknowns?", 
                         ["Sum of Forces in X", "Sum of Forces in Y", "Sum of Moments", "Energy Balance"])
+
+    st.markdown("**Write your three equilibrium equations** (kips and ft; call the reactions Ay, By and Bx):")
+    eqs = [
+        equation_input("Sum of forces in x:", "eq_fx", BEAM_UNKNOWNS, BEAM, placeholder="e.g. Bx = 0", expect=BEAM_SUMS[0]),
+        equation_input("Sum of forces in y:", "eq_fy", BEAM_UNKNOWNS, BEAM, expect=BEAM_SUMS[1]),
+        equation_input("Sum of moments (about a point of your choice):", "eq_m", BEAM_UNKNOWNS, BEAM, expect=BEAM_SUMS[2]),
+    ]
     
-    if st.session_state.current_step_idx == 4:
+    if S.current_step_idx == 4:
         if st.button("Validate Logic"):
-            if q1 == 3 and "Sum of Forces in X" in q2 and "Sum of Forces in Y" in q2 and "Sum of Moments" in q2:
-                st.success("Correct. We have Ay, By, and Bx (3 unknowns) and 3 equations.")
-                st.session_state.current_step_idx = 5
-                st.rerun()
+            logic_ok = q1 == len(BEAM_UNKNOWNS) and "Sum of Forces in X" in q2 and "Sum of Forces in Y" in q2 and "Sum of Moments" in q2
+            system = check_system([e for e in eqs if e is not None], BEAM_UNKNOWNS, BEAM)
+            sums_ok = all(e is not None and want.matches(e) for e, want in zip(eqs, BEAM_SUMS))
+            if record_attempt(PROBLEM_ID, 5, "Validate Logic", logic_ok and system.ok and sums_ok):
+                st.success(f"Correct. We have {', '.join(BEAM_UNKNOWNS)} ({len(BEAM_UNKNOWNS)} unknowns) and {system.rank} independent equations.")
+                S.current_step_idx = 5
+                render.rerun()
+            elif not logic_ok:
+                st.error("Think about the supports: " + " ".join(BEAM_MODEL.describe()) + " How many equations do we usually use in 2D Statics?")
+            elif not all(system.holds):
+                st.error("At least one equation does not balance. Fix the ones marked ✗.")
+            elif not sums_ok:
+                st.error("Each box needs its own sum: ΣFx in the first, ΣFy in the second, ΣM about one point in the third. Fix the ones marked ✗.")
             else:
-                st.error("Think about the supports: A roller has 1 reaction, a pin has 2. How many equations do we usually use in 2D Statics?")
+                st.error(f"Your equations only pin down {system.rank} of the {system.needed} unknowns. Each one must add new information.")
 
 # ======================================================
 # C — COMPUTE (Step 5 & 6: Guided Solving)
 # ======================================================
-if st.session_state.current_step_idx >= 5:
+if S.current_step_idx >= 5:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
 
@@ -176,38 +210,41 @@ if st.session_state.current_step_idx >= 5:
     
     with st.expander("💡 Compute Helper: Which point is better?"):
         st.write("In Statics, we want to write one equation with only **one** unknown. Look at your FBD:")
-        st.write("- **Point A** has 1 unknown reaction ($A_y$).")
-        st.write("- **Point B** has 2 unknown reactions ($B_y$ and $B_x$).")
+        for support in BEAM_MODEL.supports:
+            n = len(support.reactions)
+            names = " and ".join(tex(r.name) for r in support.reactions)
+            st.write(f"- **Point {support.name}** has {n} unknown reaction{'s' if n > 1 else ''} ({names}).")
         st.write ("Moment Refresher Video: https://www.youtube.com/watch?v=O8BRl0xLlJw")
         st.info("If you sum moments at a point where many unknowns meet, those forces disappear from your equation (distance = 0). Which point simplifies your math more?")
 
     # Guiding them to choose B
     choice_pivot = st.radio(
         "Based on the helper above, which point should we sum moments about to solve for $A_y$ in one step?",
-        ["Point A", "Point B"],
+        [f"Point {support.name}" for support in BEAM_MODEL.supports],
         index=0
     )
 
-    if choice_pivot == "Point A":
+    if not check_moment_point(AY_POINTS, choice_pivot.split()[-1]).ok:
         st.warning("You can do this, but you will still have $B_y$ in your equation. Try choosing the point with more unknowns instead!")
     else:
-        st.success("Great choice! Summing at B eliminates both $B_x$ and $B_y$, leaving only $A_y$.")
+        gone = " and ".join(tex(n) for n in PIVOT.eliminated)
+        st.success(f"Great choice! Summing at {PIVOT.label} eliminates {gone}, leaving only {tex(PIVOT.remaining[0])}.")
         
-        st.write("Now, sum moments about **Point B** ($\sum M_B = 0$):")
+        st.write(f"Now, sum moments about **Point {PIVOT.label}** ($\sum M_{PIVOT.label} = 0$):")
         
         ans_ay = st.number_input("Enter your calculated value for Ay (kips):", value=0.0, key="input_ay")
         
-        if st.session_state.current_step_idx == 5:
+        if S.current_step_idx == 5:
             if st.button("Check Ay"):
-                if abs(ans_ay - 6.0) < 0.1:
+                if record_attempt(PROBLEM_ID, 6, "Check Ay", within(ans_ay, BEAM["Ay"], 0.1)):
                     st.success("Correct! $A_y = 6$ kips.")
-                    st.session_state.current_step_idx = 6
-                    st.rerun()
+                    S.current_step_idx = 6
+                    render.rerun()
                 else:
                     st.error("Hint: At Point B, the 15k load is 6ft to the left (+M), and $A_y$ is 9ft to the left (-M). The two 6k loads are to the right. Set them to zero and solve.")
 
 # --- Part 2: Solving for Reactions at B ---
-if st.session_state.current_step_idx >= 6:
+if S.current_step_idx >= 6:
     st.divider()
     st.subheader("Part 2: Solving for Reactions at B")
     
@@ -224,15 +261,15 @@ if st.session_state.current_step_idx >= 6:
     
     
 
-    if st.session_state.current_step_idx == 6:
+    if S.current_step_idx == 6:
         if st.button("Final Computation Check"):
-            correct_bx = (ans_bx == 0)
-            correct_by = (abs(ans_by - 21.0) < 0.1)
+            correct_bx = (ans_bx == BEAM["Bx"])
+            correct_by = within(ans_by, BEAM["By"], 0.1)
             
-            if correct_bx and correct_by:
+            if record_attempt(PROBLEM_ID, 6, "Final Computation Check", correct_bx and correct_by):
                 st.success("Perfect! You've found all reaction forces.")
-                st.session_state.current_step_idx = 7
-                st.rerun()
+                S.current_step_idx = 7
+                render.rerun()
             else:
                 if not correct_bx:
                     st.warning("Check $B_x$: Are there any horizontal external forces acting on the beam?")
@@ -242,12 +279,19 @@ if st.session_state.current_step_idx >= 6:
 # ======================================================
 # S — SANITY CHECK (Step 7)
 # ======================================================
-if st.session_state.current_step_idx >= 7:
+if S.current_step_idx >= 7:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     st.balloons()
     st.success("Final Results: Ay = 6k, By = 21k, Bx = 0k")
     st.info("Intuition Check: Does it make sense that By is much larger than Ay? Yes, because most of the weight (the two 6k loads) is hanging off the right side near B.")
+    units_check(PROBLEM_ID)
+    what_if(PROBLEM_ID)
+    moving_load_panel(PROBLEM_ID, 0.0, 9.0, 0.0, 13.0, TRAINS, section=3.0)
+
     if st.button("Restart Exercise"):
-        st.session_state.clear()
-        st.rerun()
\ No newline at end of file
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
+
+render.finish()
\ No newline at end of file
@@ -3,27 +3,23 @@ import time
 from datetime import timedelta
 import math
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import within, count_canvas_lines, solve_frame_internal, frame_internal_model
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_diagram, units_check, what_if
 
 st.set_page_config(page_title="STATICS Method — Internal Forces", page_icon="🔧", layout="centered")
+PROBLEM_ID = "frame"
+render = RenderTimer(PROBLEM_ID)
 
 # ==========================================
 # 1. PROBLEM DEFINITION & DIAGRAM
 # ==========================================
 st.title("Internal Forces in a Frame")
 
-# Replace this URL with your local file path or hosted image link for image_582b06.png
-PROBLEM_IMAGE_URL = "https://i.imgur.com/ZMe9g04.png"
-
+# Diagram is vendored in statics_core/data/diagrams (see statics_core/assets.py)
 try:
-    st.image(PROBLEM_IMAGE_URL, caption="Problem Diagram", use_container_width=True)
+    show_diagram("frame", caption="Problem Diagram", width="stretch")
 except Exception:
-    st.error("Could not load image. Please check the PROBLEM_IMAGE_URL variable in the code.")
+    st.error("Could not load image. Please check statics_core/data/diagrams.json.")
 
 st.info("📄 **Reference:** Refer to the diagram of the frame with the applied 160 lb load.")
 
@@ -51,61 +47,53 @@ st.divider()
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-def init_state():
-    defaults = {
-        "step_idx": 0,
-        "start_time": None,
-        "timer_finished": False,
-        "fbd_correct": False,
-        "fbd_val": 0,
-        "nj_correct": False,
-        "vj_correct": False,
-        "mj_correct": False
-    }
-    for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
-
-init_state()
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
+
 STUDY_DURATION = 180 
 
+# Reference answers for the frame (lengths in inches, load in lb)
+FRAME = solve_frame_internal(P=160.0, AB=14.0, BJ=8.0, JC=8.0, rise=10.0, run=24.0)
+FRAME_MODEL = frame_internal_model(P=160.0, AB=14.0, BJ=8.0, JC=8.0, rise=10.0, run=24.0)
+BD_TYPE = "Two-force member" if "BD" in FRAME_MODEL.two_force_members() else "Three-force body"
+
 # ----------------------------
 # 3. SIDEBAR RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
 # ----------------------------
 # STEP 0: START
 # ----------------------------
-if st.session_state.step_idx == 0:
+if S.step_idx == 0:
     if st.button("▶️ Begin S.T.A.T.I.C.S. Method"):
-        st.session_state.step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.step_idx >= 1:
+if S.step_idx >= 1:
+    render.step(1)
     st.header("S — Study the Problem")
     st.caption("Read carefully and extract the physical parameters.")
     
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining.")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
@@ -117,19 +105,20 @@ if st.session_state.step_idx >= 1:
     
     total_dist = st.number_input("What is the total horizontal distance from A to C? (inches):", min_value=0, step=1)
 
-    if st.session_state.step_idx == 1 and st.session_state.timer_finished:
+    if S.step_idx == 1 and S.timer_finished:
         if st.button("Check Mechanics & Continue"):
-            if member_type == "Two-force member" and total_dist == 30:
+            if record_attempt(PROBLEM_ID, 1, "Check Mechanics & Continue", member_type == BD_TYPE and total_dist == FRAME["AC"]):
                 st.success("Correct! Because BD is a two-force member, we know the **exact direction** of the force it applies to point B (along the line connecting B and D).")
-                st.session_state.step_idx = 2
-                st.rerun()
+                S.step_idx = 2
+                render.rerun()
             else:
                 st.error("Review the problem. Add up the horizontal segments. Also, recall the definition of a member with only two pins and no intermediate loads.")
 
 # ======================================================
 # T — TRANSLATE TO DIAGRAM (Step 2: FBD)
 # ======================================================
-if st.session_state.step_idx >= 2:
+if S.step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate to a Diagram (FBD)")
 
@@ -142,25 +131,29 @@ if st.session_state.step_idx >= 2:
     st.info("Using the canvas toolbar, sketch the FBD of the **Left Segment (ABJ)** after making an imaginary cut at J.")
     st.caption("Draw the segment ABJ. Include the applied $160\\text{ lb}$ load, the reaction force from BD acting at B, and the three internal forces ($N, V, M$) exposed at the cut J.")
     
-    if _canvas_ok:
+    st_canvas = load_canvas()  # imported on first use
+    if st_canvas is not None:
         canvas_fbd = st_canvas(
             stroke_width=3, stroke_color="#000", background_color="#fff",
-            height=300, width=600, drawing_mode="line", display_toolbar=True, key="canvas_fbd_frame"
+            height=300, width=600, drawing_mode="line", key="canvas_fbd_frame",
+            initial_drawing=initial_strokes("canvas_fbd_frame")
         )
+        remember_strokes("canvas_fbd_frame", canvas_fbd.json_data)
 
         if st.button("Check FBD"):
-            num_lines = len(canvas_fbd.json_data["objects"]) if canvas_fbd.json_data else 0
-            if num_lines >= 4:
+            num_lines = count_canvas_lines(canvas_fbd.json_data)
+            if record_attempt(PROBLEM_ID, 2, "Check FBD", num_lines >= 4):
                 st.success("FBD looks populated. You should have the beam, load A, force B, and internal forces at J. Proceed.")
-                st.session_state.step_idx = 3
-                st.rerun()
+                S.step_idx = 3
+                render.rerun()
             else:
                 st.error(f"Detected {num_lines} lines. Think about the segment itself, the external loads on it, and the 3 internal reactions exposed at the cut.")
 
 # ======================================================
 # A — ASSIGN (Step 3: Coordinates & Assumptions)
 # ======================================================
-if st.session_state.step_idx >= 3:
+if S.step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Coordinates and Assumptions")
     
@@ -177,13 +170,14 @@ if st.session_state.step_idx >= 3:
     st.info("Assume member BD is in **Tension** (pulling up and to the right on point B). For the cut at J, it is standard to assume internal Normal force ($N$) points away from the cut, Shear ($V$) points down on a right-facing cut, and Moment ($M$) is CCW.")
     
     if st.button("Acknowledge Assumptions"):
-        st.session_state.step_idx = 4
-        st.rerun()
+        S.step_idx = 4
+        render.rerun()
 
 # ======================================================
 # T — TRANSLATE TO COMPONENTS (Step 4: Geometry)
 # ======================================================
-if st.session_state.step_idx >= 4:
+if S.step_idx >= 4:
+    render.step(4)
     st.divider()
     st.header("T — Translate Forces to Components")
     st.caption("Before writing equilibrium equations, we must find the geometry of the two-force member BD.")
@@ -199,17 +193,18 @@ if st.session_state.step_idx >= 4:
         st.write ("Youtube (Pythagorean Theorem): https://www.youtube.com/watch?v=uthjpYKD7Ng")
 
     if st.button("Verify Geometry"):
-        if q_rise == 10.0 and q_run == 24.0 and q_hyp == 26.0:
+        if record_attempt(PROBLEM_ID, 4, "Verify Geometry", q_rise == 10.0 and q_run == 24.0 and q_hyp == FRAME["hyp"]):
             st.success("Correct! This is a 10-24-26 triangle (which simplifies to a 5-12-13 ratio). You can use this to find the X and Y components of $F_{BD}$.")
-            st.session_state.step_idx = 5
-            st.rerun()
+            S.step_idx = 5
+            render.rerun()
         else:
             st.error("Check your dimensions. Use $a^2 + b^2 = c^2$ to find the hypotenuse.")
 
 # ======================================================
 # I — IMPLEMENT (Step 5: Equilibrium Strategy)
 # ======================================================
-if st.session_state.step_idx >= 5:
+if S.step_idx >= 5:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equilibrium Strategy")
     st.caption("Map out your mathematical strategy before computing numbers.")
@@ -225,17 +220,18 @@ if st.session_state.step_idx >= 5:
         st.write("Concept 2: When finding internal moments at a cut, it is always easiest to sum moments exactly AT the cut to eliminate the internal normal and shear forces from the equation.")
     
     if st.button("Validate Strategy"):
-        if pivot_ans == "Point C" and cut_ans == "Point J":
+        if record_attempt(PROBLEM_ID, 5, "Validate Strategy", pivot_ans == "Point C" and cut_ans == "Point J"):
             st.success("Excellent! Summing moments at C isolates $F_{BD}$. Summing moments at J isolates the internal moment. Let's calculate.")
-            st.session_state.step_idx = 6
-            st.rerun()
+            S.step_idx = 6
+            render.rerun()
         else:
             st.error("Review your strategy. Where are the forces you want to IGNORE located?")
 
 # ======================================================
 # C — COMPUTE (Step 6: Guided Math)
 # ======================================================
-if st.session_state.step_idx >= 6:
+if S.step_idx >= 6:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
     st.caption("Solve algebraically step-by-step.")
@@ -251,15 +247,15 @@ if st.session_state.step_idx >= 6:
     fbd_val = st.number_input("Magnitude of $F_{BD}$ (lb):", min_value=0.0, format="%.1f")
     
     if st.button("Check F_BD"):
-        if abs(fbd_val - 780.0) < 1.0:
+        if record_attempt(PROBLEM_ID, 6, "Check F_BD", within(fbd_val, FRAME["F_BD"], 1.0)):
             st.success("Correct! $F_{BD} = 780\\text{ lb}$. Now break this into X and Y components to use on the cut segment.")
-            st.session_state.fbd_correct = True
-            st.session_state.fbd_val = fbd_val
+            S.fbd_correct = True
+            S.fbd_val = fbd_val
         else:
             st.error("Check your moment arms. Point A is $30\\text{ in.}$ from C. Point B is $16\\text{ in.}$ from C.")
 
     # --- Part 2: Internal Forces ---
-    if st.session_state.get("fbd_correct"):
+    if S.fbd_correct:
         st.divider()
         st.subheader("Part 2: Calculate Internal Forces at J")
         st.write("Now, look **only at the Left Segment (ABJ)**. You have the $160\\text{ lb}$ downward force at A, and the components of $F_{BD}$ acting at B.")
@@ -280,14 +276,14 @@ if st.session_state.step_idx >= 6:
         mj_val = st.number_input("Absolute Magnitude of Bending Moment $M_J$ (lb*in):", min_value=0.0, format="%.1f")
         
         if st.button("Check Internal Forces and Finish"):
-            ok_nj = abs(nj_val - 720.0) < 1.0
-            ok_vj = abs(vj_val - 140.0) < 1.0
-            ok_mj = abs(mj_val - 1120.0) < 1.0
+            ok_nj = within(nj_val, FRAME["N_J"], 1.0)
+            ok_vj = within(vj_val, FRAME["V_J"], 1.0)
+            ok_mj = within(mj_val, FRAME["M_J"], 1.0)
             
-            if ok_nj and ok_vj and ok_mj:
+            if record_attempt(PROBLEM_ID, 6, "Check Internal Forces and Finish", ok_nj and ok_vj and ok_mj):
                 st.balloons()
-                st.session_state.step_idx = 7
-                st.rerun()
+                S.step_idx = 7
+                render.rerun()
             else:
                 if not ok_nj:
                     st.error("Check $N_J$. It must balance the horizontal component of $F_{BD}$.")
@@ -299,7 +295,8 @@ if st.session_state.step_idx >= 6:
 # ======================================================
 # S — SANITY CHECK (Step 7)
 # ======================================================
-if st.session_state.step_idx >= 7:
+if S.step_idx >= 7:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     
@@ -320,5 +317,11 @@ if st.session_state.step_idx >= 7:
         st.info("You have successfully applied the S.T.A.T.I.C.S. method to find internal forces! Great job.")
         
         if st.button("Start New Problem"):
-            st.session_state.clear()
-            st.rerun()
\ No newline at end of file
+            S = reset_state(PROBLEM_ID)
+            render.rerun()
+
+    units_check(PROBLEM_ID)
+
+    what_if(PROBLEM_ID)
+
+render.finish()
\ No newline at end of file
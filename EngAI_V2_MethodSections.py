@@ -3,28 +3,26 @@ import time
 from datetime import timedelta
 import math
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import (
+    grade_mcq, within, count_canvas_lines, solve_fink_sections, load_glossary,
+    member_line, rank_moment_points, check_moment_point, Sum,
+)
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_diagram, units_check, what_if, equation_input
 
 st.set_page_config(page_title="STATICS Method — Roof Truss", page_icon="🏠", layout="centered")
+PROBLEM_ID = "truss_sections"
+render = RenderTimer(PROBLEM_ID)
 
 # ==========================================
 # 1. PROBLEM DEFINITION & IMAGE
 # ==========================================
 st.title("Roof Truss Analysis: Method of Sections")
 
-# Replace this URL with the direct link to the image if hosting online, 
-# or use a local file path if running locally (e.g., "truss_problem.png")
-PROBLEM_IMAGE_URL = "https://i.imgur.com/FQHvFiW.jpeg"
-
+# Diagram is vendored in statics_core/data/diagrams (see statics_core/assets.py)
 try:
-    st.image(PROBLEM_IMAGE_URL, caption="Roof Truss Diagram", use_container_width=True)
+    show_diagram("truss_sections", caption="Roof Truss Diagram", width="stretch")
 except Exception:
-    st.error("Could not load image. Please check the PROBLEM_IMAGE_URL variable in the code.")
+    st.error("Could not load image. Please check statics_core/data/diagrams.json.")
 
 st.info("📄 **Reference:** Refer to the uploaded diagram of the roof truss with top and bottom loads.")
 
@@ -45,77 +43,86 @@ st.divider()
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-if "step_idx" not in st.session_state: st.session_state.step_idx = 0
-if "start_time" not in st.session_state: st.session_state.start_time = None
-if "timer_finished" not in st.session_state: st.session_state.timer_finished = False
-if "vocab_idx" not in st.session_state: st.session_state.vocab_idx = 0
-if "s_given_sel" not in st.session_state: st.session_state.s_given_sel = set()
-if "ly_correct" not in st.session_state: st.session_state.ly_correct = False
-if "h_height_correct" not in st.session_state: st.session_state.h_height_correct = False
-if "fgi_correct" not in st.session_state: st.session_state.fgi_correct = False
-if "ffh_correct" not in st.session_state: st.session_state.ffh_correct = False
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
 STUDY_DURATION = 180 
 
-VOCAB = [
-    {"term": "Method of Sections", "def": "An analytical technique where you 'cut' through the truss (passing through the members you want to find) and analyze an entire section as a rigid body."},
-    {"term": "Rigid Body Equilibrium", "def": "Because the entire section is in equilibrium, you can use ΣFx=0, ΣFy=0, and crucially, ΣM=0 about ANY point in space."},
-    {"term": "Asymmetric Loading", "def": "When forces are not perfectly mirrored across the center of a structure. You cannot assume reactions or member forces are equal on both sides!"},
-    {"term": "Line of Action", "def": "The infinite geometric line along which a force acts. You can slide a force anywhere along its line of action when calculating moments."}
-]
+# Reference answers (tension positive, compression negative)
+TRUSS = solve_fink_sections(panel=5.0, n_panels=6, peak=8.0, top_load=1.0, bottom_loads=(5.0, 5.0, 5.0))
+
+# Node coordinates (m): bottom chord A, C, E, ..., L on y = 0, top chord B, D, F, H, J on the roof
+NODES = {"A": (0.0, 0.0), "L": (30.0, 0.0)}
+for i, x in enumerate((5.0, 10.0, 15.0, 20.0, 25.0)):
+    NODES["BDFHJ"[i]] = (x, 8.0 * (1 - abs(x - 15.0) / 15.0))
+    NODES["CEGIK"[i]] = (x, 0.0)
+
+# The cut through FH, GH and GI; ranked moment points that isolate F_GI
+CUT = (
+    member_line("F_FH", NODES["H"], NODES["F"]),
+    member_line("F_GH", NODES["H"], NODES["G"]),
+    member_line("F_GI", NODES["I"], NODES["G"]),
+)
+GI_POINTS = rank_moment_points(CUT, NODES, target="F_GI")
+
+# Known forces on the right section (kN): Ly at L and the roof loads at H and J
+SECTION_LOADS = ((NODES["L"], (0.0, TRUSS["Ly"])), (NODES["H"], (0.0, -1.0)), (NODES["J"], (0.0, -1.0)))
+SECTION_MOMENTS = Sum("M", CUT, SECTION_LOADS)
+
+VOCAB = load_glossary().cards(PROBLEM_ID)  # shared, read-only cards
 
 # ----------------------------
 # 3. SIDEBAR RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
 # ----------------------------
 # STEP 0: START
 # ----------------------------
-if st.session_state.step_idx == 0:
+if S.step_idx == 0:
     if st.button("▶️ Begin S.T.A.T.I.C.S. Method"):
-        st.session_state.step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.step_idx >= 1:
+if S.step_idx >= 1:
+    render.step(1)
     st.header("S — Study the Problem")
     st.caption("Read carefully and visualize what’s happening physically.")
     
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining. Watch out for traps in the load layout!")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
     with st.container(border=True):
-        st.subheader(f"Vocabulary Card {st.session_state.vocab_idx + 1}/{len(VOCAB)}")
-        card = VOCAB[st.session_state.vocab_idx]
+        st.subheader(f"Vocabulary Card {S.vocab_idx + 1}/{len(VOCAB)}")
+        card = VOCAB[S.vocab_idx]
         st.markdown(f"**{card['term']}**")
         st.write(card['def'])
         c1, c2 = st.columns(2)
-        if c1.button("⬅️ Prev") and st.session_state.vocab_idx > 0:
-            st.session_state.vocab_idx -= 1
-            st.rerun()
-        if c2.button("Next ➡️") and st.session_state.vocab_idx < len(VOCAB)-1:
-            st.session_state.vocab_idx += 1
-            st.rerun()
+        if c1.button("⬅️ Prev") and S.vocab_idx > 0:
+            S.vocab_idx -= 1
+            render.rerun()
+        if c2.button("Next ➡️") and S.vocab_idx < len(VOCAB)-1:
+            S.vocab_idx += 1
+            render.rerun()
 
     st.write("#### Identify Key Parameters")
     GIVEN_OPTS = [
@@ -128,26 +135,26 @@ if st.session_state.step_idx >= 1:
     cols_g = st.columns(2)
     for i, (txt, is_correct) in enumerate(GIVEN_OPTS):
         with cols_g[i % 2]:
-            if st.checkbox(txt, value=(txt in st.session_state.s_given_sel), key=f"g_{i}"):
-                st.session_state.s_given_sel.add(txt)
+            if st.checkbox(txt, value=(txt in S.s_given_sel), key=f"g_{i}"):
+                S.s_given_sel.add(txt)
             else:
-                st.session_state.s_given_sel.discard(txt)
+                S.s_given_sel.discard(txt)
 
-    if st.session_state.step_idx == 1 and st.session_state.timer_finished:
+    if S.step_idx == 1 and S.timer_finished:
         if st.button("Check & Continue to T"):
-            correct = sum(1 for t, c in GIVEN_OPTS if c and t in st.session_state.s_given_sel)
-            wrongs = sum(1 for t, c in GIVEN_OPTS if not c and t in st.session_state.s_given_sel)
-            if correct == 3 and wrongs == 0:
+            all_ok, _, _, _ = grade_mcq(S.s_given_sel, GIVEN_OPTS)
+            if record_attempt(PROBLEM_ID, 1, "Check & Continue to T", all_ok):
                 st.success("Correct! **TRAP AVOIDED:** While the frame is symmetric, the 5 kN loads are ONLY on the left side. You cannot assume symmetry for the reactions!")
-                st.session_state.step_idx = 2
-                st.rerun()
+                S.step_idx = 2
+                render.rerun()
             else:
                 st.warning("Look very closely at the 5 kN loads. Are they mirrored perfectly on the right side of the truss? Check your selections.")
 
 # ======================================================
 # T — TRANSLATE TO DIAGRAM (Step 2: FBD)
 # ======================================================
-if st.session_state.step_idx >= 2:
+if S.step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate to a Diagram (FBD)")
 
@@ -167,18 +174,21 @@ if st.session_state.step_idx >= 2:
         st.info("Use the **Line Tool** to draw the FBD of the Right Section.")
         st.caption("Include the partial truss, the external loads at J and H, the reaction at L, and the three severed members pointing AWAY from the cut.")
         
-        if _canvas_ok:
+        st_canvas = load_canvas()  # imported on first use
+        if st_canvas is not None:
             canvas_fbd = st_canvas(
                 stroke_width=3, stroke_color="#000", background_color="#fff",
-                height=350, width=600, drawing_mode="line", display_toolbar=True, key="canvas_fbd_section"
+                height=350, width=600, drawing_mode="line", key="canvas_fbd_section",
+                initial_drawing=initial_strokes("canvas_fbd_section")
             )
+            remember_strokes("canvas_fbd_section", canvas_fbd.json_data)
 
             if st.button("Check FBD"):
-                num_lines = len(canvas_fbd.json_data["objects"]) if canvas_fbd.json_data else 0
-                if num_lines >= 4:
+                num_lines = count_canvas_lines(canvas_fbd.json_data)
+                if record_attempt(PROBLEM_ID, 2, "Check FBD", num_lines >= 4):
                     st.success("FBD detected. Proceed to Assign.")
-                    st.session_state.step_idx = 3
-                    st.rerun()
+                    S.step_idx = 3
+                    render.rerun()
                 else:
                     st.error("Please draw the external loads, the reaction, and the three unknown cut member vectors.")
     elif section_guess:
@@ -187,7 +197,8 @@ if st.session_state.step_idx >= 2:
 # ======================================================
 # A — ASSIGN (Step 3: Coordinates & Global Reactions)
 # ======================================================
-if st.session_state.step_idx >= 3:
+if S.step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Coordinates & Find Global Reactions")
     
@@ -204,18 +215,19 @@ if st.session_state.step_idx >= 3:
         # Sum moments about A = 0
         # 1*(5+10+15+20+25) + 5*(5+10+15) = 75 + 150 = 225.
         # Ly * 30 = 225 => Ly = 7.5
-        if abs(ly_val - 7.5) < 0.2:
+        if record_attempt(PROBLEM_ID, 3, "Check Reaction L_y", within(ly_val, TRUSS["Ly"], 0.2)):
             st.success("Correct! $L_y = 7.5\\text{ kN}$. You are ready to focus purely on the Right Section.")
-            st.session_state.ly_correct = True
-            st.session_state.step_idx = 4
-            st.rerun()
+            S.ly_correct = True
+            S.step_idx = 4
+            render.rerun()
         else:
             st.error("Check your moment arms. Top loads are at x = 5, 10, 15, 20, 25. Bottom loads are at x = 5, 10, 15. The pivot A is at x = 0.")
 
 # ======================================================
 # T — TRANSLATE TO COMPONENTS (Step 4: Geometry)
 # ======================================================
-if st.session_state.step_idx >= 4:
+if S.step_idx >= 4:
+    render.step(4)
     st.divider()
     st.header("T — Translate Forces to Components (Geometry)")
     st.caption("We need the exact coordinates/heights of the nodes where we made our cut.")
@@ -231,25 +243,26 @@ if st.session_state.step_idx >= 4:
     
     if st.button("Check Geometry"):
         # Height at H: (8 / 15) * 10 = 5.333
-        if abs(h_height - 5.333) < 0.1:
+        if record_attempt(PROBLEM_ID, 4, "Check Geometry", within(h_height, TRUSS["h_H"], 0.1)):
             st.success("Correct! Node H is approx $5.33\\text{ m}$ high. (Fractionally, $16/3\\text{ m}$).")
-            st.session_state.h_height_correct = True
+            S.h_height_correct = True
         else:
             st.error("Set up a ratio: Height at Center / Distance to L = Height at H / Distance to L.")
 
-    if st.session_state.get("h_height_correct"):
+    if S.h_height_correct:
         st.subheader("Component Strategy")
         st.write("Assume all cut members ($F_{FH}, F_{GH}, F_{GI}$) are in **Tension** (pulling AWAY from the right section).")
         st.info("💡 **Tip:** You will use this height geometry directly in your moment equations in the next step. You don't necessarily need angles (sine/cosine) if you use distances and slopes!")
         
         if st.button("Proceed to Equations"):
-            st.session_state.step_idx = 5
-            st.rerun()
+            S.step_idx = 5
+            render.rerun()
 
 # ======================================================
 # I — IMPLEMENT (Step 5: Equilibrium Equations)
 # ======================================================
-if st.session_state.step_idx >= 5:
+if S.step_idx >= 5:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equilibrium Equations")
     st.caption("Look ONLY at the Right Section. Apply your 2D equilibrium tools.")
@@ -261,19 +274,27 @@ if st.session_state.step_idx >= 5:
 
     strat_gi = st.radio("To find the bottom chord $F_{GI}$ directly, where should you sum moments?", 
                        ["Node G", "Node H", "Node F"])
+    equation_input("Optional: write ΣM = 0 about that point (kN and m, tension positive, call the reaction Ly):",
+                   "sec_eq_m", [ln.name for ln in CUT], TRUSS, knowns={"Ly": TRUSS["Ly"]},
+                   placeholder="e.g. 10 Ly - ... = 0", expect=SECTION_MOMENTS)
     
     if st.button("Confirm Strategy"):
-        if strat_gi == "Node H":
-            st.success("Exactly! Both $F_{FH}$ and $F_{GH}$ pass directly through Node H. Summing moments there eliminates them, leaving only $F_{GI}$ and the external loads.")
-            st.session_state.step_idx = 6
-            st.rerun()
+        pick = check_moment_point(GI_POINTS, strat_gi.split()[-1])
+        if record_attempt(PROBLEM_ID, 5, "Confirm Strategy", pick.ok):
+            gone = " and ".join(f"$F_{{{n[2:]}}}$" for n in pick.chosen.eliminated)
+            st.success(f"Exactly! Both {gone} pass directly through Node {pick.chosen.label}. Summing moments there eliminates them, leaving only $F_{{GI}}$ and the external loads.")
+            S.step_idx = 6
+            render.rerun()
+        elif pick.chosen is None:
+            st.error("$F_{GI}$ passes through that node, so it would drop out of the moment equation too. Look at where the lines of action for the forces you want to IGNORE cross each other.")
         else:
             st.error("Look at where the lines of action for the forces you want to IGNORE cross each other.")
 
 # ======================================================
 # C — COMPUTE (Step 6: Guided Math)
 # ======================================================
-if st.session_state.step_idx >= 6:
+if S.step_idx >= 6:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
     st.caption("Solve your equations carefully.")
@@ -295,14 +316,14 @@ if st.session_state.step_idx >= 6:
         # Ly(10) CCW, 1kN_J(5) CW. F_GI pulls left at y=0. Pivot is at y=5.333.
         # Pulling left from the bottom against a top pivot creates CCW moment.
         # 7.5*10 - 1*5 + F_GI*5.333 = 0 -> 70 + F_GI*5.333 = 0 -> F_GI = -13.125
-        if abs(f_gi_val - 13.1) < 0.2 and f_gi_state == "Tension (T)":
+        if record_attempt(PROBLEM_ID, 6, "Check GI", within(f_gi_val, abs(TRUSS["F_GI"]), 0.2) and f_gi_state == "Tension (T)"):
             st.success("Correct! $F_{GI} = 13.1\\text{ kN}$ (T).")
-            st.session_state.fgi_correct = True
+            S.fgi_correct = True
         else:
             st.error("Check your moments. $L_y$ creates a Counter-Clockwise moment. The load at J is Clockwise. If $F_{GI}$ pulls Left at the bottom, does it rotate CCW or CW around H?")
 
     # --- Part 2: Member FH ---
-    if st.session_state.get("fgi_correct"):
+    if S.fgi_correct:
         st.divider()
         st.subheader("Part 2: Force in Member FH")
         st.write("To isolate the top chord $F_{FH}$, sum moments about Node G ($x=15, y=0$).")
@@ -320,14 +341,14 @@ if st.session_state.step_idx >= 6:
             # 7.5*15 - 1*10 - 1*5 = 112.5 - 10 - 5 = 97.5 CCW.
             # FH_x * 8 = 97.5 -> FH_x = 12.1875
             # FH_x = FH * (15/17) -> FH = 13.8125
-            if abs(f_fh_val - 13.8) < 0.2 and f_fh_state == "Compression (C)":
+            if record_attempt(PROBLEM_ID, 6, "Check FH", within(f_fh_val, abs(TRUSS["F_FH"]), 0.2) and f_fh_state == "Compression (C)"):
                 st.success("Correct! $F_{FH} = 13.8\\text{ kN}$ (C).")
-                st.session_state.ffh_correct = True
+                S.ffh_correct = True
             else:
                 st.error("Calculate the moment arm correctly. The line of action of $F_{FH}$ passes through F. If you break $F_{FH}$ into X and Y components at F, the Y component passes through G (0 moment). Use the X component and the $8\\text{m}$ height.")
 
     # --- Part 3: Member GH (Final Calculation) ---
-    if st.session_state.get("ffh_correct"):
+    if S.ffh_correct:
         st.divider()
         st.subheader("Part 3: Force in Diagonal Member GH")
         st.write("With only one unknown left, you can use $\\sum F_y = 0$ on the Right Section.")
@@ -346,17 +367,18 @@ if st.session_state.step_idx >= 6:
             # Net so far = 5.5 UP + 6.5 DOWN = 1.0 DOWN.
             # GH must push 1.0 UP. To push UP on node H from below, it must push INTO H (Compression).
             # GH_y = 1.0. GH = 1.0 * (sqrt(5^2 + (16/3)^2) / (16/3)) = 1.37
-            if abs(f_gh_val - 1.37) < 0.1 and f_gh_state == "Compression (C)":
+            if record_attempt(PROBLEM_ID, 6, "Check GH and Finish", within(f_gh_val, abs(TRUSS["F_GH"]), 0.1) and f_gh_state == "Compression (C)"):
                 st.balloons()
-                st.session_state.step_idx = 7
-                st.rerun()
+                S.step_idx = 7
+                render.rerun()
             else:
                 st.error("Track the vertical forces. If the top chord ($F_{FH}$) is in compression, it is pushing down and to the right against Node H. Be sure to include its downward component in your Y sum!")
 
 # ======================================================
 # S — SANITY CHECK (Step 7)
 # ======================================================
-if st.session_state.step_idx >= 7:
+if S.step_idx >= 7:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     st.caption("Do the results make physical sense?")
@@ -381,6 +403,12 @@ if st.session_state.step_idx >= 7:
     
     st.info("You have successfully applied the Method of Sections using the S.T.A.T.I.C.S. approach.")
     
+    units_check(PROBLEM_ID)
+    
+    what_if(PROBLEM_ID)
+
     if st.button("Start New Problem"):
-        st.session_state.clear()
-        st.rerun()
\ No newline at end of file
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
+
+render.finish()
\ No newline at end of file
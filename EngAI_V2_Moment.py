@@ -1,19 +1,13 @@
 import streamlit as st
-from io import BytesIO
-from PIL import Image
-import math
-import re
 import time
 from datetime import timedelta
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import extract_lines, grade_mcq, solve_lever_moment, load_glossary
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_rendered, units_check, what_if
 
 st.set_page_config(page_title="STATICS Method — Moments", page_icon="🔧", layout="centered")
+PROBLEM_ID = "lever"
+render = RenderTimer(PROBLEM_ID)
 
 # ----------------------------
 # PROBLEM DEFINITION
@@ -28,6 +22,7 @@ PROBLEM_TEXT = (
 
 st.title("Moment of a Force Exercise")
 st.write(PROBLEM_TEXT)
+show_rendered("lever", caption="Lever OA")
 
 st.divider()
 st.header("STATICS Method")
@@ -35,93 +30,54 @@ st.header("STATICS Method")
 # ----------------------------
 # KEYWORDS & DEFINITIONS
 # ----------------------------
-KEY_DEFS = {
-    "moment": "The tendency of a force to rotate a body about a specific point or axis. Calculated as Force × Perpendicular Distance (M = Fd).",
-    "moment arm": "The perpendicular distance from the pivot point (O) to the line of action of the force.",
-    "line of action": "The infinite line extending along the direction of the force vector.",
-    "pivot": "The point of rotation (O) which is fixed.",
-    "vertical force": "A force acting perpendicular to the horizon (along the y-axis).",
-    "horizontal force": "A force acting parallel to the horizon (along the x-axis).",
-    "equilibrium": "A state where moments and forces balance (though here we are just calculating the moment, not necessarily balancing it).",
-}
-
-# Scan for terms
-TERMS_IN_PROBLEM = [k for k in KEY_DEFS if re.search(rf"\b{re.escape(k)}\b", PROBLEM_TEXT, re.IGNORECASE)]
-CORE_TERMS = {"moment", "vertical force"} 
+GLOSSARY = load_glossary()  # parsed once per process, shared read-only
+KEY_DEFS = GLOSSARY.definitions(PROBLEM_ID)
+
+# Scan for terms (cached automaton, one pass over the text)
+TERMS_IN_PROBLEM = GLOSSARY.terms_in_text(PROBLEM_ID, PROBLEM_TEXT)
+CORE_TERMS = GLOSSARY.core_terms(PROBLEM_ID)
 
 # ----------------------------
 # SESSION STATE INIT
 # ----------------------------
-def init_state():
-    defaults = {
-        "method_started": False,
-        # S - Timer
-        "s_timer_started": False,
-        "s_timer_start_time": None,
-        "s_timer_done": False,
-        # S - Vocab
-        "s_vocab_ack": {t: False for t in TERMS_IN_PROBLEM},
-        # S - Identifier
-        "s_given_sel": set(),
-        "s_target_sel": set(),
-        "s_identifier_pass": False,
-        "S_done": False,
-        # T - Translate
-        "unlock_T": False,
-        "T_done": False,
-        # A - Assign
-        "unlock_A": False,
-        "A_done": False,
-        # I - Implement
-        "unlock_I": False,
-        "I_done": False,
-        # C - Compute
-        "unlock_C": False,
-        "C_done": False,
-        # Sanity
-        "unlock_S": False
-    }
-    for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
-
-init_state()
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
+
 STUDY_SECONDS = 3 * 60  # 3 minutes
 
 def seconds_left():
-    if not st.session_state.s_timer_started or st.session_state.s_timer_start_time is None:
+    if not S.s_timer_started or S.s_timer_start_time is None:
         return STUDY_SECONDS
-    return max(0, STUDY_SECONDS - int(time.time() - st.session_state.s_timer_start_time))
+    return max(0, STUDY_SECONDS - int(time.time() - S.s_timer_start_time))
 
 # ----------------------------
 # CONTROLS
 # ----------------------------
 c_start, c_reset = st.columns([1, 1])
 with c_start:
-    if not st.session_state.method_started:
+    if not S.method_started:
         if st.button("▶️ Start STATICS Method"):
-            st.session_state.method_started = True
-            st.session_state.s_timer_started = True
-            st.session_state.s_timer_start_time = time.time()
-            st.rerun()
+            S.method_started = True
+            S.s_timer_started = True
+            S.s_timer_start_time = time.time()
+            render.rerun()
 with c_reset:
     if st.button("🔄 Reset All"):
-        for k in list(st.session_state.keys()):
-            del st.session_state[k]
-        init_state()
-        st.rerun()
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
 
-if not st.session_state.method_started:
+if not S.method_started:
     st.info("Click **Start STATICS Method** to begin Step S — Study.")
-    st.stop()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Substep 1): Focus timer
 # ======================================================
+render.step(1)
 st.subheader("S — Study (1/3): 3-minute quiet focus")
-if not st.session_state.s_timer_done:
+if not S.s_timer_done:
     left = seconds_left()
-    if st.session_state.s_timer_started:
+    if S.s_timer_started:
         pct = (STUDY_SECONDS - left) / STUDY_SECONDS
         st.progress(min(max(pct, 0.0), 1.0))
         mmss = str(timedelta(seconds=left))[2:7] if left >= 60 else f"00:{left:02d}"
@@ -130,22 +86,21 @@ if not st.session_state.s_timer_done:
         c1, c2 = st.columns([1, 1])
         with c1:
             if st.button("⏭️ I'm done early"):
-                st.session_state.s_timer_done = True
-                st.rerun()
+                S.s_timer_done = True
+                render.rerun()
         with c2:
             if st.button("⏸️ Pause"):
-                st.session_state.s_timer_started = False
-                st.rerun()
+                S.s_timer_started = False
+                render.rerun()
 
-        if left > 0 and st.session_state.s_timer_started:
-            time.sleep(1)
-            st.rerun()
+        if left > 0 and S.s_timer_started:
+            render.tick()
         else:
-            st.session_state.s_timer_done = True
-            st.rerun()
+            S.s_timer_done = True
+            render.rerun()
     else:
         st.warning("Timer paused. Click **Start STATICS Method** again to resume.")
-    st.stop()
+    render.stop()
 
 st.success("✅ Focus timer complete.")
 
@@ -163,16 +118,16 @@ else:
         with cols[i % len(cols)]:
             with st.expander(term.title(), expanded=False):
                 st.write(KEY_DEFS[term])
-            st.session_state.s_vocab_ack[term] = st.checkbox(
+            S.s_vocab_ack[term] = st.checkbox(
                 f"I understand **{term}**",
-                value=st.session_state.s_vocab_ack.get(term, False),
+                value=S.s_vocab_ack.get(term, False),
                 key=f"ack_{term}"
             )
 
-core_ok = all(st.session_state.s_vocab_ack.get(t, False) for t in CORE_TERMS if t in st.session_state.s_vocab_ack)
+core_ok = all(S.s_vocab_ack.get(t, False) for t in CORE_TERMS if t in S.s_vocab_ack)
 if not core_ok:
     st.warning(f"Please acknowledge core terms: {', '.join(CORE_TERMS)}")
-    st.stop()
+    render.stop()
 
 st.success("✅ Core vocabulary acknowledged.")
 
@@ -202,30 +157,23 @@ st.markdown("#### Givens")
 cols_g = st.columns(2)
 for i, (label, _) in enumerate(GIVEN_ITEMS):
     with cols_g[i % 2]:
-        if st.checkbox(label, value=(label in st.session_state.s_given_sel), key=f"given_{i}"):
-            st.session_state.s_given_sel.add(label)
+        if st.checkbox(label, value=(label in S.s_given_sel), key=f"given_{i}"):
+            S.s_given_sel.add(label)
         else:
-            st.session_state.s_given_sel.discard(label)
+            S.s_given_sel.discard(label)
 
 st.markdown("#### Target")
 cols_t = st.columns(2)
 for j, (label, _) in enumerate(TARGET_ITEMS):
     with cols_t[j % 2]:
-        if st.checkbox(label, value=(label in st.session_state.s_target_sel), key=f"target_{j}"):
-            st.session_state.s_target_sel.add(label)
+        if st.checkbox(label, value=(label in S.s_target_sel), key=f"target_{j}"):
+            S.s_target_sel.add(label)
         else:
-            st.session_state.s_target_sel.discard(label)
-
-def grade_mcq(selected, items):
-    truth = {l: t for l, t in items}
-    correct = sum(1 for l in selected if truth.get(l, False))
-    wrong = sum(1 for l in selected if not truth.get(l, False))
-    total_true = sum(truth.values())
-    return (correct == total_true and wrong == 0), correct, wrong, total_true
+            S.s_target_sel.discard(label)
 
 if st.button("✅ Check Identifiers"):
-    g_ok, g_h, g_fp, g_tot = grade_mcq(st.session_state.s_given_sel, GIVEN_ITEMS)
-    t_ok, t_h, t_fp, t_tot = grade_mcq(st.session_state.s_target_sel, TARGET_ITEMS)
+    g_ok, g_h, g_fp, g_tot = grade_mcq(S.s_given_sel, GIVEN_ITEMS)
+    t_ok, t_h, t_fp, t_tot = grade_mcq(S.s_target_sel, TARGET_ITEMS)
 
     if g_ok: st.success(f"Givens correct ({g_h}/{g_tot})")
     else: st.warning(f"Givens: {g_h}/{g_tot} correct, {g_fp} wrong.")
@@ -233,37 +181,40 @@ if st.button("✅ Check Identifiers"):
     if t_ok: st.success(f"Targets correct ({t_h}/{t_tot})")
     else: st.warning(f"Targets: {t_h}/{t_tot} correct, {t_fp} wrong.")
 
-    if g_ok and t_ok:
-        st.session_state.S_done = True
-        st.session_state.unlock_T = True
-        st.rerun()
+    if record_attempt(PROBLEM_ID, 1, "✅ Check Identifiers", g_ok and t_ok):
+        S.S_done = True
+        S.unlock_T = True
+        render.rerun()
 
-if not st.session_state.S_done:
-    st.stop()
+if not S.S_done:
+    render.stop()
 
 # ======================================================
 # T — TRANSLATE: Diagram
 # ======================================================
-if st.session_state.unlock_T:
+if S.unlock_T:
+    render.step(2)
     st.header("T — Translate: Diagram the System")
     
     st.markdown("Draw the **Lever OA** on the canvas below at approximately 60°.")
     
-    if not _canvas_ok:
+    st_canvas = load_canvas()  # imported on first use
+    if st_canvas is None:
         st.warning("Canvas library missing. Please visualize the lever at 60°.")
-        st.session_state.T_done = True # skip
-        st.session_state.unlock_A = True
+        S.T_done = True # skip
+        S.unlock_A = True
     else:
         st.caption("Draw a single line representing the lever OA starting from the left side.")
         
         canvas_T = st_canvas(
             fill_color="rgba(0,0,0,0)", stroke_width=3, stroke_color="#111",
-            background_color="#fff", height=300, width=600, drawing_mode="line", key="T_canvas"
+            background_color="#fff", height=300, width=600, drawing_mode="line", key="T_canvas",
+            initial_drawing=initial_strokes("T_canvas")
         )
+        remember_strokes("T_canvas", canvas_T.json_data)
         
         # Analyze lines
-        objs = (canvas_T.json_data or {}).get("objects", [])
-        lines = [o for o in objs if o["type"] == "line"]
+        lines = extract_lines(canvas_T.json_data)
         
         if st.button("✅ Check Diagram"):
             if not lines:
@@ -271,31 +222,28 @@ if st.session_state.unlock_T:
             else:
                 valid_line = False
                 for l in lines:
-                    dx = l["x2"] - l["x1"]
-                    dy = l["y2"] - l["y1"]
-                    # canvas y is inverted (down is positive)
-                    # 60 deg up means dy is negative
-                    ang = math.degrees(math.atan2(-dy, dx))
-                    if ang < 0: ang += 360
-                    if 45 <= ang <= 75:
+                    # extract_lines already flips the canvas y-axis
+                    # (60 deg up means the line rises to the right)
+                    if 45 <= l["angle"] <= 75:
                         valid_line = True
                         break
                 
-                if valid_line:
+                if record_attempt(PROBLEM_ID, 2, "✅ Check Diagram", valid_line):
                     st.success("Diagram looks good! You drew the lever at the correct approximate angle.")
-                    st.session_state.T_done = True
-                    st.session_state.unlock_A = True
-                    st.rerun()
+                    S.T_done = True
+                    S.unlock_A = True
+                    render.rerun()
                 else:
                     st.warning("The angle doesn't look like 60°. Remember 60° is steeper than 45°. (Draw from O to A).")
 
-    if not st.session_state.T_done:
-        st.stop()
+    if not S.T_done:
+        render.stop()
 
 # ======================================================
 # A — ASSIGN: Conventions
 # ======================================================
-if st.session_state.unlock_A:
+if S.unlock_A:
+    render.step(3)
     st.header("A — Assign: Sign Conventions")
     
     st.markdown("Define your coordinate system and moment signs.")
@@ -313,17 +261,18 @@ if st.session_state.unlock_A:
     st.info("Typically, **CCW is Positive (+)** is the standard scientific convention.")
     
     if st.button("💾 Save & Continue"):
-        st.session_state.A_done = True
-        st.session_state.unlock_I = True
-        st.rerun()
+        S.A_done = True
+        S.unlock_I = True
+        render.rerun()
 
-    if not st.session_state.A_done:
-        st.stop()
+    if not S.A_done:
+        render.stop()
 
 # ======================================================
 # I — IMPLEMENT: Geometry & Equations
 # ======================================================
-if st.session_state.unlock_I:
+if S.unlock_I:
+    render.step(5)
     st.header("I — Implement: Geometry & Equations")
 
     # --- MATH REFRESHER START ---
@@ -352,8 +301,9 @@ if st.session_state.unlock_I:
     theta = 60.0
     
     # Calculate True Values for checking
-    rx_true = L * math.cos(math.radians(theta)) # 12
-    ry_true = L * math.sin(math.radians(theta)) # 20.78
+    lever = solve_lever_moment(L, theta)
+    rx_true = lever["rx"] # 12
+    ry_true = lever["ry"] # 20.78
     
     st.markdown("#### 1. Geometry Calculation")
     st.caption(f"Resolve the position of A relative to O (where L={L}, θ={theta}°).")
@@ -397,13 +347,13 @@ if st.session_state.unlock_I:
         # Check Equation Logic (Vertical force needs Horizontal moment arm)
         ok_eq = "Horizontal Distance" in eq_type
         
-        if ok_x and ok_y and ok_eq:
+        if record_attempt(PROBLEM_ID, 5, "✅ Check Implementation", ok_x and ok_y and ok_eq):
             st.success("Geometry and Logic are correct!")
-            st.session_state.I_done = True
-            st.session_state.unlock_C = True
-            st.session_state.rx_val = rx_in
-            st.session_state.ry_val = ry_in
-            st.rerun()
+            S.I_done = True
+            S.unlock_C = True
+            S.rx_val = rx_in
+            S.ry_val = ry_in
+            render.rerun()
         else:
             msg = ""
             if not ok_x: msg += f"Check horizontal distance ($d_x = L \\cos\\theta$). "
@@ -411,19 +361,21 @@ if st.session_state.unlock_I:
             if not ok_eq: msg += "For a VERTICAL force, the line of action is vertical. The perpendicular distance to it is HORIZONTAL."
             st.warning(msg)
 
-    if not st.session_state.I_done:
-        st.stop()
+    if not S.I_done:
+        render.stop()
 
 # ======================================================
 # C — COMPUTE
 # ======================================================
-if st.session_state.unlock_C:
+if S.unlock_C:
+    render.step(6)
     st.header("C — Compute")
     
-    rx = st.session_state.rx_val
-    ry = st.session_state.ry_val
+    rx = S.rx_val
+    ry = S.ry_val
     Fv = 100.0
     M_mag_true = Fv * rx
+    M_dir_true = solve_lever_moment()["M_dir"]
     
     st.subheader("Part 1: Moment of the Vertical Force")
     
@@ -477,7 +429,7 @@ if st.session_state.unlock_C:
     if st.button("✅ Verify Results"):
         # Check Moment
         ok_M_mag = abs(M_user - M_mag_true) < (M_mag_true * 0.05) # 5% tol
-        ok_M_dir = M_dir == "Clockwise (CW)" 
+        ok_M_dir = M_dir == M_dir_true
         
         # Check Force H
         if ry > 0:
@@ -486,29 +438,30 @@ if st.session_state.unlock_C:
         else:
             ok_Fh = False
             
-        if ok_M_mag and ok_M_dir and ok_Fh:
+        if record_attempt(PROBLEM_ID, 6, "✅ Verify Results", ok_M_mag and ok_M_dir and ok_Fh):
             st.success("🎉 Calculations Correct! Part 1 and 2 are solved.")
-            st.session_state.C_done = True
-            st.session_state.unlock_S = True
-            st.session_state.final_M = M_user
-            st.session_state.final_Fh = Fh_user
-            st.rerun()
+            S.C_done = True
+            S.unlock_S = True
+            S.final_M = M_user
+            S.final_Fh = Fh_user
+            render.rerun()
         else:
             if not ok_M_mag: st.warning(f"Moment Magnitude incorrect. Check $100 \\times {rx:.1f}$.")
             if not ok_M_dir: st.warning("Check rotation direction. Visualize the clock hand.")
             if not ok_Fh: st.warning(f"Horizontal force incorrect. Did you divide Moment by the vertical distance ($d_y$)?")
 
-    if not st.session_state.C_done:
-        st.stop()
+    if not S.C_done:
+        render.stop()
 
 # ======================================================
 # S — SANITY CHECK
 # ======================================================
-if st.session_state.unlock_S:
+if S.unlock_S:
+    render.step(7)
     st.header("S — Sanity Check")
     
-    M_res = st.session_state.final_M
-    Fh_res = st.session_state.final_Fh
+    M_res = S.final_M
+    Fh_res = S.final_Fh
     
     st.markdown("### Intuition Check")
     
@@ -524,4 +477,10 @@ if st.session_state.unlock_S:
             st.success("✅ Correct! 57.7 lb < 100 lb. Physics holds up.")
             st.balloons()
         else:
-            st.error("Wait... your result is > 100 lb but your logic says it should be smaller. Check math!")
\ No newline at end of file
+            st.error("Wait... your result is > 100 lb but your logic says it should be smaller. Check math!")
+
+    units_check(PROBLEM_ID)
+
+    what_if(PROBLEM_ID)
+
+render.finish()
\ No newline at end of file
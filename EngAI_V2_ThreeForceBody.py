@@ -3,14 +3,12 @@ import time
 from datetime import timedelta
 import math
 
-# Try to import drawable canvas
-try:
-    from streamlit_drawable_canvas import st_canvas
-    _canvas_ok = True
-except ImportError:
-    _canvas_ok = False
+from statics_core import grade_mcq, within, count_canvas_lines, solve_three_force_tank, load_glossary
+from statics_ui import problem_state, reset_state, initial_strokes, remember_strokes, record_attempt, RenderTimer, load_canvas, show_diagram, units_check, what_if
 
 st.set_page_config(page_title="STATICS Method — Tank Problem", page_icon="🛢️", layout="centered")
+PROBLEM_ID = "tank"
+render = RenderTimer(PROBLEM_ID)
 
 # ----------------------------
 # 1. PROBLEM DEFINITION (Always Visible)
@@ -30,80 +28,70 @@ st.divider()
 # ----------------------------
 # 2. STATE MANAGEMENT
 # ----------------------------
-if "step_idx" not in st.session_state:
-    st.session_state.step_idx = 0
-if "start_time" not in st.session_state:
-    st.session_state.start_time = None
-if "timer_finished" not in st.session_state:
-    st.session_state.timer_finished = False
-if "vocab_idx" not in st.session_state:
-    st.session_state.vocab_idx = 0
-if "s_given_sel" not in st.session_state:
-    st.session_state.s_given_sel = set()
+# Fields and defaults live in statics_core.state; resumed from the progress store
+S = problem_state(PROBLEM_ID)
 
 # Study Timer Duration (3 mins)
 STUDY_DURATION = 180 
 
-VOCAB = [
-    {"term": "Three-Force Principle", "def": "If a body is in equilibrium under 3 forces, their lines of action must meet at a single point (Concurrency)."},
-    {"term": "Point of Concurrency", "def": "The intersection point. Here, Weight (Vertical) and Tension (Horizontal) meet at the top of the tank."},
-    {"term": "Isosceles Triangle", "def": "A triangle with two equal sides. The base angles are equal. This is the key to solving the geometry!"},
-    {"term": "Impending Motion", "def": "The tank is about to lift off, so the floor reaction at B is zero."}
-]
+# Reference answers: 500 lb tank, 8 ft diameter, 2 ft obstruction
+TANK = solve_three_force_tank(W=500.0, diameter=8.0, obstruction=2.0)
+
+VOCAB = load_glossary().cards(PROBLEM_ID)  # shared, read-only cards
 
 # ----------------------------
 # 3. SIDEBAR RESET
 # ----------------------------
 if st.sidebar.button("🔄 Reset Problem"):
-    st.session_state.clear()
-    st.rerun()
+    S = reset_state(PROBLEM_ID)
+    render.rerun()
 
 # ----------------------------
 # STEP 0: START
 # ----------------------------
-if st.session_state.step_idx == 0:
+if S.step_idx == 0:
     if st.button("▶️ Begin STATICS Method"):
-        st.session_state.step_idx = 1
-        st.session_state.start_time = time.time()
-        st.rerun()
-    st.stop()
+        S.step_idx = 1
+        S.start_time = time.time()
+        render.rerun()
+    render.stop()
 
 # ======================================================
 # S — STUDY (Step 1)
 # ======================================================
-if st.session_state.step_idx >= 1:
+if S.step_idx >= 1:
+    render.step(1)
     st.header("S — Study & Vocabulary")
     
     # --- Timer ---
     timer_placeholder = st.empty()
-    if not st.session_state.timer_finished:
-        elapsed = time.time() - st.session_state.start_time
+    if not S.timer_finished:
+        elapsed = time.time() - S.start_time
         remaining = STUDY_DURATION - int(elapsed)
         if remaining <= 0:
-            st.session_state.timer_finished = True
-            st.rerun()
+            S.timer_finished = True
+            render.rerun()
         timer_placeholder.warning(f"⏳ **Focus Period:** {str(timedelta(seconds=remaining))[2:7]} remaining.")
         if st.button("⏭️ Skip Timer"):
-            st.session_state.timer_finished = True
-            st.rerun()
-        time.sleep(1)
-        st.rerun()
+            S.timer_finished = True
+            render.rerun()
+        render.tick()
     else:
         timer_placeholder.success("✅ Study time complete!")
 
     # --- Flashcards ---
     with st.container(border=True):
-        st.subheader(f"Vocabulary Card {st.session_state.vocab_idx + 1}/{len(VOCAB)}")
-        card = VOCAB[st.session_state.vocab_idx]
+        st.subheader(f"Vocabulary Card {S.vocab_idx + 1}/{len(VOCAB)}")
+        card = VOCAB[S.vocab_idx]
         st.markdown(f"**{card['term']}**")
         st.write(card['def'])
         c1, c2 = st.columns(2)
-        if c1.button("⬅️ Prev") and st.session_state.vocab_idx > 0:
-            st.session_state.vocab_idx -= 1
-            st.rerun()
-        if c2.button("Next ➡️") and st.session_state.vocab_idx < len(VOCAB)-1:
-            st.session_state.vocab_idx += 1
-            st.rerun()
+        if c1.button("⬅️ Prev") and S.vocab_idx > 0:
+            S.vocab_idx -= 1
+            render.rerun()
+        if c2.button("Next ➡️") and S.vocab_idx < len(VOCAB)-1:
+            S.vocab_idx += 1
+            render.rerun()
 
     # --- Givens ---
     st.write("#### Identify Key Parameters")
@@ -118,25 +106,26 @@ if st.session_state.step_idx >= 1:
     cols_g = st.columns(2)
     for i, (txt, is_correct) in enumerate(GIVEN_OPTS):
         with cols_g[i % 2]:
-            if st.checkbox(txt, value=(txt in st.session_state.s_given_sel), key=f"g_{i}"):
-                st.session_state.s_given_sel.add(txt)
+            if st.checkbox(txt, value=(txt in S.s_given_sel), key=f"g_{i}"):
+                S.s_given_sel.add(txt)
             else:
-                st.session_state.s_given_sel.discard(txt)
+                S.s_given_sel.discard(txt)
 
-    if st.session_state.step_idx == 1 and st.session_state.timer_finished:
+    if S.step_idx == 1 and S.timer_finished:
         if st.button("Check & Continue to T"):
-            correct = sum(1 for t, c in GIVEN_OPTS if c and t in st.session_state.s_given_sel)
-            if correct == 5:
+            all_ok, _, _, _ = grade_mcq(S.s_given_sel, GIVEN_OPTS)
+            if record_attempt(PROBLEM_ID, 1, "Check & Continue to T", all_ok):
                 st.success("Correct parameters identified.")
-                st.session_state.step_idx = 2
-                st.rerun()
+                S.step_idx = 2
+                render.rerun()
             else:
                 st.warning("Please ensure you have selected all valid parameters.")
 
 # ======================================================
 # T — TRANSLATE (Step 2: Diagramming)
 # ======================================================
-if st.session_state.step_idx >= 2:
+if S.step_idx >= 2:
+    render.step(2)
     st.divider()
     st.header("T — Translate")
 
@@ -168,22 +157,25 @@ if st.session_state.step_idx >= 2:
         st.subheader("2. Draw the Force Triangle")
         st.info("Now, construct the vector triangle. Since the body is in equilibrium, the vectors must form a closed path.")
         
-        if _canvas_ok:
+        st_canvas = load_canvas()  # imported on first use
+        if st_canvas is not None:
             st.caption("Use the **Line Tool** to draw $W$ (Down), $T$ (Left), and $R_A$ (Closing the triangle).")
             # Force Triangle Canvas
             canvas_tri = st_canvas(
                 stroke_width=3, stroke_color="#000", background_color="#fff",
-                height=300, width=500, drawing_mode="line", display_toolbar=True, key="canvas_tri_only"
+                height=300, width=500, drawing_mode="line", key="canvas_tri_only",
+                initial_drawing=initial_strokes("canvas_tri_only")
             )
+            remember_strokes("canvas_tri_only", canvas_tri.json_data)
 
             if st.button("Check Triangle"):
                 # Rough check: line counts
-                num_tri = len(canvas_tri.json_data["objects"]) if canvas_tri.json_data else 0
+                num_tri = count_canvas_lines(canvas_tri.json_data)
                 
-                if num_tri >= 3:
+                if record_attempt(PROBLEM_ID, 2, "Check Triangle", num_tri >= 3):
                     st.success("Vector Triangle looks populated. Let's solve the geometry.")
-                    st.session_state.step_idx = 3
-                    st.rerun()
+                    S.step_idx = 3
+                    render.rerun()
                 else:
                     st.error(f"Detected {num_tri} lines. Please draw at least 3 vectors to close the triangle.")
     else:
@@ -192,24 +184,25 @@ if st.session_state.step_idx >= 2:
 # ======================================================
 # A — ASSIGN (Step 3: Geometry of Angles)
 # ======================================================
-if st.session_state.step_idx >= 3:
+if S.step_idx >= 3:
+    render.step(3)
     st.divider()
     st.header("A — Assign Geometry")
     
     st.write("To solve the Force Triangle, we need the angle of Reaction A.")
     st.info("We will use the physical geometry of the tank (Radius & Obstruction Height) to find this angle.")
     
-    st.image("https://i.imgur.com/Jo3xYgI.jpeg", caption="Radius geometry", use_container_width=True) 
-    # (Note: In a real app, ensure this URL is valid or remove image)
+    show_diagram("tank_radius", caption="Radius geometry", width="stretch")
     
     if st.button("I'm ready to Calculate Angles"):
-        st.session_state.step_idx = 4
-        st.rerun()
+        S.step_idx = 4
+        render.rerun()
 
 # ======================================================
 # I — IMPLEMENT (Step 4: Solving for Angles)
 # ======================================================
-if st.session_state.step_idx >= 4:
+if S.step_idx >= 4:
+    render.step(5)
     st.divider()
     st.header("I — Implement Equations")
     
@@ -227,14 +220,14 @@ if st.session_state.step_idx >= 4:
     alpha_in = st.number_input("Calculate angle $\\alpha$ (degrees):", min_value=0.0, max_value=90.0)
     
     if st.button("Check Alpha"):
-        if abs(alpha_in - 60.0) < 1.0:
+        if record_attempt(PROBLEM_ID, 5, "Check Alpha", within(alpha_in, TANK["alpha"], 1.0)):
             st.success("Correct! $\\alpha = 60^{\\circ}$.")
-            st.session_state.alpha_correct = True
+            S.alpha_correct = True
         else:
             st.error("Not quite. Check your SOH CAH TOA logic.")
 
     # --- Step 2: Theta ---
-    if st.session_state.get("alpha_correct"):
+    if S.alpha_correct:
         st.divider()
         st.subheader("Step 2: Find the Reaction Angle $\\theta$")
         
@@ -257,11 +250,11 @@ if st.session_state.step_idx >= 4:
             
             if st.button("Check Theta"):
                 # Angle at G = 120. Sum = 180. 2*theta = 60. theta = 30.
-                if abs(theta_in - 30.0) < 1.0:
+                if record_attempt(PROBLEM_ID, 5, "Check Theta", within(theta_in, TANK["theta"], 1.0)):
                     st.success("Perfect. $\\theta = 30^{\\circ}$.")
-                    st.session_state.theta_correct = True
-                    st.session_state.step_idx = 5
-                    st.rerun()
+                    S.theta_correct = True
+                    S.step_idx = 5
+                    render.rerun()
                 else:
                     st.warning("Check the math: Angle at G is $120^{\\circ}$. Sum of angles is $180^{\\circ}$.")
         elif q_geo:
@@ -270,7 +263,8 @@ if st.session_state.step_idx >= 4:
 # ======================================================
 # C — COMPUTE (Step 5: Solve Triangle)
 # ======================================================
-if st.session_state.step_idx >= 5:
+if S.step_idx >= 5:
+    render.step(6)
     st.divider()
     st.header("C — Compute Results")
     
@@ -279,7 +273,7 @@ if st.session_state.step_idx >= 5:
     st.write("2. $T$ (Horizontal)")
     st.write("3. Angle of Reaction $R_A$ is $\\theta = 30^{\\circ}$ from the vertical.")
     
-    st.image("https://i.imgur.com/jlJ6Zud.jpeg", caption="Force Triangle Sketch")
+    show_diagram("tank_triangle", caption="Force Triangle Sketch")
 
     # --- Part 1: Tension ---
     st.subheader("Part 1: Solve for Tension T")
@@ -292,14 +286,14 @@ if st.session_state.step_idx >= 5:
     t_input = st.number_input("Enter your calculated Tension T (lbs):", min_value=0.0)
     
     if st.button("Check Tension"):
-        if abs(t_input - 289.0) < 2.0:
+        if record_attempt(PROBLEM_ID, 6, "Check Tension", within(t_input, TANK["T"], 2.0)):
             st.success("CORRECT! Tension $T \\approx 289$ lbs.")
-            st.session_state.tension_correct = True
+            S.tension_correct = True
         else:
             st.error("Incorrect. Check your trig function and angle ($30^{\\circ}$).")
 
     # --- Part 2: Reaction A ---
-    if st.session_state.get("tension_correct"):
+    if S.tension_correct:
         st.divider()
         st.subheader("Part 2: Solve for Reaction Force $R_A$")
         st.markdown("**Now find the hypotenuse of the Force Triangle ($R_A$).**")
@@ -311,18 +305,19 @@ if st.session_state.step_idx >= 5:
         
         if st.button("Check Reaction Force"):
             # Ra = W / cos(30) = 500 / 0.866 = 577.35
-            if abs(ra_input - 577.0) < 5.0:
+            if record_attempt(PROBLEM_ID, 6, "Check Reaction Force", within(ra_input, TANK["R_A"], 5.0)):
                 st.balloons()
                 st.success("CORRECT! Reaction $R_A \\approx 577$ lbs.")
-                st.session_state.step_idx = 6
-                st.rerun()
+                S.step_idx = 6
+                render.rerun()
             else:
                 st.error("Incorrect. Remember $R_A$ is the hypotenuse, so it should be larger than $W$.")
 
 # ======================================================
 # S — SANITY CHECK (Step 6)
 # ======================================================
-if st.session_state.step_idx >= 6:
+if S.step_idx >= 6:
+    render.step(7)
     st.divider()
     st.header("S — Sanity Check")
     
@@ -336,6 +331,12 @@ if st.session_state.step_idx >= 6:
     * **Reaction > Weight:** The ground must push up hard to counteract both the Weight's downward pull and the Tension's tendency to drive the corner into the ground.
     """)
     
+    units_check(PROBLEM_ID)
+    
+    what_if(PROBLEM_ID)
+
     if st.button("Start New Problem"):
-        st.session_state.clear()
-        st.rerun()
\ No newline at end of file
+        S = reset_state(PROBLEM_ID)
+        render.rerun()
+
+render.finish()
\ No newline at end of file
@@ -0,0 +1 @@
+"""Benchmarks that drive the Streamlit apps in-process (streamlit.testing)."""
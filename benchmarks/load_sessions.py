@@ -0,0 +1,255 @@
+"""Concurrent-session load generator.
+
+Simulates many students walking the STATICS steps at once and reports what a
+server process can sustain: throughput, tail latency and CPU per session.
+
+Each worker process plays the part of one Streamlit server process. It holds
+its share of the sessions (one AppTest each, replaying benchmarks/scenarios.py)
+and runs their reruns one at a time in due order -- a Streamlit server runs
+scripts under one GIL too, and AppTest is not thread-safe. A rerun becomes due
+a think time after the student's previous one finished; if the worker is busy
+it waits, so reported latency (due -> rendered) includes queueing and grows
+as the worker saturates, while service time is the rerun alone.
+
+Study timers: with --timer tick a session reruns once a second for
+--study-seconds after starting the method, as the apps' focus timer does;
+with --timer skip the student skips the timer. Each tick is a plain rerun of
+the Study page (the scenario pre-finishes the timer so AppTest does not spin
+in its sleep loop), which is what a tick costs the server.
+
+Think times (log-normal around --think seconds) and the timer interval are
+multiplied by --time-scale so a run takes minutes rather than an hour; the
+number of timer ticks is not scaled.
+
+The workers share one temporary data directory per run
+(scenarios.isolated_data_dir), so the simulated students never reach the real
+event log and progress store.
+
+    python -m benchmarks.load_sessions --sessions 200 --workers 4
+    python -m benchmarks.load_sessions --timer skip --modules EngAI_V2.py
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.scenarios import SCENARIOS, check_step, isolated_data_dir, new_app
+from statics_core.config import data_dir
+
+THINK_SIGMA = 0.6           # spread of the log-normal think time
+
+
+# ----------------------------
+# One worker: an event loop over its sessions
+# ----------------------------
+def _plan(module, timer, study_seconds):
+    """[(kind, step, action, checks)] for one session; kind is "load", "action" or "tick".
+
+    checks is the step's list of scenario checks on its last action, else ().
+    """
+    plan = [("load", 1, None, ())]
+    for step, actions, checks in SCENARIOS[module][1]:
+        actions = actions or [None]
+        for i, action in enumerate(actions):
+            plan.append(("action", step, action, checks if i == len(actions) - 1 else ()))
+            if step == 1 and i == 0 and timer == "tick":
+                # the Begin/Start click starts the focus timer
+                plan.extend(("tick", 1, None, ()) for _ in range(study_seconds))
+    return plan
+
+
+def run_worker(sessions, opts):
+    """Run [(session id, module, start offset)] and return raw measurements."""
+    rng = random.Random(opts["seed"] * 7919 + len(sessions))
+    scale = opts["time_scale"]
+    think = opts["think"]
+
+    def think_time():
+        return rng.lognormvariate(math.log(think), THINK_SIGMA) * scale
+
+    t0 = time.perf_counter()
+    queue = []                  # (due, session id)
+    state = {}
+    for sid, module, offset in sessions:
+        state[sid] = {"module": module, "plan": _plan(module, opts["timer"], opts["study_seconds"]),
+                      "pos": 0, "at": None, "cpu": 0.0}
+        heapq.heappush(queue, (t0 + offset, sid))
+
+    samples = []                # (module, kind, latency, service)
+    done = []                   # (sid, module, ok, cpu, error)
+    cpu0 = time.process_time()
+    while queue:
+        due, sid = heapq.heappop(queue)
+        s = state[sid]
+        wait = due - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+        kind, step, action, checks = s["plan"][s["pos"]]
+        c0 = time.process_time()
+        start = time.perf_counter()
+        error = None
+        try:
+            if kind == "load":
+                s["at"] = new_app(s["module"], timeout=opts["timeout"])
+            elif action is not None:
+                action(s["at"])
+            s["at"].run()
+            if s["at"].exception:
+                error = f"step {step}: {s['at'].exception[0].value}"
+            else:
+                check_step(s["at"], s["module"], step, checks)
+        except Exception as exc:        # scenario no longer matches the app, or a timeout
+            error = f"step {step}: {type(exc).__name__}: {exc}"
+        end = time.perf_counter()
+        s["cpu"] += time.process_time() - c0
+        samples.append((s["module"], kind, end - due, end - start))
+
+        s["pos"] += 1
+        if error is not None or s["pos"] == len(s["plan"]):
+            done.append((sid, s["module"], error is None, s["cpu"], error))
+            del state[sid]              # frees the AppTest
+            continue
+        next_kind = s["plan"][s["pos"]][0]
+        gap = scale if next_kind == "tick" else think_time()
+        heapq.heappush(queue, (end + gap, sid))
+
+    return {
+        "samples": samples,
+        "sessions": done,
+        "cpu": time.process_time() - cpu0,
+        "wall": time.perf_counter() - t0,
+    }
+
+
+def _worker_entry(args):
+    sessions, opts = args
+    return run_worker(sessions, opts)
+
+
+# ----------------------------
+# Driver and report
+# ----------------------------
+def _pct(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _ms(x):
+    return None if x is None else round(x * 1e3, 1)
+
+
+def summarise(results, wall, opts):
+    samples = [s for r in results for s in r["samples"]]
+    sessions = [s for r in results for s in r["sessions"]]
+    interactive = [lat for _, kind, lat, _ in samples if kind != "tick"]
+    service = [svc for _, kind, _, svc in samples if kind != "tick"]
+    ticks = [lat for _, kind, lat, _ in samples if kind == "tick"]
+    ok = [s for s in sessions if s[2]]
+    cpu = [s[3] for s in sessions]
+    total_cpu = sum(r["cpu"] for r in results)
+
+    per_module = defaultdict(lambda: {"sessions": 0, "failed": 0, "cpu": [], "latency": []})
+    for _, module, passed, cpu_s, _ in sessions:
+        m = per_module[module]
+        m["sessions"] += 1
+        m["failed"] += not passed
+        m["cpu"].append(cpu_s)
+    for module, kind, lat, _ in samples:
+        if kind != "tick":
+            per_module[module]["latency"].append(lat)
+
+    return {
+        "options": opts,
+        "wall_s": round(wall, 2),
+        "sessions": len(sessions),
+        "completed": len(ok),
+        "failures": sorted({s[4] for s in sessions if not s[2]})[:20],
+        "reruns": len(samples),
+        "reruns_per_s": round(len(samples) / wall, 2),
+        "sessions_per_min": round(len(ok) / wall * 60, 2),
+        "latency_ms": {q: _ms(_pct(interactive, p))
+                       for q, p in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))},
+        "service_ms": {q: _ms(_pct(service, p)) for q, p in (("p50", 0.5), ("p95", 0.95))},
+        "timer_tick_ms": {q: _ms(_pct(ticks, p)) for q, p in (("p50", 0.5), ("p95", 0.95))},
+        "cpu_per_session_s": {"mean": round(sum(cpu) / len(cpu), 3) if cpu else None,
+                              "p95": _pct(cpu, 0.95) and round(_pct(cpu, 0.95), 3)},
+        "cpu_utilisation": round(total_cpu / (wall * opts["workers"]), 3),
+        "modules": {
+            module: {
+                "sessions": m["sessions"],
+                "failed": m["failed"],
+                "cpu_per_session_s": round(sum(m["cpu"]) / len(m["cpu"]), 3),
+                "latency_p95_ms": _ms(_pct(m["latency"], 0.95)),
+            }
+            for module, m in sorted(per_module.items())
+        },
+    }
+
+
+def run(opts):
+    """Spread the sessions over the worker processes and summarise the run."""
+    rng = random.Random(opts["seed"])
+    modules = opts["modules"]
+    shares = [[] for _ in range(opts["workers"])]
+    for i in range(opts["sessions"]):
+        offset = rng.uniform(0, opts["ramp"])
+        shares[i % opts["workers"]].append((i, modules[i % len(modules)], offset))
+    t0 = time.perf_counter()
+    with isolated_data_dir(), ProcessPoolExecutor(opts["workers"]) as pool:
+        results = list(pool.map(_worker_entry, [(share, opts) for share in shares if share]))
+    return summarise(results, time.perf_counter() - t0, opts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent student sessions.")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (server processes being modelled)")
+    parser.add_argument("--modules", nargs="*", default=sorted(SCENARIOS))
+    parser.add_argument("--think", type=float, default=8.0, help="median think time, seconds")
+    parser.add_argument("--timer", choices=("tick", "skip"), default="tick")
+    parser.add_argument("--study-seconds", type=int, default=180)
+    parser.add_argument("--time-scale", type=float, default=0.05)
+    parser.add_argument("--ramp", type=float, default=10.0, help="seconds over which sessions start")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", type=str)
+    args = parser.parse_args(argv)
+
+    opts = {k: v for k, v in vars(args).items() if k != "out"}
+    opts["workers"] = max(1, min(args.workers, args.sessions))
+    report = run(opts)
+
+    out = args.out or data_dir() / "bench" / f"load-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    lat = report["latency_ms"]
+    print(f"{report['completed']}/{report['sessions']} sessions in {report['wall_s']}s "
+          f"on {opts['workers']} workers (timer={opts['timer']})")
+    print(f"throughput   {report['reruns_per_s']} reruns/s, {report['sessions_per_min']} sessions/min")
+    print(f"latency ms   p50 {lat['p50']}  p95 {lat['p95']}  p99 {lat['p99']}  max {lat['max']}")
+    print(f"service ms   p50 {report['service_ms']['p50']}  p95 {report['service_ms']['p95']}")
+    print(f"CPU/session  {report['cpu_per_session_s']['mean']}s mean, "
+          f"utilisation {report['cpu_utilisation']:.0%}")
+    for module, m in report["modules"].items():
+        print(f"  {module:32s} {m['sessions']:4d} sessions  {m['failed']} failed  "
+              f"{m['cpu_per_session_s']:.2f}s CPU  p95 {m['latency_p95_ms']} ms")
+    for failure in report["failures"]:
+        print("FAILED", failure)
+    print(f"report: {out}")
+    return 1 if report["completed"] < report["sessions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""Per-module rerun latency benchmark.
+
+Replays every scenario in benchmarks/scenarios.py with streamlit's AppTest and
+records, for each app:
+
+* cold start -- first run of the app in a fresh interpreter (its imports and
+  first render), measured in a subprocess;
+* per-step rerun latency -- median and max over every rerun of that step,
+  across --repeat replays;
+* per-step peak memory -- tracemalloc peak while the step's reruns execute
+  (measured in a separate replay so tracing does not skew the timings).
+
+The apps run against a temporary data directory (scenarios.isolated_data_dir).
+Results are written as JSON (default: <data dir>/bench/rerun_latency.json) and
+compared with benchmarks/baseline.json; any metric beyond its tolerance is a
+regression and the run exits with status 1.
+
+    python -m benchmarks.rerun_latency                  # run and compare
+    python -m benchmarks.rerun_latency --update-baseline
+    python -m benchmarks.rerun_latency --modules EngAI_V2.py --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit
+
+from benchmarks.scenarios import REPO, SCENARIOS, check_step, isolated_data_dir, new_app
+from statics_core.config import data_dir
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+TIME_TOLERANCE = 0.5        # +50 % on latency / cold start
+TIME_SLACK_MS = 1.0         # ignore sub-millisecond noise on fast reruns
+MEMORY_TOLERANCE = 0.25     # +25 % on peak memory
+MEMORY_SLACK_KIB = 256
+
+
+# ----------------------------
+# Measurements
+# ----------------------------
+def cold_start(module):
+    """Seconds for the first run of module in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.rerun_latency", "--cold", module],
+        cwd=REPO, capture_output=True, text=True, check=True,
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def _cold_child(module):
+    at = new_app(module)
+    t0 = time.perf_counter()
+    at.run()
+    print(time.perf_counter() - t0)
+
+
+def replay(module, trace_memory=False):
+    """Replay a scenario; {step: {"times": [...], "peak": bytes, "errors": n}}.
+
+    Raises scenarios.ScenarioError if a step is not passed after its actions.
+    """
+    _, steps = SCENARIOS[module]
+    at = new_app(module)
+    at.run()
+    if trace_memory:
+        tracemalloc.start()
+    results = {}
+    try:
+        for step, actions, checks in steps:
+            rec = results.setdefault(step, {"times": [], "peak": 0, "errors": 0})
+            if trace_memory:
+                # Garbage left by earlier steps or modules would otherwise be
+                # freed at an arbitrary point and shift this step's peak
+                gc.collect()
+                tracemalloc.reset_peak()
+            # a step with no inputs is still rendered once
+            for action in actions or [None]:
+                if action is not None:
+                    action(at)
+                t0 = time.perf_counter()
+                at.run()
+                rec["times"].append(time.perf_counter() - t0)
+                rec["errors"] += len(at.exception)
+            if trace_memory:
+                rec["peak"] = max(rec["peak"], tracemalloc.get_traced_memory()[1])
+            check_step(at, module, step, checks)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return results
+
+
+def bench_module(module, repeat):
+    times = {}
+    errors = {}
+    for _ in range(repeat):
+        for step, rec in replay(module).items():
+            times.setdefault(step, []).extend(rec["times"])
+            errors[step] = max(errors.get(step, 0), rec["errors"])
+    memory = replay(module, trace_memory=True)
+    steps = {}
+    for step, samples in times.items():
+        steps[str(step)] = {
+            "reruns": len(samples) // repeat,
+            "median_ms": round(statistics.median(samples) * 1e3, 3),
+            "max_ms": round(max(samples) * 1e3, 3),
+            "peak_kib": round(memory[step]["peak"] / 1024, 1),
+            "errors": errors[step],
+        }
+    return {"cold_start_s": round(cold_start(module), 4), "steps": steps}
+
+
+# ----------------------------
+# Baseline comparison
+# ----------------------------
+def regressions(results, baseline):
+    """Human-readable list of metrics that are worse than the baseline allows."""
+    found = []
+    for module, res in results["modules"].items():
+        base = baseline.get("modules", {}).get(module)
+        if base is None:
+            continue
+        limit = base["cold_start_s"] * (1 + TIME_TOLERANCE)
+        if res["cold_start_s"] > limit:
+            found.append(f"{module}: cold start {res['cold_start_s']:.3f}s > {limit:.3f}s")
+        for step, cur in res["steps"].items():
+            ref = base["steps"].get(step)
+            if ref is None:
+                continue
+            limit = ref["median_ms"] * (1 + TIME_TOLERANCE) + TIME_SLACK_MS
+            if cur["median_ms"] > limit:
+                found.append(f"{module} step {step}: median rerun {cur['median_ms']:.1f} ms > {limit:.1f} ms")
+            limit = ref["peak_kib"] * (1 + MEMORY_TOLERANCE) + MEMORY_SLACK_KIB
+            if cur["peak_kib"] > limit:
+                found.append(f"{module} step {step}: peak memory {cur['peak_kib']:.0f} KiB > {limit:.0f} KiB")
+            if cur["errors"] > ref["errors"]:
+                found.append(f"{module} step {step}: {cur['errors']} script errors (baseline {ref['errors']})")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="*", default=sorted(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--cold", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.cold:
+        _cold_child(args.cold)
+        return 0
+
+    out = args.out or data_dir() / "bench" / "rerun_latency.json"
+    results = {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "modules": {},
+    }
+    with isolated_data_dir():
+        for module in args.modules:
+            results["modules"][module] = bench_module(module, args.repeat)
+            res = results["modules"][module]
+            worst = max(s["median_ms"] for s in res["steps"].values())
+            print(f"{module:32s} cold {res['cold_start_s']:.3f}s  slowest step median {worst:.1f} ms")
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    print(f"results: {out}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline updated: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print("no baseline; run with --update-baseline to create one")
+        return 0
+    found = regressions(results, json.loads(args.baseline.read_text()))
+    for line in found:
+        print("REGRESSION", line)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
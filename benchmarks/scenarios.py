@@ -0,0 +1,364 @@
+"""Scripted student walkthroughs of each app, for streamlit.testing.
+
+A scenario is the app file, the session state to seed before the first run
+and a list of (step, actions, checks) for the seven STATICS steps. Each action
+changes one widget (or clicks a button) and is followed by one rerun, so
+replaying a scenario reruns the app exactly as a student answering correctly
+would. The checks run after the step's last rerun and raise ScenarioError
+unless the step was passed (its flags set, its success message shown): a
+broken gate would otherwise make the remaining reruns cheaper and still pass.
+
+The canvas component returns no drawing under AppTest, so the diagram steps
+set the step index / unlock flags the Check button would have set, on the
+app's statics_core.state object. The focus timer is marked finished up front
+because its countdown reruns the script once a second.
+
+The benchmarks replay scenarios inside isolated_data_dir(), so the attempts
+and checkpoints they generate never reach the real event log and progress
+store (where the analytics job would count them as students).
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from statics_core.progress import get_progress_store
+from statics_core.state import state_class
+from statics_core.telemetry import get_event_log
+from statics_ui.progress import STATE_KEY
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+class ScenarioError(AssertionError):
+    pass
+
+
+def _find(at, kind, label):
+    for w in getattr(at, kind):
+        if w.label is not None and w.label.startswith(label):
+            return w
+    raise ScenarioError(f"no {kind} labelled {label!r}")
+
+
+# ----------------------------
+# Actions: each takes the AppTest and leaves one rerun pending
+# ----------------------------
+def click(label):
+    return lambda at: _find(at, "button", label).click()
+
+
+def number(label, value):
+    return lambda at: _find(at, "number_input", label).set_value(value)
+
+
+def choose(label, value):
+    def act(at):
+        for kind in ("radio", "selectbox"):
+            try:
+                return _find(at, kind, label).set_value(value)
+            except ScenarioError:
+                pass
+        raise ScenarioError(f"no radio/selectbox labelled {label!r}")
+    return act
+
+
+def pick(label, values):
+    return lambda at: _find(at, "multiselect", label).set_value(values)
+
+
+def tick(label, value=True):
+    return lambda at: _find(at, "checkbox", label).set_value(value)
+
+
+def tick_all(prefix):
+    def act(at):
+        boxes = [w for w in at.checkbox if w.label.startswith(prefix)]
+        if not boxes:
+            raise ScenarioError(f"no checkbox labelled {prefix!r}")
+        for w in boxes:
+            w.check()
+    return act
+
+
+def text(label, value):
+    def act(at):
+        for kind in ("text_input", "text_area"):
+            try:
+                return _find(at, kind, label).input(value)
+            except ScenarioError:
+                pass
+        raise ScenarioError(f"no text field labelled {label!r}")
+    return act
+
+
+def state(**values):
+    """Set problem state fields directly (steps gated by the drawing canvas)."""
+    def act(at):
+        s = at.session_state[STATE_KEY]
+        for k, v in values.items():
+            setattr(s, k, v)
+        at.session_state[STATE_KEY] = s
+    return act
+
+
+# ----------------------------
+# Checks: each takes the AppTest after a step's last rerun
+# ----------------------------
+def reached(**values):
+    """The problem state fields hold these values."""
+    def check(at):
+        s = at.session_state[STATE_KEY]
+        wrong = {k: getattr(s, k) for k, v in values.items() if getattr(s, k) != v}
+        if wrong:
+            raise ScenarioError(f"expected {values}, state has {wrong}")
+    return check
+
+
+def shows(kind, text):
+    """An element of this kind (success, info, header, ...) contains text."""
+    def check(at):
+        if not any(text in str(el.value) for el in getattr(at, kind)):
+            raise ScenarioError(f"no {kind} containing {text!r}")
+    return check
+
+
+def check_step(at, module, step, checks):
+    """Run a step's checks, naming the module and step in the error."""
+    for check in checks:
+        try:
+            check(at)
+        except ScenarioError as e:
+            raise ScenarioError(f"{module} step {step} not passed: {e}") from None
+
+
+# ----------------------------
+# Scenarios
+# ----------------------------
+STEP_APP_SETUP = {"timer_finished": True}
+
+SCENARIOS = {
+    "EngAI_MethodJoints.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin S.T.A.T.I.C.S. Method"), click("Next ➡️"), click("Next ➡️"),
+             tick("A 500 N force acts horizontally"), tick("Support C can only provide"),
+             tick("The height and base of the truss"), click("Check & Continue to T")],
+            [reached(step_idx=2)]),
+        (2, [choose("Which joint should we analyze first", "Joint B"), state(step_idx=3)],
+            [reached(step_idx=3)]),
+        (3, [choose("When drawing an unknown member force",
+                    "Assume the member is in Tension (pointing away from the joint)"),
+             click("Acknowledge Assumptions")],
+            [reached(step_idx=4)]),
+        (4, [number("What is the interior angle", 45.0), click("Check Angle"),
+             choose("What is the $X$-component", "+F_BC * cos(45°)"),
+             choose("What is the $Y$-component", "-F_BC * sin(45°)"), click("Verify Components")],
+            [reached(step_idx=5, angle_correct=True)]),
+        (5, [choose("Which equation should we evaluate FIRST", "Sum of Forces in X = 0"),
+             click("Confirm Equation Strategy")],
+            [reached(step_idx=6)]),
+        (6, [number("Magnitude of $F_{BC}$", 707.1), choose("State of BC:", "Compression (C)"),
+             click("Check BC"),
+             number("Magnitude of $F_{AB}$", 500.0), choose("State of AB:", "Tension (T)"),
+             click("Check AB"),
+             number("Magnitude of $F_{AC}$", 500.0), choose("State of AC:", "Tension (T)"),
+             click("Check AC and Finish")],
+            [reached(step_idx=7, bc_correct=True, ab_correct=True)]),
+        (7, [], [shows("success", "Calculations Complete!")]),
+    ]),
+    "EngAI_V2_MethodSections.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin S.T.A.T.I.C.S. Method"), click("Next ➡️"),
+             tick("The truss geometry is symmetric."), tick("The Method of Sections is more efficient"),
+             tick("The total downward load is 20 kN."), click("Check & Continue to T")],
+            [reached(step_idx=2)]),
+        (2, [choose("Which section of the cut truss", "The Right Section (Nodes H through L)"),
+             state(step_idx=3)],
+            [reached(step_idx=3)]),
+        (3, [number("Calculate the global vertical reaction at L", 7.5), click("Check Reaction L_y")],
+            [reached(step_idx=4, ly_correct=True)]),
+        (4, [number("Calculate the vertical height of Node H", 5.333), click("Check Geometry"),
+             click("Proceed to Equations")],
+            [reached(step_idx=5, h_height_correct=True)]),
+        (5, [choose("To find the bottom chord", "Node H"), click("Confirm Strategy")],
+            [reached(step_idx=6)]),
+        (6, [number("Magnitude of $F_{GI}$", 13.125), choose("State of GI:", "Tension (T)"),
+             click("Check GI"),
+             number("Magnitude of $F_{FH}$", 13.8125), choose("State of FH:", "Compression (C)"),
+             click("Check FH"),
+             number("Magnitude of $F_{GH}$", 1.3707), choose("State of GH:", "Compression (C)"),
+             click("Check GH and Finish")],
+            [reached(step_idx=7, fgi_correct=True, ffh_correct=True)]),
+        (7, [], [shows("success", "Calculations Complete!")]),
+    ]),
+    "EngAI_V2_DistributedLoad.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin S.T.A.T.I.C.S. Method"), number("Gate Height", 3.0),
+             number("Max Load Intensity", 45.0), choose("Support A (Pin)", "Both X and Y"),
+             choose("Support B (Roller", "X only"), click("Check Givens & Continue")],
+            [reached(step_idx=2)]),
+        (2, [state(step_idx=3)],
+            [reached(step_idx=3)]),
+        (3, [click("Acknowledge Assumptions")],
+            [reached(step_idx=4)]),
+        (4, [tick("The Equivalent Water Force"), tick("The Pin at A has an X"),
+             tick("The Pin at A has a Y"), tick("The Roller at B has an X"), click("Verify Components")],
+            [reached(step_idx=5)]),
+        (5, [text("Concept 1", "area of the load"), text("Concept 2", "centroid"),
+             choose("Pivot Point", "Point A"), tick("We must use **$\\sum F_x"),
+             tick("We must use **$\\sum F_y"), tick("We must use **$\\sum M_A"),
+             click("Validate Logic & Equations")],
+            [reached(step_idx=6)]),
+        (6, [number("Resultant Force $F_R$", 67.5), click("Check F_R"),
+             number("Distance from Point A", 2.0), click("Check Location"),
+             number("Calculate $B_x$", 45.0), number("Calculate $A_x$", 22.5),
+             click("Check Reactions and Finish")],
+            [reached(step_idx=7, fr_correct=True, loc_correct=True)]),
+        (7, [tick("The total push of the water"), tick("The bottom support"),
+             tick("Based on these results")],
+            [shows("info", "successfully applied")]),
+    ]),
+    "EngAI_V2_Equilibrium.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin STATICS Method"), click("Next ➡️"), click("Move to T — Translate")],
+            [reached(current_step_idx=2)]),
+        (2, [state(current_step_idx=3)],
+            [reached(current_step_idx=3)]),
+        (3, [click("Set Axes")],
+            [reached(current_step_idx=4)]),
+        (5, [number("How many unknown reaction forces", 3),
+             pick("Which equations will we need", ["Sum of Forces in X", "Sum of Forces in Y", "Sum of Moments"]),
+             text("Sum of forces in x", "Bx = 0"), text("Sum of forces in y", "Ay + By - 15 - 6 - 6 = 0"),
+             text("Sum of moments", "-9Ay + 15(6) - 6(2) - 6(4) = 0"), click("Validate Logic")],
+            [reached(current_step_idx=5)]),
+        (6, [choose("Based on the helper above", "Point B"), number("Enter your calculated value for Ay", 6.0),
+             click("Check Ay"), number("Value of Bx", 0.0), number("Value of By", 21.0),
+             click("Final Computation Check")],
+            [reached(current_step_idx=7)]),
+        (7, [], [shows("success", "Final Results")]),
+    ]),
+    "EngAI_V2_InternalForce.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin S.T.A.T.I.C.S. Method"), choose("Member BD has pins", "Two-force member"),
+             number("What is the total horizontal distance", 30), click("Check Mechanics & Continue")],
+            [reached(step_idx=2)]),
+        (2, [state(step_idx=3)],
+            [reached(step_idx=3)]),
+        (3, [click("Acknowledge Assumptions")],
+            [reached(step_idx=4)]),
+        (4, [number("What is the vertical 'Rise'", 10.0), number("What is the horizontal 'Run'", 24.0),
+             number("Calculate the Hypotenuse", 26.0), click("Verify Geometry")],
+            [reached(step_idx=5)]),
+        (5, [choose("Pivot Point:", "Point C"), choose("Pivot Point for Internal Moment", "Point J"),
+             click("Validate Strategy")],
+            [reached(step_idx=6)]),
+        (6, [number("Magnitude of $F_{BD}$", 780.0), click("Check F_BD"),
+             number("Magnitude of Axial Force", 720.0), number("Magnitude of Shear Force", 140.0),
+             number("Absolute Magnitude of Bending Moment", 1120.0),
+             click("Check Internal Forces and Finish")],
+            [reached(step_idx=7, fbd_correct=True)]),
+        (7, [tick("Because the strut BD"), tick("The bending moment at A")],
+            [shows("info", "successfully applied")]),
+    ]),
+    "EngAI_V2_ThreeForceBody.py": (STEP_APP_SETUP, [
+        (1, [click("▶️ Begin STATICS Method"), click("Next ➡️"),
+             tick("Weight W = 500 lb"), tick("Tension T is Horizontal"), tick("Corner A is Rough"),
+             tick("Reaction at B = 0"), tick("Radius = 4 ft"), click("Check & Continue to T")],
+            [reached(step_idx=2)]),
+        (2, [choose("Where is Point C?", "At the top of the tank (directly above G)"), state(step_idx=3)],
+            [reached(step_idx=3)]),
+        (3, [click("I'm ready to Calculate Angles")],
+            [reached(step_idx=4)]),
+        (5, [number("Calculate angle $\\alpha$", 60.0), click("Check Alpha"),
+             choose("How does finding $\\alpha$ help",
+                    "Triangle AGC is Isosceles, relating $\\alpha$ to the base angles"),
+             number("So, what is the value of $\\theta$", 30.0), click("Check Theta")],
+            [reached(step_idx=5, alpha_correct=True, theta_correct=True)]),
+        (6, [number("Enter your calculated Tension T", 288.7), click("Check Tension"),
+             number("Enter your calculated Reaction Force A", 577.4), click("Check Reaction Force")],
+            [reached(step_idx=6, tension_correct=True)]),
+        (7, [], [shows("header", "S — Sanity Check")]),
+    ]),
+    "EngAI_V2.py": ({"s_timer_done": True}, [
+        (1, [click("▶️ Start STATICS Method"), tick_all("I understand"),
+             tick("F₁ = 400 N"), tick("F₁ direction"), tick("F₂ = 250 N"), tick("F₂ direction"),
+             tick("System is in equilibrium"), tick("Smooth ring"),
+             tick("Find |F₃|"), tick("Find direction (angle) of F₃"), click("✅ Check")],
+            [reached(S_done=True, unlock_T=True)]),
+        (2, [state(T_done=True, unlock_A=True)],
+            [reached(T_done=True, unlock_A=True)]),
+        (3, [click("✅ Finish A")],
+            [reached(A_done=True, unlock_C=True)]),
+        (4, [number("F₁ₓ", 346.41), number("F₁ᵧ", 200.0), number("F₂ₓ", -176.78),
+             number("F₂ᵧ", 176.78), click("✅ Check my components")],
+            [reached(T_components_done=True, unlock_I=True)]),
+        (5, [click("➡️ Continue (skip I")],
+            [reached(I_done=True, unlock_C_next=True)]),
+        (6, [number("Enter your γ", 75.0), click("Check γ"), number("Enter your computed |F₃|", 413.2),
+             click("Check |F₃|"), number("Enter your θ₃", 245.76), click("Check θ₃")],
+            [reached(C_done=True, unlock_next_stage=True)]),
+        (7, [click("Check the direction of my F₃"), tick_all(""), click("✅ Mark sanity check")],
+            [reached(unlock_summary=True), shows("success", "Sanity check complete")]),
+    ]),
+    "EngAI_V2_Moment.py": ({"s_timer_done": True}, [
+        (1, [click("▶️ Start STATICS Method"), tick_all("I understand"),
+             tick("Force magnitude = 100 lb"), tick("Lever Length L = 24"), tick("Shaft angle"),
+             tick("Force is vertical (down)"), tick("Find Moment about O"),
+             tick("Find equivalent Horizontal Force"), click("✅ Check Identifiers")],
+            [reached(S_done=True, unlock_T=True)]),
+        (2, [state(T_done=True, unlock_A=True)],
+            [reached(T_done=True, unlock_A=True)]),
+        (3, [click("💾 Save & Continue")],
+            [reached(A_done=True, unlock_I=True)]),
+        (5, [number("Horizontal distance", 12.0), number("Vertical distance", 20.78),
+             choose("Select the correct Moment equation", "M = F_v * (Horizontal Distance)"), click("✅ Check Implementation")],
+            [reached(I_done=True, unlock_C=True)]),
+        (6, [number("Magnitude of Moment", 1200.0), choose("Direction of Moment", "Clockwise (CW)"),
+             number("Magnitude of Horizontal Force", 57.74), click("✅ Verify Results")],
+            [reached(C_done=True, unlock_S=True)]),
+        (7, [tick_all("")],
+            [shows("success", "Physics holds up")]),
+    ]),
+}
+
+
+PROBLEMS = {
+    "EngAI_MethodJoints.py": "truss_joints",
+    "EngAI_V2_MethodSections.py": "truss_sections",
+    "EngAI_V2_Equilibrium.py": "beam",
+    "EngAI_V2_DistributedLoad.py": "gate",
+    "EngAI_V2_InternalForce.py": "frame",
+    "EngAI_V2_ThreeForceBody.py": "tank",
+    "EngAI_V2.py": "ring",
+    "EngAI_V2_Moment.py": "lever",
+}
+
+
+@contextmanager
+def isolated_data_dir():
+    """Point STATICS_DATA_DIR at a temporary directory for the duration.
+
+    Child processes started inside inherit it. The event log and progress
+    store opened inside are closed on the way out, so the next use in this
+    process opens them under the restored directory.
+    """
+    old = os.environ.get("STATICS_DATA_DIR")
+    with tempfile.TemporaryDirectory(prefix="statics-bench-") as tmp:
+        os.environ["STATICS_DATA_DIR"] = tmp
+        try:
+            yield Path(tmp)
+        finally:
+            for factory in (get_event_log, get_progress_store):
+                if factory.cache_info().currsize:
+                    factory().close()
+                    factory.cache_clear()
+            if old is None:
+                del os.environ["STATICS_DATA_DIR"]
+            else:
+                os.environ["STATICS_DATA_DIR"] = old
+
+
+def new_app(module, timeout=30):
+    """AppTest for a module with the scenario's seed state applied."""
+    seed, _ = SCENARIOS[module]
+    at = AppTest.from_file(str(REPO / module), default_timeout=timeout)
+    at.session_state[STATE_KEY] = state_class(PROBLEMS[module])(**seed)
+    return at
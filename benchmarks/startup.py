@@ -0,0 +1,73 @@
+"""Cold-start cost of each app's first paint.
+
+For every app, a fresh interpreter imports streamlit and AppTest (a running
+server has those loaded already), then times the first run of the script --
+what the first student to open the link waits for -- and lists which heavy
+optional modules that run pulled in. A second run in the same process shows
+the warm cost every later session pays. The apps write to a temporary data
+directory (scenarios.isolated_data_dir), not the real one.
+
+    python -m benchmarks.startup [--modules EngAI_V2.py ...] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.scenarios import REPO, SCENARIOS, isolated_data_dir
+
+HEAVY = ("streamlit_drawable_canvas", "PIL.Image", "PIL.ImageDraw", "numpy", "pandas", "sqlite3")
+
+
+def _child(module):
+    from benchmarks.scenarios import new_app
+
+    before = set(sys.modules)
+    at = new_app(module)
+    t0 = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - t0
+    loaded = sorted(m for m in HEAVY if m in sys.modules and m not in before)
+    at = new_app(module)
+    t0 = time.perf_counter()
+    at.run()
+    warm = time.perf_counter() - t0
+    print(json.dumps({"first": first, "warm": warm, "loaded": loaded,
+                      "errors": len(at.exception)}))
+
+
+def measure(module):
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child", module],
+        cwd=REPO, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each app's first paint in a fresh process.")
+    parser.add_argument("--modules", nargs="*", default=sorted(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _child(args.child)
+        return 0
+
+    print(f"{'module':32s} {'first ms':>9} {'warm ms':>8}  heavy imports on first paint")
+    with isolated_data_dir():
+        for module in args.modules:
+            runs = [measure(module) for _ in range(args.repeat)]
+            first = statistics.median(r["first"] for r in runs) * 1e3
+            warm = statistics.median(r["warm"] for r in runs) * 1e3
+            loaded = ", ".join(runs[-1]["loaded"]) or "-"
+            flag = "  (script errors)" if any(r["errors"] for r in runs) else ""
+            print(f"{module:32s} {first:9.1f} {warm:8.1f}  {loaded}{flag}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
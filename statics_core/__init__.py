@@ -0,0 +1,137 @@
+"""Streamlit-free core for the STATICS Method exercises.
+
+Everything in here is plain Python: the geometry helpers, the graders used by
+the "Check" buttons and the reference solvers for each problem. The Streamlit
+apps (EngAI_*.py) import from this package so the same logic can be loaded by
+batch jobs, benchmarks and worker processes without pulling in the UI stack.
+"""
+
+from statics_core.geometry import (
+    ang_diff,
+    signed_ang_diff,
+    extract_lines,
+    components,
+    angle_rel_axes,
+    included_angle_deg,
+    law_of_cosines,
+    clamp_unit,
+)
+from statics_core.checks import grade_mcq, within, within_pct, count_canvas_lines
+from statics_core.solvers import (
+    solve_force_triangle,
+    solve_ring_components,
+    solve_ring_3d,
+    RING_3D_ANCHORS,
+    solve_lever_moment,
+    solve_joints_truss,
+    solve_fink_sections,
+    solve_beam_reactions,
+    solve_gate_load,
+    solve_gate_hydrostatic,
+    solve_gate_triangular,
+    solve_frame_internal,
+    frame_internal_model,
+    solve_three_force_tank,
+)
+from statics_core.equations import EquationError, compile_equation, check_system, Sum
+from statics_core.moments import member_line, rank_moment_points, check_moment_point
+from statics_core.explorer import EXPLORERS, explore
+from statics_core.influence import influence_lines, moving_load
+from statics_core.loads import resolve_load, describe_load
+from statics_core.frames import Frame, member
+from statics_core.space import unit_vector, cable_geometry, solve_cables, solve_cables_batch
+from statics_core.hydrostatics import (
+    specific_weight, pressure_profile, sweep_levels, level_for_reaction,
+)
+from statics_core.units import (
+    UnitError, parse_unit, conversion, convert, convert_many, parse_quantity, check_quantity,
+)
+from statics_core.supports import (
+    SupportModel, pin, roller, fixed, cable, ring, restrained_axes,
+)
+from statics_core.matcher import TextMatcher, get_matcher
+from statics_core.glossary import Glossary, load_glossary
+from statics_core.progress import ProgressStore, get_progress_store
+from statics_core.state import ProblemState, state_class
+from statics_core.telemetry import EventLog, get_event_log
+from statics_core.metrics import Metrics, get_metrics
+from statics_core.diagrams import render_diagram
+
+__all__ = [
+    "ang_diff",
+    "signed_ang_diff",
+    "extract_lines",
+    "components",
+    "angle_rel_axes",
+    "included_angle_deg",
+    "law_of_cosines",
+    "clamp_unit",
+    "grade_mcq",
+    "within",
+    "within_pct",
+    "count_canvas_lines",
+    "solve_force_triangle",
+    "solve_ring_components",
+    "solve_ring_3d",
+    "RING_3D_ANCHORS",
+    "solve_lever_moment",
+    "solve_joints_truss",
+    "solve_fink_sections",
+    "solve_beam_reactions",
+    "solve_gate_load",
+    "solve_gate_hydrostatic",
+    "solve_gate_triangular",
+    "solve_frame_internal",
+    "frame_internal_model",
+    "solve_three_force_tank",
+    "EquationError",
+    "compile_equation",
+    "check_system",
+    "Sum",
+    "member_line",
+    "rank_moment_points",
+    "check_moment_point",
+    "EXPLORERS",
+    "explore",
+    "influence_lines",
+    "moving_load",
+    "resolve_load",
+    "describe_load",
+    "Frame",
+    "member",
+    "unit_vector",
+    "cable_geometry",
+    "solve_cables",
+    "solve_cables_batch",
+    "specific_weight",
+    "pressure_profile",
+    "sweep_levels",
+    "level_for_reaction",
+    "UnitError",
+    "parse_unit",
+    "conversion",
+    "convert",
+    "convert_many",
+    "parse_quantity",
+    "check_quantity",
+    "SupportModel",
+    "pin",
+    "roller",
+    "fixed",
+    "cable",
+    "ring",
+    "restrained_axes",
+    "TextMatcher",
+    "get_matcher",
+    "Glossary",
+    "load_glossary",
+    "ProgressStore",
+    "get_progress_store",
+    "ProblemState",
+    "state_class",
+    "EventLog",
+    "get_event_log",
+    "Metrics",
+    "get_metrics",
+    "render_diagram",
+]
@@ -0,0 +1,275 @@
+"""Instructor analytics over the attempt logs (no Streamlit).
+
+summarise() reads the event files written by statics_core.telemetry in one
+streaming pass, a line at a time, and keeps only running aggregates:
+
+* per (problem, step, check): attempts, passes, students who tried and who
+  passed, attempts until the first pass, and time from first attempt to first
+  pass;
+* per problem: students who started and finished, and time to complete
+  (first event to passing the last of the problem's FINAL_CHECKS).
+
+Each server process appends its events in time order, so iter_events() reads
+every writer's files in sequence and merges the writers by timestamp.
+
+Durations go into QuantileSketch, a mergeable log-bucket sketch whose memory
+depends on the spread of the values rather than their number. The result is a
+small table written to <data dir>/analytics/summary.json; load_summary()
+reads it back (cached until the file changes) for an instructor page.
+
+Run the job with:  python -m statics_core.analytics [events_dir] [out_file]
+"""
+
+import heapq
+import json
+import math
+import os
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+from statics_core.config import data_dir
+from statics_core.telemetry import log_files
+
+SUMMARY_COLUMNS = (
+    "problem", "step", "check", "students", "passed", "attempts", "pass_rate",
+    "attempts_p50", "attempts_p90", "seconds_p50", "seconds_p90",
+)
+
+# The Check buttons a student must pass to finish each problem
+FINAL_CHECKS = MappingProxyType({
+    "truss_joints": ("Check BC", "Check AB", "Check AC and Finish"),
+    "truss_sections": ("Check GI", "Check FH", "Check GH and Finish"),
+    "beam": ("Check Ay", "Final Computation Check"),
+    "gate": ("Check F_R", "Check Location", "Check Reactions and Finish"),
+    "frame": ("Check F_BD", "Check Internal Forces and Finish"),
+    "tank": ("Check Tension", "Check Reaction Force"),
+    "ring": ("✅ Mark sanity check as complete",),
+    "lever": ("✅ Verify Results",),
+})
+
+
+# ----------------------------
+# Streaming quantiles
+# ----------------------------
+class QuantileSketch:
+    """Quantiles of positive values within a relative error of rel_acc.
+
+    Values fall into logarithmic buckets (bucket k covers gamma**(k-1) to
+    gamma**k), so a duration range of a second to a day needs a few hundred
+    counters at 1 % accuracy however many values are added.
+    """
+
+    def __init__(self, rel_acc=0.01):
+        self.rel_acc = rel_acc
+        self.gamma = (1 + rel_acc) / (1 - rel_acc)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = Counter()
+        self.zeros = 0              # values <= 0 (e.g. passed on the same click)
+        self.count = 0
+
+    def add(self, x):
+        self.count += 1
+        if x <= 0:
+            self.zeros += 1
+        else:
+            self.buckets[math.ceil(math.log(x) / self._log_gamma)] += 1
+
+    def merge(self, other):
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def quantile(self, q):
+        """Estimate of the q-quantile (0 <= q <= 1), or None if empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for k in sorted(self.buckets):
+            seen += self.buckets[k]
+            if rank < seen:
+                # midpoint of the bucket in relative terms
+                return 2 * self.gamma ** k / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+def _counter_quantile(counts, q):
+    """Exact q-quantile of small integers kept as a Counter."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    rank = q * (total - 1)
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        if rank < seen:
+            return value
+    return max(counts)
+
+
+# ----------------------------
+# Streaming pass over the logs
+# ----------------------------
+def _read(paths):
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue            # torn last line of a file still being written
+                if event.get("type") == "attempt":
+                    yield event
+
+
+def _writer(path):
+    # <prefix>-<stamp>-<pid>-<seq>.jsonl; one process writes one file at a time
+    return os.path.basename(path).rsplit("-", 2)[-2]
+
+
+def iter_events(paths):
+    """Attempt events from the given JSONL files in time order, one line at a time.
+
+    A writer's files are read one after another (their names sort in write
+    order) and the writers are merged on "ts", so only one line per writer is
+    held at once.
+    """
+    writers = defaultdict(list)
+    for path in sorted(paths, key=os.path.basename):
+        writers[_writer(path)].append(path)
+    return heapq.merge(*(_read(p) for p in writers.values()), key=itemgetter("ts"))
+
+
+class _CheckStats:
+    __slots__ = ("attempts", "passes", "students", "passed", "tries", "seconds")
+
+    def __init__(self):
+        self.attempts = 0
+        self.passes = 0
+        self.students = 0
+        self.passed = 0
+        self.tries = Counter()          # attempts until first pass -> students
+        self.seconds = QuantileSketch()  # first attempt -> first pass
+
+
+def summarise(events, final_checks=FINAL_CHECKS):
+    """Aggregate time-ordered attempt events into summary rows (see SUMMARY_COLUMNS).
+
+    final_checks maps a problem to the checks that finish it; problems not
+    in it get no completion counts.
+    """
+    checks = defaultdict(_CheckStats)
+    # Per-student progress that is still open: (sid, problem, step, check) ->
+    # [first ts, attempts so far, passed?]
+    open_checks = {}
+    # (sid, problem) -> [first ts, {check: first pass ts}]
+    runs = {}
+
+    for e in events:
+        sid, problem, step, ts = e["sid"], e["problem"], e["step"], e["ts"]
+        check = e.get("check")
+        stats = checks[(problem, step, check)]
+        stats.attempts += 1
+
+        session = runs.get((sid, problem))
+        if session is None:
+            session = runs[(sid, problem)] = [ts, {}]
+
+        key = (sid, problem, step, check)
+        prog = open_checks.get(key)
+        if prog is None:
+            prog = open_checks[key] = [ts, 0, False]
+            stats.students += 1
+        if prog[2]:
+            if e["ok"]:
+                stats.passes += 1
+            continue                     # re-checks after a pass don't count
+        prog[1] += 1
+        if e["ok"]:
+            stats.passes += 1
+            stats.passed += 1
+            stats.tries[prog[1]] += 1
+            stats.seconds.add(ts - prog[0])
+            prog[2] = True
+            session[1].setdefault(check, ts)
+
+    # Module completion: passing every one of the problem's final checks
+    modules = defaultdict(lambda: [0, 0, QuantileSketch()])
+    for (sid, problem), (first_ts, passes) in runs.items():
+        m = modules[problem]
+        m[0] += 1
+        final = final_checks.get(problem, ())
+        if final and all(c in passes for c in final):
+            m[1] += 1
+            m[2].add(max(passes[c] for c in final) - first_ts)
+
+    rows = []
+    for (problem, step, check), s in sorted(checks.items(), key=lambda kv: (kv[0][:2], kv[0][2] or "")):
+        rows.append([
+            problem, step, check, s.students, s.passed, s.attempts,
+            _round(s.passes / s.attempts if s.attempts else None, 3),
+            _counter_quantile(s.tries, 0.5), _counter_quantile(s.tries, 0.9),
+            _round(s.seconds.quantile(0.5)), _round(s.seconds.quantile(0.9)),
+        ])
+    for problem, (started, finished, sketch) in sorted(modules.items()):
+        rows.append([
+            problem, None, None, started, finished if problem in final_checks else None,
+            None, None, None, None,
+            _round(sketch.quantile(0.5)), _round(sketch.quantile(0.9)),
+        ])
+    return rows
+
+
+def _round(x, ndigits=1):
+    return None if x is None else round(x, ndigits)
+
+
+# ----------------------------
+# Summary file
+# ----------------------------
+def summary_path():
+    path = data_dir() / "analytics"
+    path.mkdir(exist_ok=True)
+    return path / "summary.json"
+
+
+def write_summary(rows, path=None):
+    """Write rows as {"columns": [...], "rows": [[...], ...]} (atomic replace)."""
+    path = str(path or summary_path())
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"columns": SUMMARY_COLUMNS, "rows": rows}, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def load_summary(path=None):
+    """Summary rows as dicts; step and check None is the whole-module row."""
+    path = str(path or summary_path())
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _load_summary(path, mtime)
+
+
+@lru_cache(maxsize=4)
+def _load_summary(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    cols = data["columns"]
+    return tuple(dict(zip(cols, row)) for row in data["rows"])
+
+
+def run(events_dir=None, out=None):
+    """Stream every event file once and write the summary table."""
+    return write_summary(summarise(iter_events(log_files(events_dir))), out)
+
+
+if __name__ == "__main__":
+    print(run(*sys.argv[1:3]))
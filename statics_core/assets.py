@@ -0,0 +1,133 @@
+"""Vendored problem diagrams (no Streamlit).
+
+data/diagrams.json lists each diagram once with the URL it was first hosted
+at and the statics_core.diagrams drawing that stands in for it.
+`python -m statics_core.assets` downloads the originals (or reads them from a
+directory with --from, or draws them with --render), scales them down to
+DISPLAY_WIDTH and stores them as WebP in data/diagrams/, which is committed
+with the code. The committed files are the --render drawings, since the
+original URLs could not be fetched when they were made. At run time
+diagram_bytes() reads each file once per process and hands every rerun the
+same encoded bytes, so showing a diagram needs neither the network nor Pillow.
+A diagram whose file is missing is shown from its original URL instead.
+"""
+
+import argparse
+import io
+import json
+import sys
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+DATA_DIR = Path(__file__).with_name("data")
+MANIFEST_PATH = DATA_DIR / "diagrams.json"
+DIAGRAM_DIR = DATA_DIR / "diagrams"
+
+DISPLAY_WIDTH = 704     # content width of Streamlit's "centered" layout
+WEBP_QUALITY = 80
+
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        return MappingProxyType({k: MappingProxyType(v) for k, v in json.load(f).items()})
+
+
+def diagram_path(name):
+    return DIAGRAM_DIR / f"{name}.webp"
+
+
+@lru_cache(maxsize=None)
+def diagram_bytes(name):
+    """Encoded diagram from data/diagrams/, or None if it was never vendored."""
+    if name not in load_manifest():
+        raise KeyError(f"unknown diagram {name!r}")
+    try:
+        return diagram_path(name).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def diagram_source(name):
+    """What to hand st.image: the vendored bytes, else the original URL."""
+    data = diagram_bytes(name)
+    return data if data is not None else load_manifest()[name]["url"]
+
+
+# ----------------------------
+# Vendoring
+# ----------------------------
+def shrink(raw, width=DISPLAY_WIDTH, quality=WEBP_QUALITY):
+    """Original image bytes -> WebP no wider than width."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(raw)) as img:
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        out = io.BytesIO()
+        img.save(out, "WEBP", quality=quality, method=6)
+    return out.getvalue()
+
+
+def _original(name, entry, source_dir, render):
+    if render:
+        from statics_core.diagrams import DRAWERS
+
+        spec = entry["render"]
+        return DRAWERS[spec["kind"]](DISPLAY_WIDTH, **spec.get("params", {})).png()
+    url = entry["url"]
+    if source_dir is None:
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            return resp.read()
+    filename = url.rsplit("/", 1)[-1]
+    for candidate in (Path(source_dir) / filename, *Path(source_dir).glob(f"{name}.*")):
+        if candidate.exists():
+            return candidate.read_bytes()
+    raise FileNotFoundError(f"{filename} not in {source_dir}")
+
+
+def vendor(names=None, source_dir=None, force=False, render=False):
+    """Fetch (or draw), shrink and store diagrams.
+
+    Returns ({name: size in bytes}, {name: error}); one unreachable original
+    does not stop the others.
+    """
+    DIAGRAM_DIR.mkdir(exist_ok=True)
+    manifest = load_manifest()
+    written, failed = {}, {}
+    for name in names or manifest:
+        path = diagram_path(name)
+        if path.exists() and not force:
+            continue
+        try:
+            data = shrink(_original(name, manifest[name], source_dir, render))
+        except OSError as exc:          # URLError, missing file, unreadable image
+            failed[name] = str(exc)
+            continue
+        path.write_bytes(data)
+        written[name] = len(data)
+    diagram_bytes.cache_clear()
+    return written, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vendor the problem diagrams into data/diagrams/.")
+    parser.add_argument("names", nargs="*")
+    parser.add_argument("--from", dest="source_dir", help="read originals from this directory")
+    parser.add_argument("--render", action="store_true",
+                        help="draw the diagrams with statics_core.diagrams instead of fetching them")
+    parser.add_argument("--force", action="store_true", help="re-encode diagrams already vendored")
+    args = parser.parse_args(argv)
+    written, failed = vendor(args.names, args.source_dir, args.force, args.render)
+    for name, size in written.items():
+        print(f"{name}: {size / 1024:.1f} KiB")
+    for name, error in failed.items():
+        print(f"{name}: FAILED ({error})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Graders behind the "Check" buttons (no Streamlit)."""
+
+
+def grade_mcq(selected_labels: set, items: list[tuple[str, bool]]):
+    """Returns (all_correct: bool, num_correct_picked: int, num_false_picked: int, total_true: int)."""
+    truth = {label: is_true for label, is_true in items}
+    num_true_total = sum(truth.values())
+    num_correct_picked = sum(1 for lab in selected_labels if truth.get(lab, False))
+    num_false_picked = sum(1 for lab in selected_labels if truth.get(lab, False) is False)
+    # all-correct means: picked every true item and picked no false items
+    all_correct = (num_correct_picked == num_true_total) and (num_false_picked == 0)
+    return all_correct, num_correct_picked, num_false_picked, num_true_total
+
+
+def within(a, b, tol):
+    """Absolute tolerance check |a - b| <= tol."""
+    return abs(a - b) <= tol
+
+
+def within_pct(a, b, pct):
+    """Relative tolerance check, pct given in percent of b."""
+    return abs(a - b) <= abs(b) * pct / 100.0
+
+
+def count_canvas_lines(canvas_json):
+    """Number of objects drawn on a drawable-canvas (0 if nothing yet)."""
+    return len(canvas_json["objects"]) if canvas_json else 0
@@ -0,0 +1,21 @@
+"""Where the apps keep local runtime data (progress, logs, caches)."""
+
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def data_dir():
+    """Runtime data directory: $STATICS_DATA_DIR, else .statics_data/ in the repo."""
+    path = Path(os.environ.get("STATICS_DATA_DIR") or REPO_ROOT / ".statics_data")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def env_flag(name, default=False):
+    """True if the environment variable is set to 1/true/yes/on."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
@@ -0,0 +1,532 @@
+"""Problem diagrams drawn from their parameters with Pillow (no Streamlit).
+
+render_diagram(kind, **params) draws one of the problem types below and
+returns PNG bytes. Parameters default to the numbers used in the apps (the
+same defaults as the reference solvers), so render_diagram("lever") is the
+lever exercise as written and render_diagram("lever", theta=45) a variant.
+
+Renders are kept in a process-wide LRU keyed by a hash of the kind and the
+normalised parameters and bounded by total encoded size, backed by PNG files
+in <data dir>/diagrams/, so each variant is drawn once however many reruns,
+sessions or server restarts show it. The directory is bounded too: reading a
+file refreshes its mtime, and once the files pass DISK_CACHE_BYTES the least
+recently used are deleted down to three quarters of it.
+
+    kind         parameters
+    ring         F1, th1, F2, th2                    (forces on the smooth ring)
+    lever        L, theta, Fv                        (lever OA, vertical force at A)
+    truss        P, height, base                     (right-angled truss, P at B)
+    gate         height, w_max                       (triangular water load on a gate)
+    beam         x_A, x_B, loads=((x, P), ...)       (roller at A, pin at B)
+    roof_truss   panel, peak, top_load, bottom_load  (six-panel roof truss)
+    frame        P, AB, BJ, JC, rise, run            (beam ABC on strut BD, P at A)
+    tank         W, diameter, obstruction            (tank pulled over a corner A)
+    tank_forces  W, theta                            (force triangle of the tank)
+
+The vendored assets in data/diagrams/ are these drawings at the apps' numbers
+(see statics_core.assets).
+"""
+
+import base64
+import hashlib
+import inspect
+import io
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from statics_core.config import data_dir
+
+DEFAULT_WIDTH = 640
+CACHE_BYTES = 32 * 1024 * 1024
+DISK_CACHE_BYTES = 128 * 1024 * 1024
+
+INK = (17, 17, 17)
+LOAD = (200, 40, 40)
+MUTED = (120, 120, 120)
+WATER = (170, 205, 240)
+
+
+# ----------------------------
+# Drawing surface
+# ----------------------------
+class _Canvas:
+    """World coordinates (y up) fitted to an image `width` pixels wide."""
+
+    def __init__(self, bounds, width, margin=56, max_aspect=0.8):
+        from PIL import Image, ImageDraw, ImageFont
+
+        xmin, ymin, xmax, ymax = bounds
+        self.xmin, self.ymin = xmin, ymin
+        self.margin = margin
+        # fit the width, unless that makes the image taller than max_aspect * width
+        self.scale = min((width - 2 * margin) / (xmax - xmin),
+                         (max_aspect * width - 2 * margin) / (ymax - ymin))
+        self.x0 = (width - (xmax - xmin) * self.scale) / 2      # centre horizontally
+        height = int((ymax - ymin) * self.scale + 2 * margin)
+        self.image = Image.new("RGB", (width, height), "white")
+        self.draw = ImageDraw.Draw(self.image)
+        self.font = ImageFont.load_default(size=15)
+
+    def px(self, p):
+        x, y = p
+        return (self.x0 + (x - self.xmin) * self.scale,
+                self.image.height - self.margin - (y - self.ymin) * self.scale)
+
+    def line(self, p, q, fill=INK, width=3):
+        self.draw.line([self.px(p), self.px(q)], fill=fill, width=width)
+
+    def polygon(self, points, fill, outline=None):
+        self.draw.polygon([self.px(p) for p in points], fill=fill, outline=outline)
+
+    def arrow(self, tail, head, fill=INK, width=3, head_px=13):
+        (x0, y0), (x1, y1) = self.px(tail), self.px(head)
+        ang = math.atan2(y1 - y0, x1 - x0)
+        back = (x1 - head_px * math.cos(ang), y1 - head_px * math.sin(ang))
+        self.draw.line([(x0, y0), back], fill=fill, width=width)
+        spread = head_px * 0.45
+        self.draw.polygon([
+            (x1, y1),
+            (back[0] + spread * math.sin(ang), back[1] - spread * math.cos(ang)),
+            (back[0] - spread * math.sin(ang), back[1] + spread * math.cos(ang)),
+        ], fill=fill)
+
+    def text(self, p, s, fill=INK, offset=(0, 0), anchor="mm"):
+        x, y = self.px(p)
+        self.draw.text((x + offset[0], y + offset[1]), s, fill=fill, font=self.font, anchor=anchor)
+
+    def dot(self, p, r=5, fill=INK):
+        x, y = self.px(p)
+        self.draw.ellipse([x - r, y - r, x + r, y + r], fill=fill)
+
+    def arc(self, center, r_px, a0, a1, fill=MUTED):
+        """Arc from a0 to a1 degrees, counter-clockwise from +x."""
+        x, y = self.px(center)
+        self.draw.arc([x - r_px, y - r_px, x + r_px, y + r_px], -a1, -a0, fill=fill, width=2)
+
+    def pin(self, p, size=16):
+        """Triangle under p, with ground hatching."""
+        x, y = self.px(p)
+        self.draw.polygon([(x, y), (x - size, y + 1.6 * size), (x + size, y + 1.6 * size)],
+                          outline=INK, fill=(235, 235, 235), width=2)
+        self._ground(x, y + 1.6 * size, size)
+
+    def roller(self, p, size=16):
+        x, y = self.px(p)
+        self.draw.polygon([(x, y), (x - size, y + 1.2 * size), (x + size, y + 1.2 * size)],
+                          outline=INK, fill=(235, 235, 235), width=2)
+        r = size * 0.3
+        for cx in (x - size * 0.55, x + size * 0.55):
+            self.draw.ellipse([cx - r, y + 1.2 * size, cx + r, y + 1.2 * size + 2 * r], outline=INK, width=2)
+        self._ground(x, y + 1.2 * size + 2 * r, size)
+
+    def _ground(self, x, y, size):
+        self.draw.line([(x - 1.4 * size, y), (x + 1.4 * size, y)], fill=INK, width=2)
+        for i in range(-3, 4):
+            hx = x + i * size * 0.4
+            self.draw.line([(hx, y), (hx - 6, y + 7)], fill=MUTED, width=1)
+
+    def png(self):
+        out = io.BytesIO()
+        self.image.save(out, "PNG", optimize=False, compress_level=6)
+        return out.getvalue()
+
+
+def _fmt(x):
+    return f"{x:g}"
+
+
+def _pad(points, pad):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+
+
+# ----------------------------
+# Problem types
+# ----------------------------
+def _ring(width, F1=400.0, th1=30.0, F2=250.0, th2=135.0):
+    # arrows scaled to the larger force; with both forces zero only the labels remain
+    big = max(abs(F1), abs(F2))
+    unit = 1.0 / big if big else 0.0
+    tips = [(F * unit * math.cos(math.radians(th)), F * unit * math.sin(math.radians(th)))
+            for F, th in ((F1, th1), (F2, th2))]
+    c = _Canvas(_pad([(0, 0)] + tips, 0.35), width)
+    c.line((-0.25, 0), (0.25, 0), fill=MUTED, width=1)
+    c.line((0, -0.25), (0, 0.25), fill=MUTED, width=1)
+    c.text((0.25, 0), "x", fill=MUTED, offset=(10, 0))
+    for (F, th, name), tip in zip(((F1, th1, "F1"), (F2, th2, "F2")), tips):
+        if F:
+            c.arrow((0, 0), tip, fill=LOAD)
+        c.arc((0, 0), 34 if name == "F1" else 46, 0, th)
+        c.text(tip, f"{name} = {_fmt(F)} N", fill=LOAD, offset=(0, -16 if tip[1] >= 0 else 16))
+        c.text((0.2 * math.cos(math.radians(th / 2)), 0.2 * math.sin(math.radians(th / 2))),
+               f"{_fmt(th)}°", fill=MUTED, offset=(16 * math.cos(math.radians(th / 2)), 0))
+    x, y = c.px((0, 0))
+    c.draw.ellipse([x - 9, y - 9, x + 9, y + 9], outline=INK, width=3)
+    c.text((0, 0), "O", offset=(-14, 14))
+    return c
+
+
+def _lever(width, L=24.0, theta=60.0, Fv=100.0):
+    A = (L * math.cos(math.radians(theta)), L * math.sin(math.radians(theta)))
+    drop = 0.35 * L
+    c = _Canvas(_pad([(0, 0), A, (A[0], A[1] - drop), (L * 0.3, 0)], 0.18 * L), width)
+    c.line((-0.1 * L, 0), (max(A[0], 0) + 0.2 * L, 0), fill=MUTED, width=1)
+    c.line((0, 0), A, width=6)
+    c.pin((0, 0))
+    c.dot((0, 0), r=6)
+    c.arc((0, 0), 40, 0, theta)
+    c.text((0, 0), f"{_fmt(theta)}°", fill=MUTED, offset=(52, -14))
+    c.text(((A[0]) / 2, A[1] / 2), f"L = {_fmt(L)} in", offset=(-34, 0))
+    c.text((0, 0), "O", offset=(-18, -12))
+    c.text(A, "A", offset=(-14, -12))
+    c.arrow(A, (A[0], A[1] - drop), fill=LOAD)
+    c.text((A[0], A[1] - drop), f"F = {_fmt(Fv)} lb", fill=LOAD, offset=(0, 16))
+    return c
+
+
+def _truss(width, P=500.0, height=2.0, base=2.0):
+    A, B, C = (0.0, 0.0), (0.0, height), (base, 0.0)
+    span = max(height, base)
+    c = _Canvas(_pad([A, B, C, (-0.35 * span, height)], 0.3 * span), width)
+    for p, q in ((A, B), (B, C), (A, C)):
+        c.line(p, q, width=5)
+    c.pin(A)
+    c.roller(C)
+    for p, name, off in ((A, "A", (-16, -10)), (B, "B", (14, -12)), (C, "C", (16, -10))):
+        c.dot(p)
+        c.text(p, name, offset=off)
+    c.arrow((-0.35 * span, height), B, fill=LOAD)
+    c.text((-0.35 * span, height), f"P = {_fmt(P)} N", fill=LOAD, offset=(0, -16))
+    c.text((0, height / 2), f"{_fmt(height)} m", fill=MUTED, offset=(-30, 0))
+    c.text((base / 2, 0), f"{_fmt(base)} m", fill=MUTED, offset=(0, 40))
+    return c
+
+
+def _gate(width, height=3.0, w_max=45.0):
+    depth = 0.45 * height                # drawn length of the largest load arrow
+    c = _Canvas(_pad([(0, 0), (-depth, height), (0.25 * height, 0)], 0.2 * height), width)
+    c.polygon([(-depth, 0), (0, 0), (0, height)], fill=WATER)
+    c.line((-depth - 0.1 * height, height), (0, height), fill=(70, 130, 200), width=2)
+    for i in range(1, 6):
+        y = height * (1 - i / 6)
+        c.arrow((-depth * i / 6, y), (0, y), fill=LOAD, width=2, head_px=9)
+    c.line((0, 0), (0, height), width=6)
+    A, B = (0, height), (0, 0)
+    c.dot(A)
+    c.dot(B)
+    c.text(A, "A (pin)", offset=(40, 0))
+    c.text(B, "B (roller)", offset=(50, 0))
+    c.text((-depth, 0), f"{_fmt(w_max)} kN/m", fill=LOAD, offset=(0, 18))
+    c.text((-depth * 0.2, height), "0 kN/m", fill=LOAD, offset=(-30, -14))
+    c.text((0, height / 2), f"{_fmt(height)} m", fill=MUTED, offset=(40, 0))
+    return c
+
+
+def _beam(width, x_A=0.0, x_B=9.0, loads=((3.0, 15.0), (11.0, 6.0), (13.0, 6.0))):
+    xs = [x_A, x_B] + [x for x, _ in loads]
+    left, right = min(xs), max(xs)
+    span = right - left
+    rise = 0.18 * span
+    c = _Canvas((left - 0.08 * span, -0.2 * span, right + 0.08 * span, rise + 0.08 * span), width)
+    c.draw.rectangle([*c.px((left, 0.015 * span)), *c.px((right, -0.015 * span))],
+                     fill=(225, 225, 225), outline=INK, width=2)
+    c.roller((x_A, -0.015 * span))
+    c.pin((x_B, -0.015 * span))
+    c.text((x_A, 0), "A", offset=(-30, 16))
+    c.text((x_B, 0), "B", offset=(-30, 16))
+    for x, P in loads:
+        c.arrow((x, rise), (x, 0.015 * span), fill=LOAD)
+        c.text((x, rise), f"{_fmt(P)} kips", fill=LOAD, offset=(0, -12))
+    # dimension line with every station
+    y = -0.16 * span
+    stations = sorted(set(xs))
+    c.line((stations[0], y), (stations[-1], y), fill=MUTED, width=1)
+    for x0, x1 in zip(stations, stations[1:]):
+        c.text(((x0 + x1) / 2, y), f"{_fmt(x1 - x0)} ft", fill=MUTED, offset=(0, -10))
+    for x in stations:
+        c.line((x, y - 0.01 * span), (x, y + 0.01 * span), fill=MUTED, width=1)
+    return c
+
+
+def _roof_truss(width, panel=5.0, peak=8.0, top_load=1.0, bottom_load=5.0):
+    # six panels: bottom chord A C E G I K L, top chord A B D F H J L
+    span = 6 * panel
+    nodes = {"A": (0.0, 0.0), "L": (span, 0.0)}
+    for i in range(1, 6):
+        x = i * panel
+        nodes["BDFHJ"[i - 1]] = (x, peak * (1 - abs(x - span / 2) / (span / 2)))
+        nodes["CEGIK"[i - 1]] = (x, 0.0)
+    drop = 0.22 * peak
+    c = _Canvas((-0.08 * span, -0.3 * peak, 1.08 * span, 1.3 * peak), width, max_aspect=0.55)
+    members = ["AB", "BD", "DF", "FH", "HJ", "JL", "AC", "CE", "EG", "GI", "IK", "KL",
+               "BC", "DE", "FG", "HI", "JK", "EB", "GD", "GH", "IJ"]
+    for m in members:
+        c.line(nodes[m[0]], nodes[m[1]], width=3)
+    c.pin(nodes["A"])
+    c.roller(nodes["L"])
+    offsets = {"A": (-16, -10), "L": (16, -12), "F": (-14, -12), "B": (-16, -8), "D": (-16, -8),
+               "H": (16, -8), "J": (16, -8)}
+    for name, p in nodes.items():
+        c.dot(p)
+        c.text(p, name, offset=offsets.get(name, (12, 14)))
+    for name in "BDFHJ":
+        x, y = nodes[name]
+        c.arrow((x, y + drop), (x, y), fill=LOAD, width=2, head_px=10)
+        c.text((x, y + drop), f"{_fmt(top_load)} kN", fill=LOAD, offset=(0, -10))
+    for name in "CEG":
+        x, y = nodes[name]
+        c.arrow((x, y), (x, y - drop), fill=LOAD, width=2, head_px=10)
+        c.text((x, y - drop), f"{_fmt(bottom_load)} kN", fill=LOAD, offset=(0, 12))
+    c.text((span / 2, 0), f"6 panels @ {_fmt(panel)} m", fill=MUTED, offset=(0, 76))
+    c.text((span / 2, peak / 2), f"h = {_fmt(peak)} m", fill=MUTED, offset=(34, 0))
+    return c
+
+
+def _frame(width, P=160.0, AB=14.0, BJ=8.0, JC=8.0, rise=10.0, run=24.0):
+    A, B, J = (0.0, 0.0), (AB, 0.0), (AB + BJ, 0.0)
+    C, D = (AB + BJ + JC, 0.0), (AB + run, -rise)
+    drop = 0.3 * rise
+    top, bottom = 0.5 * rise, -1.4 * rise      # dimension lines
+    c = _Canvas(_pad([A, C, D, (0.0, top), (0.0, bottom)], 0.1 * (AB + run)), width)
+    c.line(A, C, width=6)
+    c.line(B, D, width=5)
+    c.pin(C)
+    c.pin(D)
+    for p, name, off in ((A, "A", (-14, 14)), (B, "B", (-12, -16)), (J, "J", (0, -16)),
+                         (C, "C", (16, -14)), (D, "D", (18, -6))):
+        c.dot(p)
+        c.text(p, name, offset=off)
+    c.arrow((0.0, drop), (0.0, 0.6), fill=LOAD)
+    c.text((0.0, drop), f"{_fmt(P)} lb", fill=LOAD, offset=(-36, 6))
+    for y, stations in ((top, (A[0], B[0], J[0], C[0])), (bottom, (B[0], D[0]))):
+        c.line((stations[0], y), (stations[-1], y), fill=MUTED, width=1)
+        for x0, x1 in zip(stations, stations[1:]):
+            c.text(((x0 + x1) / 2, y), f"{_fmt(x1 - x0)} in.", fill=MUTED, offset=(0, -10))
+        for x in stations:
+            c.line((x, y - 0.04 * rise), (x, y + 0.04 * rise), fill=MUTED, width=1)
+    x = D[0] + 0.12 * rise
+    c.line((x, 0.0), (x, -rise), fill=MUTED, width=1)
+    c.text((x, -rise / 2), f"{_fmt(rise)} in.", fill=MUTED, offset=(30, 0))
+    return c
+
+
+def _tank(width, W=500.0, diameter=8.0, obstruction=2.0):
+    r = diameter / 2.0
+    alpha = math.acos((r - obstruction) / r)
+    G, C = (0.0, r), (0.0, 2 * r)
+    A = (-r * math.sin(alpha), obstruction)
+    c = _Canvas((-2.2 * r, -0.35 * r, 1.5 * r, 2.35 * r), width)
+    c.line((-2.2 * r, 0), (1.5 * r, 0), fill=MUTED, width=2)
+    c.draw.rectangle([*c.px((-2.1 * r, obstruction)), *c.px((A[0], 0))],
+                     fill=(225, 225, 225), outline=INK, width=2)
+    x, y = c.px(G)
+    rad = r * c.scale
+    c.draw.ellipse([x - rad, y - rad, x + rad, y + rad], outline=INK, width=4)
+    c.line(G, A, fill=MUTED, width=2)
+    c.line(A, C, fill=MUTED, width=1)
+    c.line(G, (0.0, 0.0), fill=MUTED, width=1)
+    c.arc(G, 30, 270 - math.degrees(alpha), 270)
+    c.text(G, "alpha", fill=MUTED, offset=(-24, 44))
+    c.arc(C, 44, 270 - math.degrees(alpha) / 2, 270)
+    c.text(C, "theta", fill=MUTED, offset=(-18, 60))
+    c.arrow(G, (0.0, 0.45 * r), fill=LOAD)
+    c.text((0.0, 0.45 * r), f"W = {_fmt(W)} lb", fill=LOAD, offset=(44, 0))
+    c.arrow(C, (-0.9 * r, 2 * r), fill=LOAD)
+    c.text((-0.9 * r, 2 * r), "T", fill=LOAD, offset=(-12, 0))
+    for p, name, off in ((G, "G", (12, -10)), (C, "C", (12, -12)), (A, "A", (-12, -14))):
+        c.dot(p)
+        c.text(p, name, offset=off)
+    c.text(((G[0] + A[0]) / 2, (G[1] + A[1]) / 2), f"r = {_fmt(r)} ft", fill=MUTED, offset=(-6, 20))
+    c.text((-1.6 * r, obstruction / 2), f"{_fmt(obstruction)} ft", fill=MUTED)
+    return c
+
+
+def _tank_forces(width, W=500.0, theta=30.0):
+    # tip to tail: W down, R_A up along the line A-C, T back to the start
+    t = math.tan(math.radians(theta))
+    top, bottom, corner = (0.0, 1.0), (0.0, 0.0), (t, 1.0)
+    c = _Canvas(_pad([top, bottom, corner], 0.3), width, max_aspect=0.7)
+    c.arrow(top, bottom, fill=LOAD)
+    c.arrow(bottom, corner, fill=INK)
+    c.arrow(corner, top, fill=INK)
+    c.arc(bottom, 48, 90 - theta, 90)
+    c.text(bottom, f"theta = {_fmt(theta)}°", fill=MUTED, offset=(40, -64))
+    c.text((0.0, 0.5), f"W = {_fmt(W)} lb", fill=LOAD, offset=(-52, 0))
+    c.text((t / 2, 0.5), "R_A", offset=(30, 0))
+    c.text((t / 2, 1.0), "T", offset=(0, -16))
+    return c
+
+
+DRAWERS = {
+    "ring": _ring,
+    "lever": _lever,
+    "truss": _truss,
+    "gate": _gate,
+    "beam": _beam,
+    "roof_truss": _roof_truss,
+    "frame": _frame,
+    "tank": _tank,
+    "tank_forces": _tank_forces,
+}
+
+_DEFAULTS = {
+    kind: {name: p.default for name, p in inspect.signature(fn).parameters.items()
+           if p.default is not inspect.Parameter.empty}
+    for kind, fn in DRAWERS.items()
+}
+
+
+# ----------------------------
+# Cache
+# ----------------------------
+def _normalise(value):
+    if isinstance(value, (list, tuple)):
+        return [_normalise(v) for v in value]
+    if isinstance(value, (int, float)):
+        return float(f"{float(value):.6g}")
+    return value
+
+
+def diagram_key(kind, params):
+    """Hash of the kind and its full, normalised parameter set."""
+    if kind not in DRAWERS:
+        raise KeyError(f"unknown diagram kind {kind!r}")
+    unknown = set(params) - set(_DEFAULTS[kind])
+    if unknown:
+        raise TypeError(f"{kind} diagram has no parameter(s) {', '.join(sorted(unknown))}")
+    full = {**_DEFAULTS[kind], **params}
+    text = json.dumps([kind, {k: _normalise(v) for k, v in full.items()}], sort_keys=True)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class DiagramCache:
+    """Thread-safe LRU of encoded diagrams (bytes or str), bounded by total size."""
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items = OrderedDict()     # key -> bytes, least recently used first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._items)
+
+
+_cache = DiagramCache()
+
+
+_disk_lock = threading.Lock()
+_disk_size = None               # bytes in <data dir>/diagrams/, scanned on the first write
+
+
+def _disk_path(key):
+    path = data_dir() / "diagrams"
+    path.mkdir(exist_ok=True)
+    return path / f"{key}.png"
+
+
+def _prune_disk(directory, max_bytes):
+    """Delete the least recently used PNGs until the rest fit in max_bytes; returns their size."""
+    files = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".png"):
+            st = entry.stat()
+            files.append((st.st_mtime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    files.sort()
+    for _, size, path in files:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass                        # another process pruned it first
+        total -= size
+    return total
+
+
+def _disk_written(directory, nbytes):
+    """Account for a new file; prune the directory once it passes DISK_CACHE_BYTES."""
+    global _disk_size
+    with _disk_lock:
+        if _disk_size is None:
+            _disk_size = _prune_disk(directory, DISK_CACHE_BYTES)
+        else:
+            _disk_size += nbytes
+        if _disk_size > DISK_CACHE_BYTES:
+            _disk_size = _prune_disk(directory, DISK_CACHE_BYTES * 3 // 4)
+
+
+def render_diagram(kind, width=DEFAULT_WIDTH, **params):
+    """PNG bytes of a problem diagram, rendered once per parameter set.
+
+    Misses in the in-memory LRU fall through to <data dir>/diagrams/, so a
+    fresh server process shows known diagrams without importing Pillow's
+    drawing modules or rendering.
+    """
+    key = f"{kind}-{diagram_key(kind, params)}-{int(width)}"
+    data = _cache.get(key)
+    if data is not None:
+        return data
+    path = _disk_path(key)
+    try:
+        data = path.read_bytes()
+        os.utime(path)                  # mtime = last use, for pruning
+    except FileNotFoundError:
+        data = DRAWERS[kind](int(width), **params).png()
+        # a name of its own, since threads of one process can miss the same key
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{key}.",
+                                         suffix=".tmp", delete=False) as tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+        _disk_written(path.parent, len(data))
+    _cache.put(key, data)
+    return data
+
+
+def diagram_data_uri(kind, width=DEFAULT_WIDTH, **params):
+    """render_diagram() as a base64 data: URI (cached like the PNG).
+
+    st.image hands a data URI to the browser as-is, whereas raw bytes are
+    opened with Pillow and hashed into the media store on every rerun.
+    """
+    key = f"{kind}-{diagram_key(kind, params)}-{int(width)}.uri"
+    uri = _cache.get(key)
+    if uri is None:
+        png = render_diagram(kind, width, **params)
+        uri = "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+        _cache.put(key, uri)
+    return uri
+
+
+def diagram_cache():
+    """The process-wide DiagramCache (for stats and tests)."""
+    return _cache
@@ -0,0 +1,470 @@
+"""Typed equilibrium equations for the Implement steps (no Streamlit).
+
+Students type equations such as "Ay + By - 15 - 6 - 6 = 0" or
+"ΣM_B: -9Ay + 15(6) - 6(2) - 6(4) = 0". compile_equation() parses the text
+into a small expression tree and folds it into a linear form
+(coefficient per unknown + constant). The result is cached per
+(text, unknowns, knowns), so re-checking the same entry on every rerun is a
+dict lookup.
+
+An equation is graded by evaluating it at the reference solution, so any
+correct sign convention or choice of moment point passes. check_system()
+also checks that a set of equations is independent enough to determine every
+unknown, and solves it, by Gaussian elimination on the coefficient rows.
+
+Balancing at the solution is not enough for a box that asks for a particular
+sum: "Ay = 6" balances too. A Sum (ΣFx or ΣFy along a pair of axes, or ΣM
+about a point the student picks) is built from the lines of action of the
+unknowns and the known loads, and Sum.matches() checks that the equation is
+that sum, up to sign and a common factor. In ΣFx and ΣFy the known loads may
+be combined ("Ay + By = 27"). ΣM is checked term by term, since with its
+loads combined "Ay = 6" is ΣM about B divided through; the point is recovered
+from the student's own coefficients and terms.
+
+Accepted syntax: numbers, unknown and known symbols (case and underscores
+are ignored, so A_y, ay and Ay are the same), + - * / ^ (or **), brackets,
+implicit multiplication (9Ay, 15(6)), sin/cos/tan in degrees, and sqrt.
+A leading label ending in ":" is ignored.
+"""
+
+import itertools
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+EQUATION_CACHE_SIZE = 2048
+RTOL = 0.01          # residual allowed, relative to the size of the terms
+ATOL = 1e-6
+
+FUNCTIONS = {
+    "sin": lambda x: math.sin(math.radians(x)),
+    "cos": lambda x: math.cos(math.radians(x)),
+    "tan": lambda x: math.tan(math.radians(x)),
+    "sqrt": math.sqrt,
+}
+
+_UNICODE = str.maketrans({
+    "−": "-", "–": "-", "×": "*", "·": "*", "⋅": "*", "÷": "/", "°": " ", "Σ": " ",
+    "θ": "theta",
+})
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+      | (?P<op>\*\*|[-+*/^()=])
+      | (?P<bad>\S)
+    )""", re.X)
+
+SystemCheck = namedtuple("SystemCheck", "ok holds rank needed values")
+SUM_NAMES = MappingProxyType({"Fx": "ΣFx", "Fy": "ΣFy", "M": "ΣM"})
+MAX_SUM_LOADS = 4     # loads tried against the terms of a ΣM equation
+
+
+class EquationError(ValueError):
+    """The text is not a linear equation in the allowed symbols."""
+
+
+def symbol_key(name):
+    """Case- and underscore-insensitive key for a symbol name."""
+    return name.replace("_", "").lower()
+
+
+# ----------------------------
+# Parsing
+# ----------------------------
+def _tokenize(text):
+    tokens = []
+    for m in _TOKEN.finditer(text):
+        kind = m.lastgroup
+        if kind is None:
+            continue
+        if kind == "bad":
+            raise EquationError(f"unexpected character {m.group(kind)!r}")
+        tokens.append((kind, m.group(kind)))
+    tokens.append(("end", ""))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the token list; builds a tuple tree."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self):
+        return self.tokens[self.i]
+
+    def take(self, value=None):
+        tok = self.tokens[self.i]
+        if value is not None and tok[1] != value:
+            raise EquationError(f"expected {value!r}" + (f" before {tok[1]!r}" if tok[1] else " at the end"))
+        self.i += 1
+        return tok
+
+    def expr(self):
+        node = self.term()
+        while self.peek()[1] in ("+", "-"):
+            op = self.take()[1]
+            node = ("add" if op == "+" else "sub", node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while True:
+            kind, value = self.peek()
+            if value in ("*", "/"):
+                self.take()
+                node = ("mul" if value == "*" else "div", node, self.unary())
+            elif kind in ("num", "name") or value == "(":
+                node = ("mul", node, self.power())      # implicit: 9Ay, 15(6)
+            else:
+                return node
+
+    def unary(self):
+        if self.peek()[1] in ("+", "-"):
+            op = self.take()[1]
+            node = self.unary()
+            return ("neg", node) if op == "-" else node
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek()[1] in ("^", "**"):
+            self.take()
+            node = ("pow", node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "num":
+            return ("num", float(value))
+        if kind == "name":
+            fn = value.lower()
+            if fn in FUNCTIONS and self.peek()[1] == "(":
+                self.take("(")
+                arg = self.expr()
+                self.take(")")
+                return ("call", fn, arg)
+            return ("var", value)
+        if value == "(":
+            node = self.expr()
+            self.take(")")
+            return node
+        raise EquationError(f"unexpected {value!r}" if value else "equation ends too early")
+
+
+def parse_equation(text):
+    """(lhs, rhs) expression trees; a bare expression means "= 0"."""
+    text = text.translate(_UNICODE)
+    if ":" in text:
+        text = text.rsplit(":", 1)[1]           # "ΣFy: ..." / "Sum M_B: ..."
+    if not text.strip():
+        raise EquationError("empty equation")
+    parser = _Parser(_tokenize(text))
+    lhs = parser.expr()
+    rhs = ("num", 0.0)
+    if parser.peek()[1] == "=":
+        parser.take()
+        rhs = parser.expr()
+    if parser.peek()[0] != "end":
+        raise EquationError(f"unexpected {parser.peek()[1]!r}")
+    return lhs, rhs
+
+
+# ----------------------------
+# Linear forms
+# ----------------------------
+def _linear(node, unknowns, knowns):
+    """Fold a tree into ({unknown: coefficient}, constant)."""
+    kind = node[0]
+    if kind == "num":
+        return {}, node[1]
+    if kind == "var":
+        key = symbol_key(node[1])
+        if key in unknowns:
+            return {unknowns[key]: 1.0}, 0.0
+        if key in knowns:
+            return {}, knowns[key]
+        raise EquationError(f"unknown symbol {node[1]!r}")
+    if kind == "neg":
+        c, k = _linear(node[1], unknowns, knowns)
+        return {v: -x for v, x in c.items()}, -k
+    if kind == "call":
+        c, k = _linear(node[2], unknowns, knowns)
+        if c:
+            raise EquationError(f"{node[1]}() of an unknown is not linear")
+        try:
+            return {}, FUNCTIONS[node[1]](k)
+        except ValueError:
+            raise EquationError(f"{node[1]}() of {k:g} is undefined") from None
+
+    (ca, ka), (cb, kb) = _linear(node[1], unknowns, knowns), _linear(node[2], unknowns, knowns)
+    if kind in ("add", "sub"):
+        sign = 1.0 if kind == "add" else -1.0
+        coeffs = dict(ca)
+        for v, x in cb.items():
+            coeffs[v] = coeffs.get(v, 0.0) + sign * x
+        return coeffs, ka + sign * kb
+    if kind == "mul":
+        if ca and cb:
+            raise EquationError("product of two unknowns is not linear")
+        if cb:
+            (ca, ka), (cb, kb) = (cb, kb), (ca, ka)
+        return {v: x * kb for v, x in ca.items()}, ka * kb
+    if kind == "div":
+        if cb:
+            raise EquationError("dividing by an unknown is not linear")
+        if kb == 0:
+            raise EquationError("division by zero")
+        return {v: x / kb for v, x in ca.items()}, ka / kb
+    if kind == "pow":
+        if ca or cb:
+            raise EquationError("powers of unknowns are not linear")
+        try:
+            return {}, float(ka ** kb)
+        except (OverflowError, ZeroDivisionError, TypeError):
+            raise EquationError("power is undefined") from None
+    raise EquationError(f"cannot evaluate {kind}")
+
+
+def _split(node, sign, out):
+    """Append (sign, subtree) for each top-level term of a sum."""
+    kind = node[0]
+    if kind in ("add", "sub"):
+        _split(node[1], sign, out)
+        _split(node[2], sign if kind == "add" else -sign, out)
+    elif kind == "neg":
+        _split(node[1], -sign, out)
+    else:
+        out.append((sign, node))
+    return out
+
+
+class Equation:
+    """sum(coeffs[u] * u) + const = 0, compiled from a typed equation.
+
+    terms holds the nonzero constant terms as typed (lhs minus rhs), so
+    const == sum(terms).
+    """
+
+    __slots__ = ("text", "coeffs", "const", "terms")
+
+    def __init__(self, text, coeffs, const, terms=()):
+        self.text = text
+        self.coeffs = MappingProxyType({u: c for u, c in coeffs.items() if c != 0.0})
+        self.const = const
+        self.terms = tuple(terms)
+
+    def residual(self, values):
+        return sum(c * values[u] for u, c in self.coeffs.items()) + self.const
+
+    def holds(self, values, rtol=RTOL, atol=ATOL):
+        """True if the equation is satisfied (within tolerance) by values."""
+        if not self.coeffs:
+            return False                         # 0 = 0 or a pure number
+        scale = abs(self.const) + sum(abs(c * values[u]) for u, c in self.coeffs.items())
+        return abs(self.residual(values)) <= rtol * scale + atol
+
+    def __repr__(self):
+        return f"Equation({self.text!r})"
+
+
+def compile_equation(text, unknowns, knowns=None):
+    """Cached Equation for text in the given unknowns (and known symbol values)."""
+    knowns = tuple(sorted((knowns or {}).items()))
+    return _compile(text.strip(), tuple(unknowns), knowns)
+
+
+@lru_cache(maxsize=EQUATION_CACHE_SIZE)
+def _compile(text, unknowns, knowns):
+    lhs, rhs = parse_equation(text)
+    ukeys = {symbol_key(u): u for u in unknowns}
+    kkeys = {symbol_key(k): float(v) for k, v in knowns}
+    coeffs, terms = {}, []
+    for sign, node in _split(lhs, 1.0, []) + _split(rhs, -1.0, []):
+        c, k = _linear(node, ukeys, kkeys)
+        for u, x in c.items():
+            coeffs[u] = coeffs.get(u, 0.0) + sign * x
+        if k:
+            terms.append(sign * k)
+    return Equation(text, coeffs, sum(terms), terms)
+
+
+# ----------------------------
+# Sets of equations
+# ----------------------------
+def _eliminate(rows, n):
+    """Row-reduce [a_1..a_n | b] rows in place; returns the pivot columns."""
+    pivots = []
+    r = 0
+    for col in range(n):
+        best = max(range(r, len(rows)), key=lambda i: abs(rows[i][col]), default=None)
+        if best is None:
+            break
+        scale = max((abs(x) for x in rows[best][:n]), default=0.0) or 1.0
+        if abs(rows[best][col]) <= 1e-9 * scale:
+            continue
+        rows[r], rows[best] = rows[best], rows[r]
+        piv = rows[r][col]
+        rows[r] = [x / piv for x in rows[r]]
+        for i in range(len(rows)):
+            if i != r and rows[i][col]:
+                f = rows[i][col]
+                rows[i] = [x - f * y for x, y in zip(rows[i], rows[r])]
+        pivots.append(col)
+        r += 1
+    return pivots
+
+
+def check_system(equations, unknowns, solution, rtol=RTOL):
+    """Grade a set of compiled equations against the reference solution.
+
+    Returns SystemCheck(ok, holds, rank, needed, values): holds has one bool
+    per equation, rank is the number of independent equations, needed is the
+    number of unknowns, and values is the solution of the student's own
+    equations (None unless they determine every unknown).
+    """
+    unknowns = tuple(unknowns)
+    holds = tuple(eq.holds(solution, rtol) for eq in equations)
+    rows = [[eq.coeffs.get(u, 0.0) for u in unknowns] + [-eq.const] for eq in equations]
+    pivots = _eliminate(rows, len(unknowns))
+    rank = len(pivots)
+    values = None
+    if rank == len(unknowns):
+        values = {unknowns[col]: rows[i][-1] + 0.0 for i, col in enumerate(pivots)}
+    ok = all(holds) and values is not None
+    return SystemCheck(ok, holds, rank, len(unknowns), values)
+
+
+# ----------------------------
+# Expected sums
+# ----------------------------
+def _close(a, b, scale, rtol):
+    return abs(a - b) <= rtol * scale + ATOL
+
+
+class Sum(namedtuple("Sum", "kind lines loads angle")):
+    """The equilibrium sum a box asks for.
+
+    kind is "Fx" or "Fy" (along axes turned angle degrees counterclockwise)
+    or "M" (about any point). lines are (name, point, direction) tuples for
+    the unknowns, such as supports.Reaction or moments.Line, with direction
+    None for a couple. loads are ((x, y), (Fx, Fy)) known forces.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, kind, lines, loads=(), angle=0.0):
+        if kind not in SUM_NAMES:
+            raise ValueError(f"unknown sum {kind!r}; use one of {', '.join(SUM_NAMES)}")
+        loads = tuple((tuple(p), tuple(f)) for p, f in loads)
+        return super().__new__(cls, kind, tuple(lines), loads, float(angle))
+
+    @property
+    def name(self):
+        return SUM_NAMES[self.kind]
+
+    def matches(self, equation, rtol=RTOL):
+        """True if equation is this sum (any sign or factor; ΣM term by term)."""
+        return _matches(self, equation, rtol)
+
+
+@lru_cache(maxsize=EQUATION_CACHE_SIZE)
+def _matches(expected, eq, rtol):
+    if not eq.coeffs or any(u not in {ln[0] for ln in expected.lines} for u in eq.coeffs):
+        return False
+    if expected.kind == "M":
+        return _matches_moment(expected, eq, rtol)
+    a = math.radians(expected.angle)
+    axis = (math.cos(a), math.sin(a)) if expected.kind == "Fx" else (-math.sin(a), math.cos(a))
+
+    def along(d):
+        return 0.0 if d is None else d[0] * axis[0] + d[1] * axis[1]
+
+    ref = {name: along(d) for name, _, d in expected.lines}
+    # Common factor from the largest coefficient of the reference sum
+    top = max(ref, key=lambda u: abs(ref[u]))
+    if abs(ref[top]) <= ATOL or top not in eq.coeffs:
+        return False
+    f = eq.coeffs[top] / ref[top]
+    scale = max(abs(c) for c in eq.coeffs.values())
+    if not all(_close(eq.coeffs.get(u, 0.0), f * r, scale, rtol) for u, r in ref.items()):
+        return False
+    # The known loads may be combined, so compare their total with the constant
+    want = [f * along(F) for _, F in expected.loads]
+    scale = sum(map(abs, want)) + sum(map(abs, eq.terms))
+    return _close(eq.const, sum(want), scale, rtol)
+
+
+def _matches_moment(expected, eq, rtol):
+    """Look for a point p and factor f so the terms are f × the moments about p."""
+    # Rows [a b c | r] in (f, f·px, f·py); the moment of F at q about p is
+    # cross(q, F) - (px·Fy - py·Fx), and a couple's is its own value
+    rows = []
+    for name, (x, y), d in expected.lines:
+        row = [1.0, 0.0, 0.0] if d is None else [x * d[1] - y * d[0], -d[1], d[0]]
+        rows.append(row + [eq.coeffs.get(name, 0.0)])
+    if len(expected.loads) > MAX_SUM_LOADS:
+        return False
+    # A load's moment is one term, or two (x·Fy and -y·Fx) taken by components
+    options = []
+    for (x, y), (Fx, Fy) in expected.loads:
+        whole = [[x * Fy - y * Fx, -Fy, Fx]]
+        options.append([whole, [[x * Fy, -Fy, 0.0], [-y * Fx, 0.0, Fx]]] if Fx and Fy else [whole])
+    terms = sorted(eq.terms)
+    for choice in itertools.product(*options):
+        parts = [row for rows_of_load in choice for row in rows_of_load]
+        for x in _moment_points(rows, parts, terms, rtol):
+            moments = [sum(a * b for a, b in zip(row, x)) for row in parts]
+            scale = sum(map(abs, moments)) + sum(map(abs, terms))
+            want = sorted(m for m in moments if abs(m) > rtol * scale + ATOL)
+            if len(want) == len(terms) and all(abs(w - t) <= rtol * (abs(w) + abs(t)) + ATOL
+                                               for w, t in zip(want, terms)):
+                return True
+    return False
+
+
+def _moment_points(rows, parts, terms, rtol):
+    """Candidate (f, f·px, f·py) that reproduce the unknowns' coefficients.
+
+    When the coefficients leave k of the three open, each way of pairing k
+    parts with k typed terms (or with zero) gives one candidate. The factor
+    is set to 1 when no line or load has a moment about the origin, since it
+    then multiplies nothing.
+    """
+    fixed = [1.0 if all(abs(r[0]) <= ATOL for r in rows + parts) else None, None, None]
+    open_cols = 3 - sum(v is not None for v in fixed) - _rank(rows, fixed)
+    values = terms + [0.0]
+    for picked in itertools.combinations(parts, open_cols):
+        for rhs in itertools.product(values, repeat=open_cols):
+            x = _solve_rows(rows + [p[:3] + [r] for p, r in zip(picked, rhs)], fixed, rtol)
+            if x is not None:
+                yield x
+
+
+def _rank(rows, fixed):
+    reduced = [[a for a, v in zip(r[:3], fixed) if v is None] + [0.0] for r in rows]
+    return len(_eliminate(reduced, len(reduced[0]) - 1)) if reduced else 0
+
+
+def _solve_rows(rows, fixed, rtol):
+    """The unique solution of rows [a b c | r] with fixed columns, or None."""
+    cols = [c for c in range(3) if fixed[c] is None]
+    reduced = [[r[c] for c in cols] + [r[3] - sum(r[c] * v for c, v in enumerate(fixed) if v is not None)]
+               for r in rows]
+    pivots = _eliminate(reduced, len(cols))
+    if len(pivots) < len(cols):
+        return None
+    x = list(fixed)
+    for i, col in enumerate(pivots):
+        x[cols[col]] = reduced[i][-1]
+    if abs(x[0]) <= ATOL:
+        return None
+    for *a, r in rows:
+        parts = [ai * xi for ai, xi in zip(a, x)]
+        if abs(sum(parts) - r) > rtol * (sum(map(abs, parts)) + abs(r)) + ATOL:
+            return None
+    return x
@@ -0,0 +1,184 @@
+"""What-if explorers: the governing parameters of each problem (no Streamlit).
+
+Each problem gets an Explorer spec: the parameters a student may vary (with
+slider ranges around the numbers in the exercise), the solver outputs worth
+showing, and the diagram kind that redraws the setup. explore() turns a set
+of slider values into solver arguments and returns the (cached, read-only)
+answer key, so moving a slider back to a value already seen is a dict lookup
+and a new value costs one solver call.
+
+    EXPLORERS["lever"].params    -> Param("L", ...), Param("theta", ...), ...
+    explore("lever", {"theta": 45})
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+from statics_core.solvers import (
+    solve_force_triangle,
+    solve_lever_moment,
+    solve_joints_truss,
+    solve_fink_sections,
+    solve_beam_reactions,
+    solve_gate_triangular,
+    solve_frame_internal,
+    solve_three_force_tank,
+)
+
+Param = namedtuple("Param", "name label default lo hi step unit")
+Output = namedtuple("Output", "key label unit")
+Explorer = namedtuple("Explorer", "solver params outputs build diagram")
+Exploration = namedtuple("Exploration", "args results")
+
+
+def _beam_args(P1, P2, P3):
+    return {"loads": ((3.0, P1), (11.0, P2), (13.0, P3))}
+
+
+def _sections_args(top_load, bottom_load, peak):
+    return {"top_load": top_load, "bottom_loads": (bottom_load,) * 3, "peak": peak}
+
+
+EXPLORERS = MappingProxyType({
+    "ring": Explorer(
+        solve_force_triangle,
+        (
+            Param("F1", "F₁", 400.0, 0.0, 1000.0, 10.0, "N"),
+            Param("th1", "θ₁", 30.0, -180.0, 180.0, 5.0, "°"),
+            Param("F2", "F₂", 250.0, 0.0, 1000.0, 10.0, "N"),
+            Param("th2", "θ₂", 135.0, -180.0, 180.0, 5.0, "°"),
+        ),
+        (
+            Output("F3", "|F₃|", "N"),
+            Output("th3", "θ₃", "°"),
+            Output("gamma", "γ", "°"),
+        ),
+        None,
+        "ring",
+    ),
+    "lever": Explorer(
+        solve_lever_moment,
+        (
+            Param("L", "Length OA", 24.0, 6.0, 48.0, 1.0, "in"),
+            Param("theta", "Angle θ", 60.0, 5.0, 85.0, 1.0, "°"),
+            Param("Fv", "Vertical force", 100.0, 10.0, 300.0, 5.0, "lb"),
+        ),
+        (
+            Output("M", "Moment about O", "lb·in"),
+            Output("Fh", "Equivalent horizontal force", "lb"),
+        ),
+        None,
+        "lever",
+    ),
+    "truss_joints": Explorer(
+        solve_joints_truss,
+        (
+            Param("P", "Load at B", 500.0, 50.0, 1500.0, 50.0, "N"),
+            Param("height", "Height AB", 2.0, 0.5, 5.0, 0.25, "m"),
+            Param("base", "Base AC", 2.0, 0.5, 5.0, 0.25, "m"),
+        ),
+        (
+            Output("F_AB", "F_AB", "N"),
+            Output("F_BC", "F_BC", "N"),
+            Output("F_AC", "F_AC", "N"),
+        ),
+        None,
+        "truss",
+    ),
+    "truss_sections": Explorer(
+        solve_fink_sections,
+        (
+            Param("top_load", "Top load per node", 1.0, 0.0, 5.0, 0.25, "kN"),
+            Param("bottom_load", "Bottom load at C, E, G", 5.0, 0.0, 10.0, 0.5, "kN"),
+            Param("peak", "Peak height", 8.0, 3.0, 12.0, 0.5, "m"),
+        ),
+        (
+            Output("Ly", "L_y", "kN"),
+            Output("F_FH", "F_FH", "kN"),
+            Output("F_GH", "F_GH", "kN"),
+            Output("F_GI", "F_GI", "kN"),
+        ),
+        _sections_args,
+        None,
+    ),
+    "beam": Explorer(
+        solve_beam_reactions,
+        (
+            Param("P1", "Load at x = 3 ft", 15.0, 0.0, 30.0, 1.0, "k"),
+            Param("P2", "Load at x = 11 ft", 6.0, 0.0, 30.0, 1.0, "k"),
+            Param("P3", "Load at x = 13 ft", 6.0, 0.0, 30.0, 1.0, "k"),
+        ),
+        (
+            Output("Ay", "A_y", "k"),
+            Output("By", "B_y", "k"),
+        ),
+        _beam_args,
+        "beam",
+    ),
+    "gate": Explorer(
+        solve_gate_triangular,
+        (
+            Param("height", "Gate height", 3.0, 1.0, 6.0, 0.25, "m"),
+            Param("w_max", "Load at the bottom", 45.0, 5.0, 100.0, 5.0, "kN/m"),
+        ),
+        (
+            Output("FR", "Resultant", "kN"),
+            Output("Ax", "A_x", "kN"),
+            Output("Bx", "B_x", "kN"),
+        ),
+        None,
+        "gate",
+    ),
+    "frame": Explorer(
+        solve_frame_internal,
+        (
+            Param("P", "Load at A", 160.0, 20.0, 400.0, 10.0, "lb"),
+            Param("rise", "Strut rise", 10.0, 2.0, 20.0, 1.0, "in"),
+            Param("run", "Strut run", 24.0, 6.0, 40.0, 1.0, "in"),
+        ),
+        (
+            Output("F_BD", "F_BD", "lb"),
+            Output("N_J", "N_J", "lb"),
+            Output("V_J", "V_J", "lb"),
+            Output("M_J", "M_J", "lb·in"),
+        ),
+        None,
+        None,
+    ),
+    "tank": Explorer(
+        solve_three_force_tank,
+        (
+            Param("W", "Weight", 500.0, 50.0, 1500.0, 50.0, "lb"),
+            Param("diameter", "Diameter", 8.0, 4.0, 12.0, 0.5, "ft"),
+            Param("obstruction", "Obstruction height", 2.0, 0.25, 3.75, 0.25, "ft"),
+        ),
+        (
+            Output("alpha", "α", "°"),
+            Output("T", "Tension T", "lb"),
+            Output("R_A", "Reaction R_A", "lb"),
+        ),
+        None,
+        None,
+    ),
+})
+
+
+def explorer(problem):
+    """The Explorer spec for a problem id."""
+    try:
+        return EXPLORERS[problem]
+    except KeyError:
+        raise KeyError(f"no explorer for problem {problem!r}") from None
+
+
+def explore(problem, values=None):
+    """Exploration(args, results) for slider values (defaults fill the rest).
+
+    args are the solver arguments, which are also the diagram parameters;
+    results is the solver's cached answer key.
+    """
+    spec = explorer(problem)
+    values = values or {}
+    chosen = {p.name: float(values.get(p.name, p.default)) for p in spec.params}
+    args = spec.build(**chosen) if spec.build else chosen
+    return Exploration(args, spec.solver(**args))
@@ -0,0 +1,301 @@
+"""Pin-connected frames and machines (no Streamlit).
+
+A frame is a set of rigid members joined by pins at named nodes:
+
+    frame = Frame(
+        nodes={"A": (0, 0), "B": (14, 0), "C": (30, 0), "D": (38, -10)},
+        members=[member("ABC", "A", "B", "C"), member("BD", "B", "D")],
+        supports=[pin("C", (30, 0)), pin("D", (38, -10))],
+        loads=[load("A", fy=-160)],
+    )
+    frame.solve().axial["BD"]        # -780.0 (compression)
+
+The frame is taken apart at every pin. Each pin is a particle with ΣFx and
+ΣFy; each member is a rigid body with ΣFx, ΣFy and ΣM. A member pinned at
+exactly two nodes, with no load or couple of its own, is a two-force member:
+it gets one unknown (its axial force, tension positive) and no equations of
+its own, which is how the textbook treats links and struts. Every other
+member gets an (x, y) force from each of its pins. Support reactions
+(statics_core.supports) act on the pin at their node; a fixed support's couple
+acts on the first member there.
+
+The equations are assembled as sparse rows (a few terms each) and solved by
+sparse Gaussian elimination that pivots on the sparsest adequate row, so
+frames with hundreds of members solve in milliseconds. Results are cached per
+frame description.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+Member = namedtuple("Member", "name nodes")
+FrameLoad = namedtuple("FrameLoad", "at fx fy couple member")
+FrameSolution = namedtuple("FrameSolution", "status two_force axial pin_forces reactions")
+
+_PIVOT_RATIO = 0.1           # accept pivots within this fraction of the column's largest
+_EPS = 1e-10
+
+
+def member(name, *nodes):
+    """A rigid member pinned at the given node labels (at least two)."""
+    if len(nodes) < 2:
+        raise ValueError(f"member {name} needs at least two pins")
+    return Member(name, tuple(nodes))
+
+
+def load(at, fx=0.0, fy=0.0, couple=0.0, member=None):
+    """A point load (and/or couple, CCW positive).
+
+    at is a node label or an (x, y) point. Without member the load acts on
+    the pin at that node; with member it acts on that member (required for a
+    point that is not a node, and for a couple).
+    """
+    if member is None and (not isinstance(at, str) or couple):
+        raise ValueError("loads between nodes and couples must name their member")
+    return FrameLoad(at, float(fx), float(fy), float(couple), member)
+
+
+# ----------------------------
+# Sparse solve
+# ----------------------------
+def _sparse_solve(rows, rhs, n):
+    """Solve sparse rows ({col: coef}) = rhs for n unknowns.
+
+    Returns (values or None, rank, consistent). Rows are eliminated in place.
+    """
+    rows = [dict(r) for r in rows]
+    rhs = list(rhs)
+    by_col = {}
+    for i, r in enumerate(rows):
+        for c in r:
+            by_col.setdefault(c, set()).add(i)
+    pivot_of = {}
+    used = set()
+    for col in range(n):
+        cands = [i for i in by_col.get(col, ()) if i not in used and abs(rows[i].get(col, 0.0)) > _EPS]
+        if not cands:
+            continue
+        big = max(abs(rows[i][col]) for i in cands)
+        # Threshold pivoting: the sparsest row among the numerically adequate ones
+        p = min((i for i in cands if abs(rows[i][col]) >= _PIVOT_RATIO * big),
+                key=lambda i: len(rows[i]))
+        used.add(p)
+        pivot_of[col] = p
+        prow, pval = rows[p], rows[p][col]
+        for i in cands:
+            if i == p:
+                continue
+            row = rows[i]
+            f = row[col] / pval
+            for c, v in prow.items():
+                x = row.get(c, 0.0) - f * v
+                if abs(x) > _EPS:
+                    if c not in row:
+                        by_col.setdefault(c, set()).add(i)
+                    row[c] = x
+                else:
+                    row.pop(c, None)
+                    if c in by_col:
+                        by_col[c].discard(i)
+            rhs[i] -= f * rhs[p]
+    rank = len(pivot_of)
+    scale = max([1.0] + [abs(b) for b in rhs])
+    consistent = all(abs(rhs[i]) <= 1e-9 * scale for i in range(len(rows)) if i not in used and not rows[i])
+    if rank < n:
+        return None, rank, consistent
+    values = [0.0] * n
+    for col in sorted(pivot_of, reverse=True):
+        p = pivot_of[col]
+        row = rows[p]
+        values[col] = (rhs[p] - sum(v * values[c] for c, v in row.items() if c != col)) / row[col] + 0.0
+    return values, rank, consistent
+
+
+# ----------------------------
+# Frame
+# ----------------------------
+class Frame:
+    """Members pinned together at named nodes, with supports and loads."""
+
+    def __init__(self, nodes, members, supports=(), loads=()):
+        self.nodes = MappingProxyType({k: (float(x), float(y)) for k, (x, y) in nodes.items()})
+        self.members = tuple(members)
+        self.supports = tuple(supports)
+        self.loads = tuple(loads)
+        names = [m.name for m in self.members]
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate member name")
+        for m in self.members:
+            for n in m.nodes:
+                if n not in self.nodes:
+                    raise ValueError(f"member {m.name} uses unknown node {n}")
+        for s in self.supports:
+            if s.name not in self.nodes:
+                raise ValueError(f"support {s.name} is not at a node")
+        for l in self.loads:
+            if l.member is not None and l.member not in names:
+                raise ValueError(f"load on unknown member {l.member}")
+        self._key = (
+            tuple(sorted(self.nodes.items())),
+            self.members,
+            self.supports,
+            tuple(l._replace(at=self._point(l.at)) if l.member else l for l in self.loads),
+        )
+
+    def _point(self, at):
+        return self.nodes[at] if isinstance(at, str) else (float(at[0]), float(at[1]))
+
+    def two_force_members(self):
+        """Names of the members that carry only an axial force."""
+        return _analyse(*self._key)[0]
+
+    def solve(self):
+        """FrameSolution(status, two_force, axial, pin_forces, reactions).
+
+        status is "determinate", "indeterminate" or "unstable"; the force
+        mappings are empty unless the frame is determinate. axial holds the
+        two-force members' forces (tension positive), pin_forces the (x, y)
+        force each pin exerts on each other member, keyed (member, node), and
+        reactions the support reactions by name.
+        """
+        return _solve_frame(*self._key)
+
+
+@lru_cache(maxsize=64)
+def _analyse(nodes, members, supports, loads):
+    fixed_nodes = {s.name for s in supports if any(r.direction is None for r in s.reactions)}
+    loaded = {l.member for l in loads if l.member}
+    two_force = tuple(
+        m.name for m in members
+        if len(m.nodes) == 2 and m.name not in loaded and not fixed_nodes.intersection(m.nodes)
+    )
+    return two_force, fixed_nodes
+
+
+@lru_cache(maxsize=64)
+def _solve_frame(nodes, members, supports, loads):
+    coords = dict(nodes)
+    two_force, fixed_nodes = _analyse(nodes, members, supports, loads)
+    tf = set(two_force)
+
+    # Unknowns, in member order so that each member's columns sit together
+    cols = []
+    index = {}
+
+    def unknown(key):
+        index[key] = len(cols)
+        cols.append(key)
+        return index[key]
+
+    for m in members:
+        if m.name in tf:
+            unknown(("axial", m.name))
+        else:
+            for n in m.nodes:
+                unknown(("pin", m.name, n, "x"))
+                unknown(("pin", m.name, n, "y"))
+    for s in supports:
+        for r in s.reactions:
+            unknown(("reaction", r.name))
+
+    # Equations: ΣFx, ΣFy per pin, then ΣFx, ΣFy, ΣM per rigid member
+    pin_nodes = sorted({n for m in members for n in m.nodes})
+    pin_row = {n: (2 * i, 2 * i + 1) for i, n in enumerate(pin_nodes)}
+    rows = [dict() for _ in range(2 * len(pin_nodes))]
+    rhs = [0.0] * len(rows)
+    member_row = {}
+    first_member = {}
+    for m in members:
+        for n in m.nodes:
+            if m.name not in tf:
+                first_member.setdefault(n, m.name)
+        if m.name not in tf:
+            member_row[m.name] = len(rows)
+            rows += [dict(), dict(), dict()]
+            rhs += [0.0, 0.0, 0.0]
+
+    def add(row, col, value):
+        if value:
+            rows[row][col] = rows[row].get(col, 0.0) + value
+
+    for m in members:
+        if m.name in tf:
+            a, b = m.nodes
+            (ax, ay), (bx, by) = coords[a], coords[b]
+            length = ((bx - ax) ** 2 + (by - ay) ** 2) ** 0.5
+            if length == 0:
+                raise ValueError(f"member {m.name} has zero length")
+            ux, uy = (bx - ax) / length, (by - ay) / length
+            c = index[("axial", m.name)]
+            # In tension the member pulls each pin toward its other end
+            add(pin_row[a][0], c, ux)
+            add(pin_row[a][1], c, uy)
+            add(pin_row[b][0], c, -ux)
+            add(pin_row[b][1], c, -uy)
+            continue
+        fx, fy, mo = member_row[m.name], member_row[m.name] + 1, member_row[m.name] + 2
+        ox, oy = coords[m.nodes[0]]
+        for n in m.nodes:
+            cx, cy = index[("pin", m.name, n, "x")], index[("pin", m.name, n, "y")]
+            px, py = coords[n][0] - ox, coords[n][1] - oy
+            add(fx, cx, 1.0)
+            add(fy, cy, 1.0)
+            add(mo, cx, -py)
+            add(mo, cy, px)
+            # The member pushes back on the pin
+            add(pin_row[n][0], cx, -1.0)
+            add(pin_row[n][1], cy, -1.0)
+
+    for s in supports:
+        for r in s.reactions:
+            c = index[("reaction", r.name)]
+            if r.direction is None:
+                if s.name not in first_member:
+                    raise ValueError(f"fixed support {s.name} needs a rigid member at its node")
+                add(member_row[first_member[s.name]] + 2, c, 1.0)
+                continue
+            if s.name not in pin_row:
+                raise ValueError(f"support {s.name} is not at a member's pin")
+            add(pin_row[s.name][0], c, r.direction[0])
+            add(pin_row[s.name][1], c, r.direction[1])
+
+    for l in loads:
+        if l.member is None:
+            rx, ry = pin_row[l.at]
+            rhs[rx] -= l.fx
+            rhs[ry] -= l.fy
+        else:
+            if l.member in tf:
+                raise ValueError(f"load on two-force member {l.member}")
+            base = member_row[l.member]
+            ox, oy = coords[next(m for m in members if m.name == l.member).nodes[0]]
+            px, py = l.at[0] - ox, l.at[1] - oy
+            rhs[base] -= l.fx
+            rhs[base + 1] -= l.fy
+            rhs[base + 2] -= px * l.fy - py * l.fx + l.couple
+
+    values, rank, consistent = _sparse_solve(rows, rhs, len(cols))
+    n_unknowns, n_equations = len(cols), len(rows)
+    if values is not None and consistent:
+        status = "determinate"
+    elif rank < n_unknowns and n_unknowns > n_equations:
+        status = "indeterminate"
+    else:
+        status = "unstable"
+    if status != "determinate":
+        empty = MappingProxyType({})
+        return FrameSolution(status, two_force, empty, empty, empty)
+
+    axial, pins, reactions = {}, {}, {}
+    for key, v in zip(cols, values):
+        if key[0] == "axial":
+            axial[key[1]] = v
+        elif key[0] == "reaction":
+            reactions[key[1]] = v
+        else:
+            _, m, n, axis = key
+            fx_, fy_ = pins.get((m, n), (0.0, 0.0))
+            pins[(m, n)] = (v, fy_) if axis == "x" else (fx_, v)
+    return FrameSolution(status, two_force, MappingProxyType(axial),
+                         MappingProxyType(pins), MappingProxyType(reactions))
@@ -0,0 +1,73 @@
+"""Angle and vector helpers shared by the STATICS exercises (no Streamlit)."""
+
+import math
+
+
+# ----------------------------
+# Angles
+# ----------------------------
+def ang_diff(a, b):
+    """Smallest unsigned difference between two directions (deg)."""
+    d = (a - b + 180) % 360 - 180
+    return abs(d)
+
+
+def signed_ang_diff(a, b):
+    """Smallest signed difference a - b between two directions (deg)."""
+    return (a - b + 180.0) % 360.0 - 180.0
+
+
+# The included (tail-to-tail) angle is the same quantity as ang_diff; the
+# Compute step of the force-triangle exercise refers to it by this name.
+included_angle_deg = ang_diff
+
+
+def angle_rel_axes(theta_deg, beta_deg):
+    """Direction theta measured from axes rotated CCW by beta, wrapped to 0–360."""
+    return (theta_deg - beta_deg + 360.0) % 360.0
+
+
+# ----------------------------
+# Vectors / trig
+# ----------------------------
+def components(F, theta_deg):
+    """(Fx, Fy) of a force of magnitude F at theta_deg CCW from +x."""
+    t = math.radians(theta_deg)
+    return F * math.cos(t), F * math.sin(t)
+
+
+def law_of_cosines(Fa, Fb, gamma_deg):
+    """Side opposite the angle gamma_deg between sides Fa and Fb."""
+    g = math.radians(gamma_deg)
+    return math.sqrt(Fa**2 + Fb**2 - 2 * Fa * Fb * math.cos(g))
+
+
+def clamp_unit(x):
+    """Clamp to [-1, 1] for a safe asin/acos."""
+    return max(-1.0, min(1.0, x))
+
+
+# ----------------------------
+# Canvas (streamlit-drawable-canvas JSON)
+# ----------------------------
+def extract_lines(canvas_json):
+    """Line objects from a drawable-canvas JSON payload.
+
+    Each line is returned as {"p1", "p2", "angle", "length"} where angle is in
+    degrees CCW from +x in (-180, 180]. Canvas y grows downwards, so dy is
+    flipped before taking the angle.
+    """
+    objs = (canvas_json or {}).get("objects", [])
+    lines = []
+    for obj in objs:
+        if obj.get("type") == "line":
+            x1, y1 = obj["x1"], obj["y1"]
+            x2, y2 = obj["x2"], obj["y2"]
+            dx, dy_canvas = x2 - x1, y2 - y1
+            ang = math.degrees(math.atan2(-dy_canvas, dx))
+            if ang <= -180: ang += 360
+            if ang > 180: ang -= 360
+            L = math.hypot(dx, dy_canvas)
+            lines.append({"p1": (x1, y1), "p2": (x2, y2),
+                          "angle": ang, "length": L})
+    return lines
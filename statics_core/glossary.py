@@ -0,0 +1,118 @@
+"""Shared statics glossary for every exercise (no Streamlit).
+
+One store (data/glossary.json) holds each term once, with aliases, a general
+definition and optional per-problem overrides of the label or wording. Each
+problem selects the terms it teaches. load_glossary() parses the file once per
+process and prebuilds everything the Study step needs, so the apps render
+vocabulary cards straight from shared, read-only objects instead of
+rebuilding dictionaries on every rerun.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+from statics_core.matcher import get_matcher
+
+GLOSSARY_PATH = Path(__file__).with_name("data") / "glossary.json"
+
+
+class Glossary:
+    """Read-only glossary with an alias index and per-problem selections."""
+
+    def __init__(self, data):
+        entries = {}
+        alias_index = {}
+        for key, raw in data["terms"].items():
+            aliases = tuple(a.lower() for a in raw.get("aliases", ()))
+            entries[key] = MappingProxyType({
+                "key": key,
+                "label": raw["label"],
+                "aliases": aliases,
+                "definition": raw["definition"],
+            })
+            for name in (key, raw["label"].lower()) + aliases:
+                alias_index.setdefault(name, key)
+
+        self._entries = MappingProxyType(entries)
+        self._alias_index = MappingProxyType(alias_index)
+
+        # Per-problem views, built once
+        self._defs = {}
+        self._cards = {}
+        self._core = {}
+        self._scan = {}
+        for problem, sel in data["problems"].items():
+            defs = {}
+            cards = []
+            for key in sel["terms"]:
+                raw = data["terms"][key]
+                override = raw.get("problems", {}).get(problem, {})
+                definition = override.get("definition", raw["definition"])
+                defs[key] = definition
+                cards.append(MappingProxyType({
+                    "term": override.get("label", raw["label"]),
+                    "def": definition,
+                }))
+            self._defs[problem] = MappingProxyType(defs)
+            self._cards[problem] = tuple(cards)
+            self._core[problem] = tuple(sel.get("core", ()))
+            # every spelling the scanner should recognise, mapped to its term
+            spellings = []
+            for key in sel["terms"]:
+                spellings.append((key, key))
+                spellings.extend((alias, key) for alias in entries[key]["aliases"])
+            self._scan[problem] = tuple(spellings)
+
+    # ----------------------------
+    # Lookup
+    # ----------------------------
+    def lookup(self, name):
+        """Entry for a term key, label or alias (case-insensitive), or None."""
+        key = self._alias_index.get(name.strip().lower())
+        return self._entries[key] if key is not None else None
+
+    def __contains__(self, name):
+        return self.lookup(name) is not None
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def problems(self):
+        return tuple(self._defs)
+
+    # ----------------------------
+    # Per-problem selections
+    # ----------------------------
+    def definitions(self, problem):
+        """Read-only {term key: definition} for a problem, in teaching order."""
+        return self._defs[problem]
+
+    def cards(self, problem):
+        """Vocabulary cards for a problem as read-only {"term", "def"} mappings."""
+        return self._cards[problem]
+
+    def core_terms(self, problem):
+        """Terms the student must acknowledge before leaving the Study step."""
+        return self._core[problem]
+
+    def terms_in_text(self, problem, text):
+        """Problem terms (keys, teaching order) whose key or any alias occurs in text."""
+        return _terms_in_text(self, problem, text)
+
+
+@lru_cache(maxsize=256)
+def _terms_in_text(glossary, problem, text):
+    spellings = glossary._scan[problem]
+    found = set(get_matcher(tuple(s for s, _ in spellings)).find_terms(text))
+    hit_keys = {key for spelling, key in spellings if spelling in found}
+    return tuple(k for k in glossary._defs[problem] if k in hit_keys)
+
+
+@lru_cache(maxsize=None)
+def load_glossary(path=GLOSSARY_PATH):
+    """Parse the glossary store once per process and return the shared index."""
+    with open(path, encoding="utf-8") as f:
+        return Glossary(json.load(f))
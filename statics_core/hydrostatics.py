@@ -0,0 +1,130 @@
+"""Hydrostatic loads on a flat gate (no Streamlit).
+
+The gate is a straight plate AB of a given length, A at the top and B on the
+sill, inclined at `incline` degrees from the horizontal (90 = vertical). Water
+stands `upstream` metres above the sill on the loaded side and `downstream`
+metres on the other; either may be above or below A. The pressure at depth d
+is γ d, so along the plate (s from A) each side's load per unit length is
+
+    w(s) = γ b max(0, level - (H - s sin θ))        H = length sin θ
+
+with b the gate width. pressure_profile() returns the net load as
+breakpoints for statics_core.loads / solve_gate_load(), and the answer key
+solve_gate_hydrostatic() wraps the two.
+
+For "at what level does the sill reaction pass X" questions, sweep_levels()
+evaluates thousands of upstream levels from the closed-form integrals of the
+clipped linear profiles (constant work per level, no breakpoint lists), and
+level_for_reaction() bisects on the same formulas.
+"""
+
+import math
+from collections import namedtuple
+
+GRAVITY = 9.81               # m/s²
+WATER_DENSITY = 1000.0       # kg/m³
+
+LevelSweep = namedtuple("LevelSweep", "levels FR y_bar Ax Bx")
+
+
+def specific_weight(density=WATER_DENSITY, g=GRAVITY):
+    """γ = ρ g in kN/m³."""
+    return density * g / 1000.0
+
+
+def _geometry(length, incline):
+    if length <= 0:
+        raise ValueError("gate length must be positive")
+    sin = math.sin(math.radians(incline))
+    if sin <= 0:
+        raise ValueError("incline must be between 0 and 180 degrees")
+    return sin, length * sin
+
+
+def _side(level, sin, H, gamma, width):
+    """(s where this side's water surface meets the plate, load slope per metre of s)."""
+    return (H - level) / sin, gamma * width * sin
+
+
+def pressure_profile(length, upstream, downstream=0.0, incline=90.0,
+                     gamma=None, width=1.0):
+    """Net load breakpoints ((s, w kN/m), ...) along the gate from A to B.
+
+    gamma is the fluid's specific weight in kN/m³ (water by default); the
+    downstream water pushes back, so the net load can change sign.
+    """
+    gamma = specific_weight() if gamma is None else gamma
+    sin, H = _geometry(length, incline)
+    sides = [(_side(level, sin, H, gamma, width), sign)
+             for level, sign in ((upstream, 1.0), (downstream, -1.0)) if level > 0]
+    stations = {0.0, float(length)}
+    stations.update(s0 for (s0, _), _ in sides if 0.0 < s0 < length)
+
+    def w(s):
+        return sum(sign * k * max(0.0, s - s0) for (s0, k), sign in sides) + 0.0
+
+    return tuple((s, w(s)) for s in sorted(stations))
+
+
+# ----------------------------
+# Level sweeps
+# ----------------------------
+def _integrals(s0, k, length):
+    """∫ w ds and ∫ s w ds over the plate for w = k max(0, s - s0)."""
+    a = max(0.0, s0)
+    if a >= length:
+        return 0.0, 0.0
+    L = length
+    F = 0.5 * k * ((L - s0) ** 2 - (a - s0) ** 2)
+    M = k * ((L ** 3 - a ** 3) / 3.0 - s0 * (L ** 2 - a ** 2) / 2.0)
+    return F, M
+
+
+def _reactions(length, level, back, sin, H, gamma, width):
+    """(FR, ȳ, Ax, Bx) for one upstream level; ΣM_A = 0 gives Bx."""
+    F, M = _integrals(*_side(level, sin, H, gamma, width), length)
+    if back:
+        Fb, Mb = _integrals(*back, length)
+        F, M = F - Fb, M - Mb
+    Bx = M / length
+    return F, (M / F if F else None), F - Bx, Bx
+
+
+def sweep_levels(length, levels, downstream=0.0, incline=90.0, gamma=None, width=1.0):
+    """LevelSweep(levels, FR, y_bar, Ax, Bx), one entry per upstream level."""
+    gamma = specific_weight() if gamma is None else gamma
+    sin, H = _geometry(length, incline)
+    back = _side(downstream, sin, H, gamma, width) if downstream > 0 else None
+    levels = tuple(float(h) for h in levels)
+    rows = [_reactions(length, h, back, sin, H, gamma, width) for h in levels]
+    columns = tuple(zip(*rows)) or ((),) * 4
+    return LevelSweep(levels, *columns)
+
+
+def level_for_reaction(length, target, reaction="Bx", downstream=0.0, incline=90.0,
+                       gamma=None, width=1.0, max_level=100.0, tol=1e-6):
+    """Lowest upstream level (m above the sill) at which a reaction reaches target.
+
+    reaction is "Bx" (sill), "Ax" (top) or "FR". The reactions grow with the
+    upstream level, so this bisects; None if target is not reached by max_level.
+    """
+    gamma = specific_weight() if gamma is None else gamma
+    sin, H = _geometry(length, incline)
+    back = _side(downstream, sin, H, gamma, width) if downstream > 0 else None
+    index = {"FR": 0, "Ax": 2, "Bx": 3}[reaction]
+
+    def value(h):
+        return _reactions(length, h, back, sin, H, gamma, width)[index]
+
+    lo, hi = 0.0, float(max_level)
+    if value(hi) < target:
+        return None
+    if value(lo) >= target:
+        return lo
+    while hi - lo > tol:
+        mid = 0.5 * (lo + hi)
+        if value(mid) >= target:
+            hi = mid
+        else:
+            lo = mid
+    return hi
@@ -0,0 +1,140 @@
+"""Influence lines and moving loads for a beam on two supports (no Streamlit).
+
+The beam runs from left to right on a roller at x_A and a pin at x_B (either
+may sit inside the beam, so overhangs are allowed), loaded by vertical point
+loads. For a unit downward load at s the responses are linear in s between
+the supports and sections:
+
+    Ay(s) = (x_B - s) / (x_B - x_A)            By(s) = 1 - Ay(s)
+    V_c(s) = sum of reactions left of c  - [s < c]
+    M_c(s) = sum of R (c - x_R) left of c  - [s < c] (c - s)
+
+with shear positive when the left segment is pushed up and moment positive
+in sagging. Each influence line is stored as its breakpoints plus one
+(slope, intercept) per piece, so a load train at thousands of positions is
+one linear-merge pass per load and quantity: no per-position solve. Sweeps
+are cached per (beam, train, sections, resolution). Extremes are exact: the
+positions where a load crosses a breakpoint are evaluated as well.
+
+    sweep = moving_load(0, 9, 0, 13, train=((3, 15), (11, 6), (13, 6)), sections=(3,))
+    sweep.responses["M@3"]       # moment at x = 3 for every train position
+    sweep.extremes["Ay"]         # Extreme(low, at_low, high, at_high)
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+SWEEP_POSITIONS = 1001
+
+Piece = namedtuple("Piece", "start slope intercept")
+Extreme = namedtuple("Extreme", "low at_low high at_high")
+MovingLoad = namedtuple("MovingLoad", "positions responses extremes")
+
+
+def quantity_names(sections=()):
+    """Response names for a beam: Ay, By, then V@c and M@c per section."""
+    names = ["Ay", "By"]
+    for c in sections:
+        names += [f"V@{c:g}", f"M@{c:g}"]
+    return tuple(names)
+
+
+def _reactions(x_A, x_B):
+    """(slope, intercept) of Ay(s) and By(s) for a unit downward load."""
+    span = x_B - x_A
+    if span == 0:
+        raise ValueError("supports A and B coincide")
+    return (-1.0 / span, x_B / span), (1.0 / span, -x_A / span)
+
+
+@lru_cache(maxsize=256)
+def influence_lines(x_A, x_B, sections=()):
+    """{name: (Piece, ...)} for Ay, By and the shear and moment at each section.
+
+    Pieces are sorted by start; the first one extends to -inf. The line is
+    evaluated as slope * s + intercept on [start, next start).
+    """
+    ay, by = _reactions(x_A, x_B)
+    lines = {"Ay": (Piece(float("-inf"), *ay),), "By": (Piece(float("-inf"), *by),)}
+    for c in sections:
+        # Reactions acting on the segment left of the section
+        left = [(x, r) for x, r in ((x_A, ay), (x_B, by)) if x < c]
+        v = (sum(r[0] for _, r in left), sum(r[1] for _, r in left))
+        m = (sum(r[0] * (c - x) for x, r in left), sum(r[1] * (c - x) for x, r in left))
+        # A load left of c adds -1 to V and -(c - s) to M
+        lines[f"V@{c:g}"] = (Piece(float("-inf"), v[0], v[1] - 1.0), Piece(c, *v))
+        lines[f"M@{c:g}"] = (Piece(float("-inf"), m[0] + 1.0, m[1] - c), Piece(c, *m))
+    return MappingProxyType(lines)
+
+
+def influence_value(pieces, s):
+    """Ordinate of one influence line at s."""
+    piece = pieces[bisect_right([p.start for p in pieces], s) - 1]
+    return piece.slope * s + piece.intercept
+
+
+def moving_load(x_A, x_B, left, right, train=((0.0, 1.0),), sections=(), n=SWEEP_POSITIONS):
+    """Responses to a load train rolled across the beam from left to right.
+
+    train    -- ((offset, P), ...): downward loads at train position + offset
+    sections -- x positions at which to report shear and moment
+    n        -- number of train positions, evenly spaced so that every load
+                crosses the whole beam; loads off the beam carry nothing
+
+    Returns MovingLoad(positions, responses, extremes), responses and
+    extremes keyed by quantity_names(sections).
+    """
+    train = tuple((float(o), float(P)) for o, P in train)
+    sections = tuple(float(c) for c in sections)
+    return _sweep(float(x_A), float(x_B), float(left), float(right), train, sections, int(n))
+
+
+@lru_cache(maxsize=128)
+def _sweep(x_A, x_B, left, right, train, sections, n):
+    if not train:
+        raise ValueError("empty load train")
+    if n < 2:
+        raise ValueError("need at least two positions")
+    offsets = [o for o, _ in train]
+    start, stop = left - max(offsets), right - min(offsets)
+    step = (stop - start) / (n - 1)
+    positions = tuple(start + i * step for i in range(n))
+
+    lines = influence_lines(x_A, x_B, sections)
+    responses = {}
+    for name in quantity_names(sections):
+        pieces = lines[name]
+        total = [0.0] * n
+        for offset, P in train:
+            # Positions are increasing, so walk the pieces alongside them
+            k = 0
+            for i, p in enumerate(positions):
+                s = p + offset
+                if s < left or s > right:
+                    continue
+                while k + 1 < len(pieces) and s >= pieces[k + 1].start:
+                    k += 1
+                total[i] += P * (pieces[k].slope * s + pieces[k].intercept)
+        responses[name] = tuple(total)
+
+    # The response is piecewise linear in the position, so its extremes sit
+    # where some load is over a support, a section or a beam end: check those
+    # positions, and just either side of them for the jumps, as well as the grid.
+    stations = (left, right, x_A, x_B) + sections
+    eps = 1e-9 * max(1.0, right - left)
+    critical = sorted({min(max(b - o + d, start), stop)
+                       for o in offsets for b in stations for d in (-eps, 0.0, eps)
+                       if start <= b - o <= stop})
+    extremes = {}
+    for name, values in responses.items():
+        pieces = lines[name]
+        points = list(zip(values, positions)) + [
+            (sum(P * influence_value(pieces, p + o) for o, P in train if left <= p + o <= right), p)
+            for p in critical
+        ]
+        lo = min(points, key=lambda vp: vp[0])
+        hi = max(points, key=lambda vp: vp[0])
+        extremes[name] = Extreme(lo[0], lo[1], hi[0], hi[1])
+    return MovingLoad(positions, MappingProxyType(responses), MappingProxyType(extremes))
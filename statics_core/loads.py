@@ -0,0 +1,123 @@
+"""Distributed loads as composite shapes (no Streamlit).
+
+A load diagram is given by its breakpoints ((s, w), ...) along the member:
+s is the position, w the intensity, linear in between. A repeated s is a jump.
+resolve_load() splits every segment into a rectangle (the smaller end
+intensity) and a triangle (the rise or drop to the other end), or into two
+triangles where the load changes sign. It finds each piece's area and
+centroid with the shoelace formula and adds them up to one equivalent
+resultant:
+
+    FR = Σ A_i          s̄ = Σ A_i s̄_i / FR
+
+The pieces are kept for the hints ("a 3 m triangle rising to 45 kN/m: area
+67.5 kN at 2.00 m"). Intensities may change sign; the shoelace sums are signed,
+so the pieces below the axis subtract. Each breakpoint list is resolved once
+per process.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+LoadPiece = namedtuple("LoadPiece", "kind start end h_start h_end area centroid")
+Resultant = namedtuple("Resultant", "force location pieces")
+
+_EPS = 1e-12
+
+
+def _shoelace(vertices):
+    """Signed area and centroid x of a closed polygon, one pass over its edges."""
+    a = cx = 0.0
+    n = len(vertices)
+    for i in range(n):
+        x0, y0 = vertices[i]
+        x1, y1 = vertices[(i + 1) % n]
+        cross = x0 * y1 - x1 * y0
+        a += cross
+        cx += (x0 + x1) * cross
+    a *= 0.5
+    return a, (cx / (6.0 * a) if abs(a) > _EPS else None)
+
+
+def _pieces(s0, w0, s1, w1):
+    """(kind, start, end, h_start, h_end, vertices) making up one linear segment.
+
+    A segment that crosses the axis is split there into two triangles;
+    otherwise it is a rectangle up to the smaller end intensity plus a
+    triangle for the rest. h_start and h_end are the piece's own heights.
+    """
+    if w0 * w1 < 0:
+        sz = s0 + (s1 - s0) * w0 / (w0 - w1)
+        return _pieces(s0, w0, sz, 0.0) + _pieces(sz, 0.0, s1, w1)
+    base = w0 if abs(w0) <= abs(w1) else w1
+    out = []
+    if base:
+        out.append(("rectangle", s0, s1, base, base,
+                    ((s0, 0.0), (s0, base), (s1, base), (s1, 0.0))))
+    if w0 != w1:
+        out.append(("triangle", s0, s1, w0 - base, w1 - base,
+                    ((s0, base), (s0, w0), (s1, w1), (s1, base))))
+    return out
+
+
+def resolve_load(points):
+    """Resultant(force, location, pieces) of a piecewise-linear distributed load.
+
+    points -- ((s, w), ...) in order of s; a repeated s is a jump in w.
+    location is None when the load sums to zero (a pure couple, or no load).
+    """
+    return _resolve(tuple((float(s), float(w)) for s, w in points))
+
+
+@lru_cache(maxsize=256)
+def _resolve(points):
+    if len(points) < 2:
+        raise ValueError("a distributed load needs at least two breakpoints")
+    pieces = []
+    force = moment = 0.0
+    for (s0, w0), (s1, w1) in zip(points, points[1:]):
+        if s1 < s0:
+            raise ValueError(f"breakpoints must be in order of position ({s0:g} > {s1:g})")
+        if s1 == s0:
+            continue                        # a jump carries no load
+        for kind, start, end, h0, h1, vertices in _pieces(s0, w0, s1, w1):
+            # The vertices run clockwise in (s, w) for a positive load, so the
+            # shoelace area is -∫ w ds
+            area, centroid = _shoelace(vertices)
+            area = -area
+            if abs(area) <= _EPS:
+                continue
+            pieces.append(LoadPiece(kind, start, end, h0, h1, area, centroid))
+            force += area
+            moment += area * centroid
+    location = moment / force if abs(force) > _EPS else None
+    return Resultant(force, location, tuple(pieces))
+
+
+def describe_load(resultant, force_unit="kN", length_unit="m", detail="full"):
+    """One hint line per piece.
+
+    detail -- "shape": the piece and its size only; "centroid": plus where a
+              piece of that shape has its centroid; "full": area and centroid
+              worked out.
+    """
+    lines = []
+    for p in resultant.pieces:
+        length = p.end - p.start
+        height = p.h_start if abs(p.h_start) >= abs(p.h_end) else p.h_end
+        line = (f"{p.kind.capitalize()} from {p.start:g} to {p.end:g} {length_unit}, "
+                f"height {height:g} {force_unit}/{length_unit}")
+        if detail == "shape":
+            line += "."
+        elif detail == "centroid":
+            if p.kind == "rectangle":
+                line += ": its centroid is at the middle of its length."
+            else:
+                tall = p.start if abs(p.h_start) >= abs(p.h_end) else p.end
+                line += f": its centroid is 1/3 of its length from the tall end (at {tall:g} {length_unit})."
+        else:
+            area = f"{length:g} × {height:g}" if p.kind == "rectangle" else f"½ × {length:g} × {height:g}"
+            line += (f": area {area} = {p.area:g} {force_unit}, "
+                     f"centroid at {p.centroid:.2f} {length_unit}.")
+        lines.append(line)
+    return lines
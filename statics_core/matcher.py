@@ -0,0 +1,138 @@
+"""Single-pass keyword and pattern matching for the Study step (no Streamlit).
+
+Glossary terms are compiled into one Aho-Corasick automaton, so finding which
+terms occur in a problem statement (or in a student's free text) is one walk
+over the text no matter how many terms the glossary holds. Named answer
+patterns (regexes for free-text answers, such as "area" and "centroid" in the
+gate exercise) are folded into one combined regex that reports every pattern
+matching at a position in the same scan.
+
+Build matchers through get_matcher(): it caches them per process, so every
+rerun and every session reuses the same compiled automaton.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class TextMatcher:
+    """Case-insensitive matcher for whole-word terms plus named regex patterns.
+
+    terms     -- iterable of literal terms; a term matches like rf"\\b{term}\\b"
+    patterns  -- mapping name -> regex (re.IGNORECASE). Patterns must not use
+                 named groups or numbered backreferences, since they are
+                 embedded in a combined regex.
+    """
+
+    def __init__(self, terms=(), patterns=None):
+        self.terms = tuple(terms)
+        self.pattern_names = tuple((patterns or {}).keys())
+        self._build_automaton([t.lower() for t in self.terms])
+        self._build_pattern_regex(patterns or {})
+
+    # ----------------------------
+    # Construction
+    # ----------------------------
+    def _build_automaton(self, lowered):
+        goto = [{}]          # state -> {char: next_state}
+        out = [[]]           # state -> term indices ending here
+        for idx, term in enumerate(lowered):
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(idx)
+
+        # Breadth-first failure links; depth-1 states fail back to the root
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in out]
+        self._lens = [len(t) for t in lowered]
+
+    def _build_pattern_regex(self, patterns):
+        if not patterns:
+            self._pattern_rx = None
+            return
+        bodies = list(patterns.values())
+        # The leading lookahead lets the C engine skip positions where nothing
+        # matches; the optional lookaheads then capture every pattern that
+        # matches at that position (overlapping matches are all reported).
+        union = "|".join(f"(?:{p})" for p in bodies)
+        chain = "".join(f"(?:(?=(?P<p{i}>{p})))?" for i, p in enumerate(bodies))
+        self._pattern_rx = re.compile(f"(?=(?:{union})){chain}", re.IGNORECASE)
+
+    # ----------------------------
+    # Scanning
+    # ----------------------------
+    def find_terms(self, text):
+        """Terms present in text, in the order they were given at construction."""
+        if not self.terms or not text:
+            return []
+        low = text.lower()
+        n = len(low)
+        goto, fail, out, lens = self._goto, self._fail, self._out, self._lens
+        hits = set()
+        state = 0
+        for i, ch in enumerate(low):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for idx in out[state]:
+                    start = i - lens[idx] + 1
+                    # emulate \b on both ends of the term
+                    before = _is_word(low[start - 1]) if start > 0 else False
+                    after = _is_word(low[i + 1]) if i + 1 < n else False
+                    if before != _is_word(low[start]) and after != _is_word(ch):
+                        hits.add(idx)
+        return [self.terms[i] for i in sorted(hits)]
+
+    def match_patterns(self, text):
+        """Names of the patterns that occur anywhere in text."""
+        if self._pattern_rx is None or not text:
+            return set()
+        names = self.pattern_names
+        hits = set()
+        for m in self._pattern_rx.finditer(text):
+            for i, name in enumerate(names):
+                if m.group(f"p{i}") is not None:
+                    hits.add(name)
+            if len(hits) == len(names):
+                break
+        return hits
+
+    def scan(self, text):
+        """(terms, pattern names) found in text."""
+        return self.find_terms(text), self.match_patterns(text)
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(terms, patterns):
+    return TextMatcher(terms, dict(patterns))
+
+
+def get_matcher(terms=(), patterns=None):
+    """Process-wide cached TextMatcher for this set of terms and patterns."""
+    return _cached_matcher(tuple(terms), tuple((patterns or {}).items()))
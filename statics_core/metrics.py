@@ -0,0 +1,119 @@
+"""Render-time metrics in the Prometheus text format (no Streamlit).
+
+A Metrics registry holds counters and fixed-bucket histograms keyed by metric
+name and label values. Recording is a lock, a bisect and a few list updates,
+so it costs microseconds. A daemon thread renders the registry to
+<data dir>/metrics.prom every WRITE_INTERVAL seconds (and at exit), which a
+node_exporter textfile collector or a plain `cat` can read.
+
+Metrics are off unless STATICS_METRICS is set to a true value.
+"""
+
+import atexit
+import os
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+
+from statics_core.config import data_dir, env_flag
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+WRITE_INTERVAL = 15.0
+
+HELP = {
+    "statics_reruns_total": ("counter", "Script reruns."),
+    "statics_sessions_total": ("counter", "Sessions that ran the script at least once."),
+    "statics_rerun_seconds": ("histogram", "Wall time of a whole script rerun."),
+    "statics_step_seconds": ("histogram", "Time spent rendering one STATICS step in a rerun."),
+    "statics_check_seconds": ("histogram", "Time from grading a Check to the end of its step's render."),
+}
+
+
+def metrics_enabled():
+    return env_flag("STATICS_METRICS")
+
+
+class Metrics:
+    """Thread-safe counters and histograms with Prometheus text output."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}      # (name, labels) -> value
+        self._hists = {}         # (name, labels) -> [bucket counts..., +Inf count, sum]
+
+    def inc(self, name, labels=(), value=1):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        key = (name, labels)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            h = self._hists.get(key)
+            if h is None:
+                h = self._hists[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            h[i] += 1
+            h[-1] += value
+
+    def render(self):
+        """Registry in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            hists = sorted((k, list(v)) for k, v in self._hists.items())
+        lines = []
+        described = set()
+
+        def header(name):
+            if name not in described and name in HELP:
+                kind, text = HELP[name]
+                lines.append(f"# HELP {name} {text}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+
+        for (name, labels), value in counters:
+            header(name)
+            lines.append(f"{name}{_labels(labels)} {value}")
+        for (name, labels), h in hists:
+            header(name)
+            cumulative = 0
+            for bound, n in zip(self.buckets + ("+Inf",), h[:-1]):
+                cumulative += n
+                lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {h[-1]:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_loop(metrics, path, stop):
+    while not stop.wait(WRITE_INTERVAL):
+        metrics.write(path)
+
+
+@lru_cache(maxsize=None)
+def get_metrics(path=None):
+    """Process-wide registry, written to <data dir>/metrics.prom in the background."""
+    metrics = Metrics()
+    path = str(path or data_dir() / "metrics.prom")
+    stop = threading.Event()
+    threading.Thread(target=_write_loop, args=(metrics, path, stop),
+                     name="statics-metrics", daemon=True).start()
+    atexit.register(lambda: (stop.set(), metrics.write(path)))
+    return metrics
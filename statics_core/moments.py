@@ -0,0 +1,103 @@
+"""Moment-point advisor (no Streamlit).
+
+Given the unknown forces on a body or a cut section, as lines of action, and
+the named nodes of the structure, rank_moment_points() lists where to sum
+moments so that ΣM = 0 has the fewest unknowns left. Candidates are every
+named node plus the intersection of every pair of unknown lines, which is
+where the textbook "point where the other two forces meet" lives even when it
+is off the structure. With a target unknown, points that would also remove
+the target are dropped, so the best point isolates that force.
+
+Lines are held as a x + b y = c with (a, b) a unit normal. The pairwise
+intersections come from one Cramer's-rule pass over the line table, and each
+candidate is tested against all lines with one dot product per line. The
+ranking is cached per geometry, so a truss with hundreds of nodes pays for
+it once per process.
+
+check_moment_point() grades a student's choice against the ranking; any
+point that does as well as the best one is accepted.
+"""
+
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+MomentPoint = namedtuple("MomentPoint", "label point eliminated remaining")
+MomentCheck = namedtuple("MomentCheck", "ok chosen best")
+Line = namedtuple("Line", "name point direction")         # direction None: a couple
+
+_EPS = 1e-9
+
+
+def member_line(name, p, q):
+    """Unknown member force along the member from node p to node q."""
+    dx, dy = q[0] - p[0], q[1] - p[1]
+    length = math.hypot(dx, dy)
+    if length == 0:
+        raise ValueError(f"member {name} has zero length")
+    return Line(name, (float(p[0]), float(p[1])), (dx / length, dy / length))
+
+
+def rank_moment_points(lines, nodes=None, target=None):
+    """MomentPoints ordered best first (most unknowns eliminated).
+
+    lines  -- unknowns as (name, point, direction) tuples; a None direction
+              is a couple, which no moment point removes
+    nodes  -- {label: (x, y)} named candidate points
+    target -- name of the unknown to isolate; points on its line are skipped
+
+    Ties go to named nodes, then to points where more lines are anchored
+    (for supports, where more reactions are applied).
+    """
+    lines = tuple(Line(*l) for l in lines)
+    nodes = tuple((label, (float(x), float(y))) for label, (x, y) in (nodes or {}).items())
+    return _rank(lines, nodes, target)
+
+
+@lru_cache(maxsize=256)
+def _rank(lines, nodes, target):
+    forces = [l for l in lines if l.direction is not None]
+    # Line table: unit normal (a, b) and offset c, so a x + b y = c on the line
+    table = []
+    for l in forces:
+        (px, py), (ux, uy) = l.point, l.direction
+        a, b = -uy, ux
+        table.append((l.name, a, b, a * px + b * py))
+
+    size = max([1.0] + [abs(c) for _, p in nodes for c in p] + [abs(c) for l in forces for c in l.point])
+    tol = 1e-7 * size
+
+    candidates = list(nodes)
+    for i in range(len(table)):
+        _, a1, b1, c1 = table[i]
+        for j in range(i + 1, len(table)):
+            _, a2, b2, c2 = table[j]
+            det = a1 * b2 - a2 * b1
+            if abs(det) > _EPS:
+                candidates.append((None, ((c1 * b2 - c2 * b1) / det, (a1 * c2 - a2 * c1) / det)))
+
+    seen = {}
+    for label, point in candidates:
+        key = (round(point[0] / tol), round(point[1] / tol))
+        if key not in seen or (label and not seen[key][0]):
+            seen[key] = (label, point)
+
+    names = tuple(l.name for l in lines)
+    ranked = []
+    for label, (x, y) in seen.values():
+        gone = tuple(name for name, a, b, c in table if abs(a * x + b * y - c) <= tol)
+        if target is not None and target in gone:
+            continue
+        anchored = sum(1 for l in lines if abs(l.point[0] - x) <= tol and abs(l.point[1] - y) <= tol)
+        ranked.append(((len(gone), label is not None, anchored),
+                       MomentPoint(label, (x, y), gone, tuple(n for n in names if n not in gone))))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return tuple(mp for _, mp in ranked)
+
+
+def check_moment_point(ranking, label):
+    """MomentCheck for the named point a student picked (ok if it ties the best)."""
+    best = ranking[0] if ranking else None
+    chosen = next((mp for mp in ranking if mp.label == label), None)
+    ok = best is not None and chosen is not None and len(chosen.eliminated) == len(best.eliminated)
+    return MomentCheck(ok, chosen, best)
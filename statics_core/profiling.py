@@ -0,0 +1,127 @@
+"""Opt-in sampling profiler for script reruns (no Streamlit).
+
+Set STATICS_PROFILE to a fraction between 0 and 1 (e.g. 0.05) and that share
+of reruns in every app is run under cProfile. Each sampled rerun is dumped to
+<data dir>/profiles/<problem>-step<N>-<time>-<pid>-<n>.prof, tagged with the
+problem and the furthest step rendered in that rerun. The variable is read
+once at import, so with it unset a rerun pays a single comparison.
+
+Rank the hottest functions across every saved profile with:
+
+    python -m statics_core.profiling [--problem ring] [--step 6] [--top 25]
+"""
+
+import argparse
+import cProfile
+import itertools
+import os
+import pstats
+import random
+import re
+import time
+
+from statics_core.config import data_dir
+
+PROFILE_ENV = "STATICS_PROFILE"
+
+_NAME = re.compile(r"^(?P<problem>[\w-]+?)-step(?P<step>\d+)-.*\.prof$")
+_counter = itertools.count(1)
+
+
+def profile_rate():
+    """Sampling fraction from STATICS_PROFILE (0 when unset or invalid)."""
+    try:
+        rate = float(os.environ.get(PROFILE_ENV, 0))
+    except ValueError:
+        return 0.0
+    return min(max(rate, 0.0), 1.0)
+
+
+PROFILE_RATE = profile_rate()
+
+
+def profile_dir():
+    path = data_dir() / "profiles"
+    path.mkdir(exist_ok=True)
+    return path
+
+
+class RerunProfile:
+    """cProfile around one rerun; stop() writes the tagged .prof file."""
+
+    def __init__(self):
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self, problem, step):
+        self._profiler.disable()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{problem}-step{step}-{stamp}-{os.getpid()}-{next(_counter)}.prof"
+        path = profile_dir() / name
+        self._profiler.dump_stats(path)
+        return path
+
+
+def start_sampled_profile():
+    """A running RerunProfile for a sampled rerun, else None."""
+    if not PROFILE_RATE or random.random() >= PROFILE_RATE:
+        return None
+    try:
+        return RerunProfile()
+    except ValueError:
+        return None                     # another profiler already owns the interpreter
+
+
+# ----------------------------
+# Viewer
+# ----------------------------
+def find_profiles(directory=None, problem=None, step=None):
+    """Saved profile paths, optionally filtered by problem and step."""
+    directory = directory or profile_dir()
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        m = _NAME.match(name)
+        if m is None:
+            continue
+        if problem is not None and m["problem"] != problem:
+            continue
+        if step is not None and int(m["step"]) != step:
+            continue
+        paths.append(os.path.join(directory, name))
+    return paths
+
+
+def hottest(paths, top=25, sort="tottime"):
+    """(function, calls, tottime, cumtime) rows merged over paths, hottest first."""
+    if not paths:
+        return []
+    stats = pstats.Stats(paths[0])
+    for path in paths[1:]:
+        stats.add(path)
+    col = {"tottime": 2, "cumtime": 3, "calls": 1}[sort]
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _callers) in stats.stats.items():
+        where = f"{os.path.basename(filename)}:{line}({func})" if line else func
+        rows.append((where, nc, tt, ct))
+    rows.sort(key=lambda r: r[col], reverse=True)
+    return rows[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank the hottest functions in saved rerun profiles.")
+    parser.add_argument("directory", nargs="?", default=None)
+    parser.add_argument("--problem")
+    parser.add_argument("--step", type=int)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--sort", choices=("tottime", "cumtime", "calls"), default="tottime")
+    args = parser.parse_args(argv)
+
+    paths = find_profiles(args.directory, args.problem, args.step)
+    print(f"{len(paths)} profiles")
+    print(f"{'calls':>10} {'tottime':>10} {'cumtime':>10}  function")
+    for where, calls, tt, ct in hottest(paths, args.top, args.sort):
+        print(f"{calls:>10} {tt:>10.4f} {ct:>10.4f}  {where}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Local progress store so students can resume a problem (no Streamlit).
+
+Checkpoints live in one SQLite database in WAL mode, one row per
+(student, problem) keyed by the primary key, so resuming is a single indexed
+read. Writes are debounced: save() only records the latest state in memory and
+a background timer flushes everything pending in one transaction, so a burst
+of reruns costs one write per student rather than one per rerun. A batch that
+fails to write is logged and kept for the next timer, not dropped.
+"""
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from statics_core.config import data_dir
+
+FLUSH_DELAY = 2.0  # seconds between the first pending save and the batch write
+
+_log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    student TEXT NOT NULL,
+    problem TEXT NOT NULL,
+    state   TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (student, problem)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO progress (student, problem, state, updated) VALUES (?, ?, ?, ?)
+ON CONFLICT (student, problem) DO UPDATE SET state = excluded.state, updated = excluded.updated
+"""
+
+
+# ----------------------------
+# State encoding (JSON, with sets kept as sets)
+# ----------------------------
+def _default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return {"__set__": sorted(obj, key=str)}
+    raise TypeError(f"Cannot checkpoint value of type {type(obj).__name__}")
+
+
+def _object_hook(obj):
+    if len(obj) == 1 and "__set__" in obj:
+        return set(obj["__set__"])
+    return obj
+
+
+def encode_state(state):
+    """Compact JSON text for a state dict (sets survive the round trip)."""
+    return json.dumps(state, default=_default, separators=(",", ":"), sort_keys=True)
+
+
+def decode_state(text):
+    return json.loads(text, object_hook=_object_hook)
+
+
+# ----------------------------
+# Store
+# ----------------------------
+class ProgressStore:
+    """Debounced, batched checkpoints of per-student problem state."""
+
+    def __init__(self, path, flush_delay=FLUSH_DELAY):
+        self.path = str(path)
+        self.flush_delay = flush_delay
+        self._lock = threading.Lock()
+        self._pending = {}          # (student, problem) -> (state json, time)
+        self._timer = None
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def save(self, student, problem, state):
+        """Queue a checkpoint; state is a dict or text from encode_state()."""
+        if not isinstance(state, str):
+            state = encode_state(state)
+        with self._lock:
+            self._pending[(student, problem)] = (state, time.time())
+            self._schedule()
+        if self.flush_delay <= 0:
+            self.flush()
+
+    def _schedule(self):
+        """Start the flush timer if none is running (call with the lock held)."""
+        if self._timer is None and self.flush_delay > 0:
+            self._timer = threading.Timer(self.flush_delay, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        # Nothing would see an exception raised in the timer thread
+        try:
+            self.flush()
+        except Exception:
+            _log.exception("writing %d checkpoint(s) to %s failed; retrying",
+                           len(self._pending), self.path)
+            with self._lock:
+                self._schedule()
+
+    def load(self, student, problem):
+        """Latest state for (student, problem), or None if never saved."""
+        with self._lock:
+            pending = self._pending.get((student, problem))
+            if pending is None:
+                row = self._conn.execute(
+                    "SELECT state FROM progress WHERE student = ? AND problem = ?",
+                    (student, problem),
+                ).fetchone()
+        text = pending[0] if pending is not None else (row[0] if row else None)
+        return decode_state(text) if text is not None else None
+
+    def clear(self, student, problem):
+        """Forget a student's progress on a problem (Reset buttons)."""
+        with self._lock:
+            self._pending.pop((student, problem), None)
+            self._conn.execute(
+                "DELETE FROM progress WHERE student = ? AND problem = ?", (student, problem)
+            )
+
+    def flush(self):
+        """Write every pending checkpoint in one transaction.
+
+        If the write fails the batch is pending again and the error propagates.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not batch:
+                return 0
+            rows = [(s, p, state, ts) for (s, p), (state, ts) in batch.items()]
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(_UPSERT, rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                self._pending = batch   # no save() got in: the lock is still held
+                raise
+        return len(rows)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=None)
+def get_progress_store(path=None):
+    """Process-wide ProgressStore (default file: <data dir>/progress.sqlite3)."""
+    store = ProgressStore(path or data_dir() / "progress.sqlite3")
+    atexit.register(store.flush)
+    return store
@@ -0,0 +1,290 @@
+"""Reference solutions (answer keys) for each STATICS exercise.
+
+Each solver takes the problem parameters (defaulting to the numbers used in the
+apps) and returns a read-only mapping of the quantities the Check buttons grade
+against. Member forces follow the tension-positive convention used in the
+exercises: a negative value means compression.
+
+Solvers are wrapped by @answer_key: results are cached process-wide by the
+full parameter set (defaults filled in), so every rerun of every session
+shares one computed, immutable answer key per problem variant.
+"""
+
+import functools
+import inspect
+import math
+from types import MappingProxyType
+
+from statics_core.geometry import components, ang_diff, angle_rel_axes
+from statics_core.hydrostatics import pressure_profile
+from statics_core import frames
+from statics_core.loads import resolve_load
+from statics_core.space import cable_geometry, solve_cables
+from statics_core.supports import pin
+
+ANSWER_CACHE_SIZE = 1024     # answer keys kept per solver
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def answer_key(solver):
+    """Memoise a solver by its bound parameters and return read-only results."""
+    signature = inspect.signature(solver)
+
+    @functools.lru_cache(maxsize=ANSWER_CACHE_SIZE)
+    def cached(params):
+        return MappingProxyType(solver(**dict(params)))
+
+    def canonical(args, kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return cached(tuple((k, _freeze(v)) for k, v in bound.arguments.items()))
+
+    # Calls repeat verbatim on every rerun, so remember call -> answer key too
+    # and skip binding the signature on the hot path.
+    @functools.lru_cache(maxsize=ANSWER_CACHE_SIZE)
+    def by_call(args, kwargs):
+        return canonical(args, dict(kwargs))
+
+    @functools.wraps(solver)
+    def wrapper(*args, **kwargs):
+        call = (args, tuple(kwargs.items()))
+        try:
+            hash(call)
+        except TypeError:           # unhashable argument, e.g. loads given as lists
+            return canonical(args, kwargs)
+        return by_call(*call)
+
+    def cache_clear():
+        by_call.cache_clear()
+        cached.cache_clear()
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+# ----------------------------
+# EngAI_V2.py — smooth ring, force triangle
+# ----------------------------
+@answer_key
+def solve_force_triangle(F1=400.0, th1=30.0, F2=250.0, th2=135.0):
+    """F3 that closes the triangle for two known cable forces on a ring."""
+    F1x, F1y = components(F1, th1)
+    F2x, F2y = components(F2, th2)
+    Sx, Sy = F1x + F2x, F1y + F2y
+    F3x, F3y = -Sx, -Sy
+    d_tail = ang_diff(th1, th2)          # tail-to-tail angle between F1 and F2
+    return {
+        "F1x": F1x, "F1y": F1y,
+        "F2x": F2x, "F2y": F2y,
+        "F3x": F3x, "F3y": F3y,
+        "F3": math.hypot(F3x, F3y),
+        "th3": math.degrees(math.atan2(F3y, F3x)),   # in [-180, 180]
+        "d_tail": d_tail,
+        "gamma": 180.0 - d_tail,          # interior angle in the force triangle
+    }
+
+
+@answer_key
+def solve_ring_components(F1=400.0, th1=30.0, F2=250.0, th2=135.0, beta=0.0):
+    """F1 and F2 components along the student's axes (rotated CCW by beta)."""
+    F1x, F1y = components(F1, angle_rel_axes(th1, beta))
+    F2x, F2y = components(F2, angle_rel_axes(th2, beta))
+    return {"F1x": F1x, "F1y": F1y, "F2x": F2x, "F2y": F2y}
+
+
+RING_3D_ANCHORS = ((-6.0, -3.0, 2.0), (3.0, -6.0, 2.0), (-2.0, -3.0, 6.0))
+
+
+@answer_key
+def solve_ring_3d(F1=400.0, th1=30.0, F2=250.0, th2=135.0, W=300.0, anchors=RING_3D_ANCHORS):
+    """Tensions in cables from the ring at O to anchors A, B, C (m).
+
+    F1 and F2 act in the xy-plane as in the planar exercise, W hangs below.
+    """
+    F1x, F1y = components(F1, th1)
+    F2x, F2y = components(F2, th2)
+    sol = solve_cables((0.0, 0.0, 0.0), anchors, (F1x + F2x, F1y + F2y, -W))
+    names = "ABC"[:len(anchors)]
+    out = {f"T_{n}": t for n, t in zip(names, sol.tensions)}
+    out.update({f"u_{n}": u for n, u in zip(names, cable_geometry((0.0, 0.0, 0.0), anchors).units)})
+    out["balanced"] = sol.ok
+    return out
+
+
+# ----------------------------
+# EngAI_V2_Moment.py — lever OA
+# ----------------------------
+@answer_key
+def solve_lever_moment(L=24.0, theta=60.0, Fv=100.0):
+    """Moment of a downward vertical force at the tip of a lever about O."""
+    rx = L * math.cos(math.radians(theta))
+    ry = L * math.sin(math.radians(theta))
+    M = Fv * rx
+    return {
+        "rx": rx,
+        "ry": ry,
+        "M": M,
+        # a downward force right of O turns the lever clockwise
+        "M_dir": "Clockwise (CW)" if rx >= 0 else "Counter-Clockwise (CCW)",
+        "Fh": M / ry if ry > 0 else float("nan"),
+    }
+
+
+# ----------------------------
+# EngAI_MethodJoints.py — right-angled truss
+# ----------------------------
+@answer_key
+def solve_joints_truss(P=500.0, height=2.0, base=2.0):
+    """Members AB (vertical), BC (diagonal), AC (base); P acts right at B."""
+    ang = math.atan2(height, base)
+    # Joint B, BC assumed in tension (pulls down-right):  ΣFx: P + F_BC cos = 0
+    F_BC = -P / math.cos(ang)
+    # ΣFy at B: -F_AB - F_BC sin = 0
+    F_AB = -F_BC * math.sin(ang)
+    # Joint C, ΣFx: -F_AC - F_BC cos = 0
+    F_AC = -F_BC * math.cos(ang)
+    return {"angle_bc": math.degrees(ang), "F_AB": F_AB, "F_BC": F_BC, "F_AC": F_AC}
+
+
+# ----------------------------
+# EngAI_V2_MethodSections.py — Fink roof truss, cut through FH / GH / GI
+# ----------------------------
+@answer_key
+def solve_fink_sections(panel=5.0, n_panels=6, peak=8.0,
+                        top_load=1.0, bottom_loads=(5.0, 5.0, 5.0)):
+    """Reaction L_y and the forces in FH, GH, GI (right section H..L)."""
+    span = panel * n_panels
+    half = span / 2.0
+    # Top loads at every interior node, bottom loads at the first bottom nodes
+    top_x = [panel * i for i in range(1, n_panels)]
+    bot_x = [panel * (i + 1) for i in range(len(bottom_loads))]
+    M_A = sum(top_load * x for x in top_x) + sum(P * x for P, x in zip(bottom_loads, bot_x))
+    Ly = M_A / span
+
+    # Node positions around the cut (F is the peak, H one panel right of it)
+    xF, yF = half, peak
+    xH = half + panel
+    hH = peak * (span - xH) / half
+    xG = half
+
+    # ΣM_H on the right section: Ly, the top loads right of H, and F_GI at y=0
+    top_right = [x for x in top_x if x > xH]
+    M_H = Ly * (span - xH) - sum(top_load * (x - xH) for x in top_right)
+    F_GI = M_H / hH
+
+    # ΣM_G: F_FH acts at H toward F
+    dFHx, dFHy = xF - xH, yF - hH
+    LFH = math.hypot(dFHx, dFHy)
+    uFH = (dFHx / LFH, dFHy / LFH)
+    top_right_h = [x for x in top_x if x >= xH]
+    M_G = Ly * (span - xG) - sum(top_load * (x - xG) for x in top_right_h)
+    arm_FH = (xH - xG) * uFH[1] - hH * uFH[0]
+    F_FH = -M_G / arm_FH
+
+    # ΣFy: F_GH acts at H toward G
+    dGHx, dGHy = xG - xH, -hH
+    LGH = math.hypot(dGHx, dGHy)
+    Fy_known = Ly - top_load * len(top_right_h) + F_FH * uFH[1]
+    F_GH = -Fy_known / (dGHy / LGH)
+    return {"Ly": Ly, "h_H": hH, "F_GI": F_GI, "F_FH": F_FH, "F_GH": F_GH}
+
+
+# ----------------------------
+# EngAI_V2_Equilibrium.py — beam on a roller (A) and a pin (B)
+# ----------------------------
+@answer_key
+def solve_beam_reactions(x_A=0.0, x_B=9.0, loads=((3.0, 15.0), (11.0, 6.0), (13.0, 6.0))):
+    """Reactions for downward point loads given as (x, P) pairs."""
+    # ΣM_B = 0  ->  Ay (x_A - x_B) = Σ P (x - x_B)
+    Ay = sum(P * (x - x_B) for x, P in loads) / (x_A - x_B)
+    By = sum(P for _, P in loads) - Ay
+    return {"Ay": Ay, "By": By, "Bx": 0.0}
+
+
+# ----------------------------
+# EngAI_V2_DistributedLoad.py — hydrostatic gate
+# ----------------------------
+@answer_key
+def solve_gate_load(height=3.0, load=((0.0, 0.0), (3.0, 45.0))):
+    """Any piecewise-linear load given as (depth below A, intensity) breakpoints."""
+    resultant = resolve_load(load)
+    FR = resultant.force
+    y_bar = resultant.location           # from A; None when the load sums to zero
+    # ΣM_A = 0 from the pieces' moments, so a load summing to zero (no water,
+    # equal levels) gives zero reactions, or those of the couple it leaves
+    Bx = sum(p.area * p.centroid for p in resultant.pieces) / height
+    Ax = FR - Bx                         # ΣF_x = 0
+    return {"FR": FR, "y_bar": y_bar, "Ax": Ax, "Bx": Bx}
+
+
+@answer_key
+def solve_gate_hydrostatic(length=3.0, upstream=3.0, downstream=0.0, incline=90.0,
+                           gamma=None, width=1.0):
+    """Water on one or both sides of a gate AB (levels in m above the sill B)."""
+    load = pressure_profile(length, upstream, downstream, incline, gamma, width)
+    return dict(solve_gate_load(length, load), w_sill=load[-1][1])
+
+
+@answer_key
+def solve_gate_triangular(height=3.0, w_max=45.0):
+    """Triangular load, 0 at A (top) to w_max at B (bottom)."""
+    return dict(solve_gate_load(height, ((0.0, 0.0), (height, w_max))))
+
+
+# ----------------------------
+# EngAI_V2_InternalForce.py — frame ABC with strut BD
+# ----------------------------
+def frame_internal_model(P=160.0, AB=14.0, BJ=8.0, JC=8.0, rise=10.0, run=24.0):
+    """The InternalForce frame as a statics_core.frames.Frame: beam ABC, strut BD."""
+    AC = AB + BJ + JC
+    return frames.Frame(
+        nodes={"A": (0.0, 0.0), "B": (AB, 0.0), "C": (AC, 0.0), "D": (AB + run, -rise)},
+        members=[frames.member("ABC", "A", "B", "C"), frames.member("BD", "B", "D")],
+        supports=[pin("C", (AC, 0.0)), pin("D", (AB + run, -rise))],
+        loads=[frames.load("A", fy=-P)],
+    )
+
+
+@answer_key
+def solve_frame_internal(P=160.0, AB=14.0, BJ=8.0, JC=8.0, rise=10.0, run=24.0):
+    """F_BD and the internal N, V, M at J of the left segment ABJ."""
+    hyp = math.hypot(rise, run)
+    AC = AB + BJ + JC
+    frame = frame_internal_model(P, AB, BJ, JC, rise, run).solve()
+    F_BD = -frame.axial["BD"]                # BD is a strut: compression
+    # The strut pushes B back toward A and up
+    Bx, F_BDy = frame.pin_forces[("ABC", "B")]
+    F_BDx = -Bx
+    return {
+        "hyp": hyp,
+        "AC": AC,
+        "F_BD": F_BD,
+        "N_J": F_BDx,
+        "V_J": F_BDy - P,
+        "M_J": abs(P * (AB + BJ) - F_BDy * BJ),
+    }
+
+
+# ----------------------------
+# EngAI_V2_ThreeForceBody.py — tank over an obstruction
+# ----------------------------
+@answer_key
+def solve_three_force_tank(W=500.0, diameter=8.0, obstruction=2.0):
+    """Three-force body: weight, horizontal top cable T and reaction at corner A."""
+    r = diameter / 2.0
+    alpha = math.degrees(math.acos((r - obstruction) / r))
+    # Triangle AGC is isosceles (AG = GC = r), angle at G is 180 - alpha
+    theta = alpha / 2.0
+    return {
+        "r": r,
+        "alpha": alpha,
+        "theta": theta,
+        "T": W * math.tan(math.radians(theta)),
+        "R_A": W / math.cos(math.radians(theta)),
+    }
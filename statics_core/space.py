@@ -0,0 +1,103 @@
+"""Particle equilibrium in 3D: a ring held by cables to fixed anchors (no Streamlit).
+
+Each cable pulls the ring at P toward its anchor with an unknown tension T_i
+along the unit vector u_i = (anchor_i - P) / |anchor_i - P|. Equilibrium with
+the known forces F (applied loads, weight) is
+
+    Σ T_i u_i + F = 0        i.e.  U T = -F,  U = [u_1 u_2 u_3]
+
+For up to three cables the solution is T = -(UᵀU)⁻¹ Uᵀ F, exact for three
+independent cables and the least-squares fit otherwise (with fewer than three
+cables equilibrium only exists when F lies in their span, which the residual
+shows). The unit vectors and the matrix (UᵀU)⁻¹ Uᵀ depend only on the
+geometry, so they are cached per (point, anchors) and every load variant is
+one 3 x n matrix-vector product: solve_cables_batch() grades a whole set of
+variants against one factorisation.
+"""
+
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+CableGeometry = namedtuple("CableGeometry", "point anchors units lengths solver")
+CableSolution = namedtuple("CableSolution", "tensions residual ok")
+
+_EPS = 1e-9
+RESIDUAL_TOL = 1e-6          # relative to the size of the known load
+
+
+def unit_vector(frm, to):
+    """Unit vector from point frm toward point to (3D)."""
+    d = tuple(float(b) - float(a) for a, b in zip(frm, to))
+    length = math.sqrt(sum(c * c for c in d))
+    if length < _EPS:
+        raise ValueError("cable has zero length")
+    return tuple(c / length for c in d)
+
+
+def _inverse(m):
+    """Inverse of a small square matrix by Gauss-Jordan; None if singular."""
+    n = len(m)
+    rows = [list(r) + [1.0 if i == j else 0.0 for j in range(n)] for i, r in enumerate(m)]
+    for col in range(n):
+        best = max(range(col, n), key=lambda i: abs(rows[i][col]))
+        if abs(rows[best][col]) < _EPS:
+            return None
+        rows[col], rows[best] = rows[best], rows[col]
+        piv = rows[col][col]
+        rows[col] = [x / piv for x in rows[col]]
+        for i in range(n):
+            if i != col and rows[i][col]:
+                f = rows[i][col]
+                rows[i] = [x - f * y for x, y in zip(rows[i], rows[col])]
+    return [r[n:] for r in rows]
+
+
+def cable_geometry(point, anchors):
+    """Cached CableGeometry for a ring at point and cables to anchors (1 to 3)."""
+    point = tuple(float(c) for c in point)
+    anchors = tuple(tuple(float(c) for c in a) for a in anchors)
+    return _geometry(point, anchors)
+
+
+@lru_cache(maxsize=256)
+def _geometry(point, anchors):
+    if not 1 <= len(anchors) <= 3:
+        raise ValueError("a particle in 3D takes one to three unknown cable tensions")
+    units = tuple(unit_vector(point, a) for a in anchors)
+    lengths = tuple(math.dist(point, a) for a in anchors)
+    # Normal equations: (UᵀU) T = -Uᵀ F, UᵀU is the Gram matrix of the units
+    gram = [[sum(x * y for x, y in zip(ui, uj)) for uj in units] for ui in units]
+    inv = _inverse(gram)
+    if inv is None:
+        raise ValueError("cables are not independent (parallel or coplanar through the ring)")
+    # solver[i] is row i of (UᵀU)⁻¹ Uᵀ, a 3-vector: T_i = -solver[i] · F
+    solver = tuple(
+        tuple(sum(inv[i][k] * units[k][c] for k in range(len(units))) for c in range(3))
+        for i in range(len(units))
+    )
+    return CableGeometry(point, anchors, units, lengths, solver)
+
+
+def _solve(geom, load):
+    tensions = tuple(-sum(r * f for r, f in zip(row, load)) for row in geom.solver)
+    residual = tuple(sum(t * u[c] for t, u in zip(tensions, geom.units)) + load[c] for c in range(3))
+    size = math.sqrt(sum(r * r for r in residual))
+    scale = max(1.0, math.sqrt(sum(f * f for f in load)))
+    return CableSolution(tensions, size, size <= RESIDUAL_TOL * scale)
+
+
+def solve_cables(point, anchors, load):
+    """CableSolution(tensions, residual, ok) for one known load vector.
+
+    ok is False when the cables cannot balance the load (fewer than three
+    cables and a load outside their span). A negative tension means the cable
+    would have to push.
+    """
+    return _solve(cable_geometry(point, anchors), tuple(float(f) for f in load))
+
+
+def solve_cables_batch(point, anchors, loads):
+    """CableSolutions for many load vectors on one geometry (one cached solver)."""
+    geom = cable_geometry(point, anchors)
+    return [_solve(geom, tuple(float(f) for f in load)) for load in loads]
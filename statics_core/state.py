@@ -0,0 +1,232 @@
+"""Typed, slot-based session state for each problem (no Streamlit).
+
+Each problem declares its app-managed fields once, with their defaults, via
+define_state(). The result is a class with __slots__, so one student's state
+is a fixed handful of attributes rather than a growing dict of session keys,
+and apps read it as plain attributes (S.step_idx, S.s_given_sel, ...).
+
+A checkpoint is one positional list, [version, [value, ...]], encoded with
+encode_state(). The version is a short hash of the field names; a checkpoint
+written for a different field list is ignored rather than mis-assigned, and
+old dict checkpoints (keyed by name) are still read.
+
+Widget keys stay in st.session_state: Streamlit owns those. The answer
+widgets a problem lists in define_state(widgets=...) are copied into a
+widget_values field as well, so typed answers survive a resume.
+"""
+
+from copy import copy
+from hashlib import blake2b
+
+from statics_core.progress import encode_state
+
+STROKES_FIELD = "canvas_strokes"
+WIDGETS_FIELD = "widget_values"
+_MUTABLE = (dict, list, set)
+_STATES = {}
+
+
+class ProblemState:
+    """Base class for the per-problem state classes made by define_state()."""
+
+    __slots__ = ()
+    PROBLEM = None
+    FIELDS = ()              # ((name, default), ...), in checkpoint order
+    NAMES = ()
+    VERSION = ""
+    WIDGETS = ()             # widget keys checkpointed in widget_values
+
+    def __init__(self, **values):
+        for name, default in self.FIELDS:
+            if name in values:
+                value = values.pop(name)
+            else:
+                value = copy(default) if isinstance(default, _MUTABLE) else default
+            object.__setattr__(self, name, value)
+        if values:
+            raise TypeError(f"{type(self).__name__} has no field {next(iter(values))!r}")
+
+    @classmethod
+    def from_saved(cls, saved):
+        """State from a loaded checkpoint; defaults if it doesn't fit this schema."""
+        if isinstance(saved, list) and len(saved) == 2 and saved[0] == cls.VERSION:
+            values = saved[1]
+            if len(values) == len(cls.NAMES):
+                return cls(**dict(zip(cls.NAMES, values)))
+        elif isinstance(saved, dict):
+            return cls(**{k: saved[k] for k in cls.NAMES if k in saved})
+        return cls()
+
+    def to_blob(self):
+        """Checkpoint text: the version and the field values, positionally."""
+        return encode_state([self.VERSION, [getattr(self, n) for n in self.NAMES]])
+
+    def as_dict(self):
+        return {n: getattr(self, n) for n in self.NAMES}
+
+    def __repr__(self):
+        fields = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.NAMES)
+        return f"{type(self).__name__}({fields})"
+
+
+def define_state(class_name, problem, fields, widgets=()):
+    """Register and return a ProblemState subclass for a problem.
+
+    fields is a sequence of (name, default) pairs. Mutable defaults are copied
+    per instance. A canvas_strokes field is appended for the drawing steps,
+    and a widget_values field ({key: value}) if widgets names any widget keys.
+    Only list inputs whose value may be set through st.session_state: never
+    buttons.
+    """
+    widgets = tuple(widgets)
+    fields = tuple(fields) + (((WIDGETS_FIELD, {}),) if widgets else ()) + ((STROKES_FIELD, {}),)
+    names = tuple(name for name, _ in fields)
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate field in {class_name}")
+    version = blake2b(" ".join((problem,) + names).encode(), digest_size=4).hexdigest()
+    cls = type(class_name, (ProblemState,), {
+        "__slots__": names,
+        "__module__": __name__,
+        "PROBLEM": problem,
+        "FIELDS": fields,
+        "NAMES": names,
+        "VERSION": version,
+        "WIDGETS": widgets,
+    })
+    _STATES[problem] = cls
+    return cls
+
+
+def state_class(problem):
+    """The ProblemState subclass registered for a problem id."""
+    try:
+        return _STATES[problem]
+    except KeyError:
+        raise KeyError(f"no state schema for problem {problem!r}") from None
+
+
+# ----------------------------
+# Schemas
+# ----------------------------
+_STEP_TIMER = (
+    ("step_idx", 0),
+    ("start_time", None),
+    ("timer_finished", False),
+)
+
+_METHOD_STUDY = (
+    ("method_started", False),
+    # Study substep 1 (timer)
+    ("s_timer_started", False),
+    ("s_timer_start_time", None),
+    ("s_timer_done", False),
+    # Study substep 2 (vocab): term -> "I understand" tick
+    ("s_vocab_ack", {}),
+    # Study substep 3 (identifier)
+    ("s_given_sel", set()),
+    ("s_target_sel", set()),
+    ("s_identifier_pass", False),
+    ("S_done", False),
+)
+
+RingState = define_state("RingState", "ring", _METHOD_STUDY + (
+    ("givens_text", ""),
+    ("target_text", ""),
+    # T - Translate
+    ("unlock_T", False),
+    ("T_done", False),
+    # A - Assign
+    ("unlock_A", False),
+    ("A_done", False),
+    ("A_axis_mode_saved", None),
+    ("A_beta_saved", 0.0),
+    ("A_F3x_assume_saved", None),
+    ("A_F3y_assume_saved", None),
+    # T - components
+    ("unlock_C", False),
+    ("T_components_done", False),
+    # I - Implement
+    ("unlock_I", False),
+    ("I_done", False),
+    ("unlock_C_next", False),
+    # C - Compute
+    ("C_gamma_ok", False),
+    ("C_F3_ok", False),
+    ("C_dir_ok", False),
+    ("C_done", False),
+    ("C_gamma_val", None),
+    ("C_F3_val", None),
+    ("unlock_next_stage", False),
+    ("unlock_summary", False),
+), widgets=(
+    "axis_mode_choice", "beta_value", "F3x_assumption", "F3y_assumption",
+    "T2_input_F1x", "T2_input_F1y", "T2_input_F2x", "T2_input_F2y",
+    "I_mode_choice_radio", "I_text_fx", "I_text_fy", "I_chk_use_moments", "I_text_M",
+    "I_chk_signs_good", "I_chk_forces_all", "I_chk_unknowns_id",
+    "C_gamma_guess", "C_F3_user", "C_theta3_guess",
+    "S_chk_quadrant", "S_chk_triangle", "S_chk_values", "S_chk_conf",
+    "3d_TA", "3d_TB", "3d_TC",
+))
+
+LeverState = define_state("LeverState", "lever", _METHOD_STUDY + (
+    ("unlock_T", False),
+    ("T_done", False),
+    ("unlock_A", False),
+    ("A_done", False),
+    ("unlock_I", False),
+    ("I_done", False),
+    ("unlock_C", False),
+    ("C_done", False),
+    ("unlock_S", False),
+    ("rx_val", None),
+    ("ry_val", None),
+    ("final_M", None),
+    ("final_Fh", None),
+), widgets=("moment_convention",))
+
+JointsState = define_state("JointsState", "truss_joints", _STEP_TIMER + (
+    ("vocab_idx", 0),
+    ("s_given_sel", set()),
+    ("angle_correct", False),
+    ("bc_correct", False),
+    ("ab_correct", False),
+), widgets=("bc_state", "ab_state", "ac_state"))
+
+SectionsState = define_state("SectionsState", "truss_sections", _STEP_TIMER + (
+    ("vocab_idx", 0),
+    ("s_given_sel", set()),
+    ("ly_correct", False),
+    ("h_height_correct", False),
+    ("fgi_correct", False),
+    ("ffh_correct", False),
+), widgets=("sec_eq_m", "gi_state", "fh_state", "gh_state"))
+
+BeamState = define_state("BeamState", "beam", (
+    ("current_step_idx", 0),
+    ("start_time", None),
+    ("timer_finished", False),
+    ("vocab_idx", 0),
+), widgets=("eq_fx", "eq_fy", "eq_m", "input_ay", "input_bx", "input_by"))
+
+GateState = define_state("GateState", "gate", _STEP_TIMER + (
+    ("fr_correct", False),
+    ("loc_correct", False),
+    ("ax_correct", False),
+    ("bx_correct", False),
+), widgets=("mag_input", "loc_input", "I_chk_fx", "I_chk_fy", "I_chk_m"))
+
+FrameState = define_state("FrameState", "frame", _STEP_TIMER + (
+    ("fbd_correct", False),
+    ("fbd_val", 0),
+    ("nj_correct", False),
+    ("vj_correct", False),
+    ("mj_correct", False),
+))
+
+TankState = define_state("TankState", "tank", _STEP_TIMER + (
+    ("vocab_idx", 0),
+    ("s_given_sel", set()),
+    ("alpha_correct", False),
+    ("theta_correct", False),
+    ("tension_correct", False),
+))
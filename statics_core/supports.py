@@ -0,0 +1,177 @@
+"""Support models for 2D rigid bodies (no Streamlit).
+
+A problem lists its supports once, e.g.
+
+    BEAM_MODEL = SupportModel([roller("A", (0, 0)), pin("B", (9, 0))])
+
+and derives from that what the Implement steps used to hard-code: the
+unknown reactions (Ay, Bx, By), whether the body is statically determinate,
+and the moment point that removes the most unknowns from ΣM = 0.
+
+Each reaction force is a line of action (point + unit direction); a fixed
+support adds a couple. Moment points are ranked by statics_core.moments,
+with the support points as the named candidates.
+"""
+
+import math
+from collections import namedtuple
+
+from statics_core.moments import rank_moment_points
+
+EQUATIONS_2D = 3
+_EPS = 1e-9
+
+Reaction = namedtuple("Reaction", "name point direction")     # direction None: a couple
+Support = namedtuple("Support", "name kind point reactions")
+Determinacy = namedtuple("Determinacy", "status unknowns equations degree")
+
+KIND_LABELS = {
+    "pin": "pin",
+    "roller": "roller",
+    "fixed": "fixed support",
+    "cable": "cable",
+    "ring": "smooth ring",
+}
+
+
+# ----------------------------
+# Supports
+# ----------------------------
+def _unit(angle_deg):
+    a = math.radians(angle_deg)
+    return (round(math.cos(a), 12) + 0.0, round(math.sin(a), 12) + 0.0)
+
+
+def _force_name(name, direction, prefix):
+    """Ax / Ay for axis-aligned reactions, else prefix + name (N_A, T_C)."""
+    ux, uy = direction
+    if abs(uy) < _EPS:
+        return f"{name}x"
+    if abs(ux) < _EPS:
+        return f"{name}y"
+    return f"{prefix}_{name}"
+
+
+def pin(name, point):
+    """Pin: resists translation in x and y."""
+    point = tuple(map(float, point))
+    return Support(name, "pin", point, (
+        Reaction(f"{name}x", point, (1.0, 0.0)),
+        Reaction(f"{name}y", point, (0.0, 1.0)),
+    ))
+
+
+def roller(name, point, normal=90.0):
+    """Roller (or rocker, smooth surface): one force along the surface normal (degrees)."""
+    point = tuple(map(float, point))
+    d = _unit(normal)
+    return Support(name, "roller", point, (Reaction(_force_name(name, d, "N"), point, d),))
+
+
+def fixed(name, point):
+    """Fixed support: x and y forces plus a couple."""
+    point = tuple(map(float, point))
+    return Support(name, "fixed", point, pin(name, point).reactions + (
+        Reaction(f"M_{name}", point, None),
+    ))
+
+
+def cable(name, point, angle):
+    """Cable or two-force link: one tension along the cable (degrees from +x)."""
+    point = tuple(map(float, point))
+    d = _unit(angle)
+    return Support(name, "cable", point, (Reaction(_force_name(name, d, "T"), point, d),))
+
+
+def ring(name, point, rod_angle=0.0):
+    """Smooth ring or collar on a rod: one force normal to the rod."""
+    point = tuple(map(float, point))
+    d = _unit(rod_angle + 90.0)
+    return Support(name, "ring", point, (Reaction(_force_name(name, d, "N"), point, d),))
+
+
+def restrained_axes(support):
+    """The axes ("x", "y") along which a support's reactions have a component."""
+    return tuple(axis for i, axis in enumerate("xy")
+                 if any(r.direction is not None and abs(r.direction[i]) > _EPS
+                        for r in support.reactions))
+
+
+# ----------------------------
+# Geometry
+# ----------------------------
+def _cross(ax, ay, bx, by):
+    return ax * by - ay * bx
+
+
+def _rank(rows):
+    rows = [list(r) for r in rows]
+    rank = 0
+    ncols = len(rows[0]) if rows else 0
+    for col in range(ncols):
+        best = max(range(rank, len(rows)), key=lambda i: abs(rows[i][col]), default=None)
+        if best is None or abs(rows[best][col]) < _EPS:
+            continue
+        rows[rank], rows[best] = rows[best], rows[rank]
+        for i in range(rank + 1, len(rows)):
+            f = rows[i][col] / rows[rank][col]
+            rows[i] = [x - f * y for x, y in zip(rows[i], rows[rank])]
+        rank += 1
+    return rank
+
+
+# ----------------------------
+# Model
+# ----------------------------
+class SupportModel:
+    """The supports of one rigid body in the plane."""
+
+    def __init__(self, supports):
+        self.supports = tuple(supports)
+        self.reactions = tuple(r for s in self.supports for r in s.reactions)
+        self.unknowns = tuple(r.name for r in self.reactions)
+        if len(set(self.unknowns)) != len(self.unknowns):
+            raise ValueError(f"duplicate reaction names: {self.unknowns}")
+
+    def support(self, name):
+        for s in self.supports:
+            if s.name == name:
+                return s
+        raise KeyError(name)
+
+    def determinacy(self):
+        """Status 'determinate', 'indeterminate' or 'unstable' (improperly constrained)."""
+        n = len(self.reactions)
+        # Columns: the reaction's contribution to ΣFx, ΣFy and ΣM about the origin
+        rows = []
+        for r in self.reactions:
+            if r.direction is None:
+                rows.append((0.0, 0.0, 1.0))
+            else:
+                (px, py), (ux, uy) = r.point, r.direction
+                rows.append((ux, uy, _cross(px, py, ux, uy)))
+        if _rank(rows) < EQUATIONS_2D:
+            status = "unstable"
+        elif n == EQUATIONS_2D:
+            status = "determinate"
+        else:
+            status = "indeterminate"
+        return Determinacy(status, n, EQUATIONS_2D, max(n - EQUATIONS_2D, 0))
+
+    def moment_points(self, target=None):
+        """Candidate moment points (MomentPoint), most unknowns eliminated first."""
+        return rank_moment_points(self.reactions, {s.name: s.point for s in self.supports}, target)
+
+    def best_moment_point(self, target=None):
+        """MomentPoint whose ΣM equation has the fewest unknowns left."""
+        return self.moment_points(target)[0]
+
+    def describe(self):
+        """One line per support, e.g. "A roller at A has 1 reaction (Ay)."."""
+        lines = []
+        for s in self.supports:
+            n = len(s.reactions)
+            names = ", ".join(r.name for r in s.reactions)
+            lines.append(f"A {KIND_LABELS[s.kind]} at {s.name} has {n} "
+                         f"reaction{'s' if n != 1 else ''} ({names}).")
+        return lines
@@ -0,0 +1,134 @@
+"""Attempt telemetry: a non-blocking event log (no Streamlit).
+
+emit() only puts the event on an in-memory queue, so the rerun that produced
+it never waits on the disk. A background thread drains the queue in batches
+and appends them as JSON lines to the current log file, starting a new file
+once it reaches max_bytes. Files are never rewritten, so the analytics job
+can read closed files while the app keeps logging.
+
+If a burst outruns the writer (a whole class pressing "Check" at once) the
+queue absorbs it; only beyond max_queue pending events are new ones dropped,
+and counted in EventLog.dropped.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from functools import lru_cache
+
+from statics_core.config import data_dir
+
+MAX_BYTES = 16 * 1024 * 1024   # rotate log files at ~16 MB
+MAX_QUEUE = 100_000            # pending events held in memory before dropping
+FLUSH_INTERVAL = 1.0           # seconds the writer waits for more events
+BATCH_SIZE = 5_000             # events written per append
+
+_STOP = object()
+
+
+class EventLog:
+    """Queue events in memory and append them to rotating JSONL files."""
+
+    def __init__(self, directory, prefix="events", max_bytes=MAX_BYTES,
+                 max_queue=MAX_QUEUE, flush_interval=FLUSH_INTERVAL):
+        self.directory = str(directory)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._file = None
+        self._size = 0
+        self._seq = 0
+        self._thread = threading.Thread(target=self._run, name="statics-event-log", daemon=True)
+        self._thread.start()
+
+    # ----------------------------
+    # Producer side (called from reruns)
+    # ----------------------------
+    def emit(self, event):
+        """Queue one event (a JSON-serialisable dict); never blocks."""
+        event.setdefault("ts", time.time())
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Block until every event queued so far is on disk."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    # ----------------------------
+    # Writer thread
+    # ----------------------------
+    def _run(self):
+        q = self._queue
+        while True:
+            try:
+                first = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(e is _STOP for e in batch)
+            events = [e for e in batch if e is not _STOP]
+            try:
+                if events:
+                    self._write(events)
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _write(self, events):
+        data = "".join(json.dumps(e, separators=(",", ":"), default=str) + "\n" for e in events)
+        data = data.encode("utf-8")
+        if self._file is None or self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+        self._seq += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{self.prefix}-{stamp}-{os.getpid()}-{self._seq:04d}.jsonl"
+        self._file = open(os.path.join(self.directory, name), "ab")
+        self._size = 0
+
+
+def log_files(directory=None, prefix="events"):
+    """Event files in write order (oldest first)."""
+    directory = str(directory or data_dir() / "events")
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(n for n in os.listdir(directory) if n.startswith(prefix + "-") and n.endswith(".jsonl"))
+    return [os.path.join(directory, n) for n in names]
+
+
+@lru_cache(maxsize=None)
+def get_event_log(directory=None):
+    """Process-wide EventLog (default directory: <data dir>/events)."""
+    log = EventLog(directory or data_dir() / "events")
+    atexit.register(log.close)
+    return log
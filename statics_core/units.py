@@ -0,0 +1,198 @@
+"""Units and dimension checks for typed answers (no Streamlit).
+
+Every unit in UNITS has a dimension, given as exponents of (force, length,
+angle), and a factor to N, m and rad. Compound units are products and
+quotients of those symbols: "kN/m", "lb·in", "lb-in", "N*m", "kN/m^2",
+"k-ft". parse_unit() is cached per text and conversion() per (from, to)
+pair, so a conversion is a dict lookup and one multiply, and convert_many()
+applies that one factor to a whole list.
+
+parse_quantity() reads answers typed as "2 ft", "24 in", "1,120 lb-in",
+"-6.5k", "30°" or 2'. check_quantity() compares one with a reference value
+in a reference unit. A wrong dimension (a length where a moment was asked
+for) is reported as a unit error, separately from a wrong number.
+"""
+
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+UNIT_CACHE_SIZE = 2048
+
+Unit = namedtuple("Unit", "dimension factor")
+Quantity = namedtuple("Quantity", "value unit symbol")
+QuantityCheck = namedtuple("QuantityCheck", "status value message")
+
+_FORCE, _LENGTH, _ANGLE = (1, 0, 0), (0, 1, 0), (0, 0, 1)
+_LB = 4.4482216152605        # N per lbf
+
+UNITS = MappingProxyType({
+    "N": Unit(_FORCE, 1.0),
+    "kN": Unit(_FORCE, 1e3),
+    "MN": Unit(_FORCE, 1e6),
+    "lb": Unit(_FORCE, _LB),
+    "lbf": Unit(_FORCE, _LB),
+    "lbs": Unit(_FORCE, _LB),
+    "k": Unit(_FORCE, 1e3 * _LB),
+    "kip": Unit(_FORCE, 1e3 * _LB),
+    "kips": Unit(_FORCE, 1e3 * _LB),
+    "m": Unit(_LENGTH, 1.0),
+    "cm": Unit(_LENGTH, 1e-2),
+    "mm": Unit(_LENGTH, 1e-3),
+    "in": Unit(_LENGTH, 0.0254),
+    "ft": Unit(_LENGTH, 0.3048),
+    "°": Unit(_ANGLE, math.pi / 180.0),
+    "deg": Unit(_ANGLE, math.pi / 180.0),
+    "rad": Unit(_ANGLE, 1.0),
+})
+# Case-insensitive fallback ("KN", "LB", "Ft"); no two symbols collide
+_FOLDED = MappingProxyType({k.lower(): v for k, v in UNITS.items()})
+
+DIMENSION_NAMES = MappingProxyType({
+    (0, 0, 0): "a plain number",
+    _FORCE: "a force",
+    _LENGTH: "a length",
+    _ANGLE: "an angle",
+    (1, 1, 0): "a moment (force × length)",
+    (1, -1, 0): "a distributed load (force per length)",
+    (1, -2, 0): "a pressure (force per area)",
+    (1, -3, 0): "a specific weight (force per volume)",
+    (0, 2, 0): "an area",
+})
+
+_UNICODE = str.maketrans({"·": "*", "⋅": "*", "×": "*", "²": "^2", "³": "^3", "−": "-"})
+_FEET_INCHES = {"'": "ft", "′": "ft", '"': "in", "″": "in"}
+# Thousands may be grouped with commas ("1,200 lb")
+_NUMBER = re.compile(r"\s*([-+]?(?:\d{1,3}(?:,\d{3})+(?:\.\d*)?|\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$")
+_UNIT_TOKEN = re.compile(r"\s*(?:(?P<sym>°|[A-Za-z]+)(?:\^(?P<exp>-?\d+))?|(?P<op>[*/])|(?P<bad>\S))")
+
+
+class UnitError(ValueError):
+    """The text is not a number with a known unit, or the units do not match."""
+
+
+def _fmt(value, unit):
+    return f"{value:,.4g}°" if unit == "°" else f"{value:,.4g} {unit}"
+
+
+def dimension_name(dimension):
+    """Readable name of a dimension tuple ("a force", "a moment ...")."""
+    return DIMENSION_NAMES.get(dimension, "a quantity of another kind")
+
+
+# ----------------------------
+# Units
+# ----------------------------
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def parse_unit(text):
+    """Unit(dimension, factor) of a unit expression such as "kN/m" or "lb-in"."""
+    # A hyphen between two symbols is a product (lb-in, k-ft)
+    norm = re.sub(r"(?<=[A-Za-z°])\s*-\s*(?=[A-Za-z])", "*", text.translate(_UNICODE)).strip()
+    if not norm:
+        raise UnitError("no unit given")
+    dim, factor, sign = [0, 0, 0], 1.0, 1
+    expect_symbol = True
+    for m in _UNIT_TOKEN.finditer(norm):
+        if m.group("bad"):
+            raise UnitError(f"unexpected character {m.group('bad')!r} in unit {text!r}")
+        if m.group("op"):
+            if expect_symbol:
+                raise UnitError(f"unit {text!r} is missing a symbol")
+            sign = -1 if m.group("op") == "/" else 1
+            expect_symbol = True
+            continue
+        sym = m.group("sym")
+        unit = UNITS.get(sym) or _FOLDED.get(sym.lower())
+        if unit is None:
+            raise UnitError(f"unknown unit {sym!r}")
+        exp = sign * int(m.group("exp") or 1)
+        dim = [d + exp * u for d, u in zip(dim, unit.dimension)]
+        factor *= unit.factor ** exp
+        # Juxtaposed symbols multiply ("N m"); a "/" covers the next one only
+        sign, expect_symbol = 1, False
+    if expect_symbol:
+        raise UnitError(f"unit {text!r} is missing a symbol")
+    return Unit(tuple(dim), factor)
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def conversion(frm, to):
+    """Factor taking a value in unit frm to unit to; UnitError if they differ in kind."""
+    a, b = parse_unit(frm), parse_unit(to)
+    if a.dimension != b.dimension:
+        raise UnitError(f"cannot convert {dimension_name(a.dimension)} ({frm}) "
+                        f"to {dimension_name(b.dimension)} ({to})")
+    return a.factor / b.factor
+
+
+def convert(value, frm, to):
+    """value in unit frm, expressed in unit to."""
+    return value * conversion(frm, to)
+
+
+def convert_many(values, frm, to):
+    """A list of values in unit frm, expressed in unit to (one factor lookup)."""
+    f = conversion(frm, to)
+    return [v * f for v in values]
+
+
+# ----------------------------
+# Typed quantities
+# ----------------------------
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def parse_quantity(text, default=None):
+    """Quantity(value, unit, symbol) from text such as "2 ft" or "24 in".
+
+    A bare number takes the default unit symbol, or has unit None when there
+    is no default. Raises UnitError for text that is not a number and a unit.
+    """
+    m = _NUMBER.match(text)
+    if not m:
+        raise UnitError("start with a number, then the unit (e.g. 2 ft)")
+    value, symbol = float(m.group(1).replace(",", "")), m.group(2)
+    if symbol.startswith(","):
+        raise UnitError("write decimals with a point; commas only group thousands (1,200)")
+    symbol = _FEET_INCHES.get(symbol, symbol)
+    if not symbol:
+        if default is None:
+            return Quantity(value, None, "")
+        symbol = default
+    return Quantity(value, parse_unit(symbol), symbol)
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def check_quantity(text, expected, unit, pct=1.0):
+    """QuantityCheck(status, value, message) for a typed answer.
+
+    status is "ok", "wrong" (right kind of unit, wrong size), "units" (a
+    unit of the wrong dimension), "missing" (a bare number) or "invalid"
+    (unreadable text). value is the answer converted to unit when the
+    dimensions match, else None. Angles are compared as directions, so the
+    sign counts but a whole turn does not (-114.2° = 245.8°). Other
+    quantities are compared by magnitude, since the sign conventions are
+    checked elsewhere in the exercises.
+    """
+    try:
+        q = parse_quantity(text)
+    except UnitError as e:
+        return QuantityCheck("invalid", None, str(e))
+    want = parse_unit(unit)
+    if q.unit is None:
+        return QuantityCheck("missing", None,
+                             f"add a unit: this answer is {dimension_name(want.dimension)}, e.g. {unit}")
+    if q.unit.dimension != want.dimension:
+        return QuantityCheck("units", None,
+                             f"{q.symbol} is {dimension_name(q.unit.dimension)}, "
+                             f"but this answer is {dimension_name(want.dimension)}")
+    value = q.value * q.unit.factor / want.factor
+    if want.dimension == _ANGLE:
+        turn = 2 * math.pi / want.factor
+        error = abs((value - expected + turn / 2) % turn - turn / 2)
+    else:
+        error = abs(abs(value) - abs(expected))
+    if error <= abs(expected) * pct / 100.0:
+        return QuantityCheck("ok", value, f"{text.strip()} = {_fmt(value, unit)}")
+    return QuantityCheck("wrong", value,
+                         f"{text.strip()} = {_fmt(value, unit)}, which does not match the answer")
@@ -0,0 +1,42 @@
+"""Streamlit glue between the EngAI_*.py apps and statics_core.
+
+Unlike statics_core, modules here import streamlit and are only meant to be
+used from inside a running app script.
+"""
+
+from statics_ui.progress import (
+    student_id,
+    problem_state,
+    reset_state,
+    initial_strokes,
+    remember_strokes,
+    save_progress,
+)
+from statics_ui.telemetry import record_attempt
+from statics_ui.metrics import RenderTimer
+from statics_ui.assets import show_diagram, show_rendered
+from statics_ui.canvas import load_canvas
+from statics_ui.equations import equation_input
+from statics_ui.explorer import what_if
+from statics_ui.influence import moving_load_panel
+from statics_ui.hydrostatics import water_level_panel
+from statics_ui.units import units_check
+
+__all__ = [
+    "student_id",
+    "problem_state",
+    "reset_state",
+    "initial_strokes",
+    "remember_strokes",
+    "save_progress",
+    "record_attempt",
+    "RenderTimer",
+    "show_diagram",
+    "show_rendered",
+    "load_canvas",
+    "equation_input",
+    "what_if",
+    "moving_load_panel",
+    "water_level_panel",
+    "units_check",
+]
@@ -0,0 +1,25 @@
+"""Problem diagrams: vendored pictures and ones rendered from parameters."""
+
+import html
+
+import streamlit as st
+
+from statics_core.assets import diagram_source
+from statics_core.diagrams import diagram_data_uri
+
+
+def show_diagram(name, caption=None, width="content"):
+    """Show a diagram from statics_core/data/diagrams (falls back to its URL)."""
+    st.image(diagram_source(name), caption=caption, width=width)
+
+
+def show_rendered(kind, caption=None, **params):
+    """Show a diagram drawn from its parameters (cached per parameter set).
+
+    The cached data: URI goes out as a plain <img>: st.image would import
+    numpy and Pillow on the first paint and re-validate the PNG every rerun.
+    """
+    alt = html.escape(caption or kind, quote=True)
+    st.html(f'<img src="{diagram_data_uri(kind, **params)}" alt="{alt}" style="max-width:100%">')
+    if caption:
+        st.caption(caption)
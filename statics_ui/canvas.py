@@ -0,0 +1,18 @@
+"""The drawing canvas, imported the first time a Translate step needs it.
+
+streamlit-drawable-canvas registers a component (and its assets) on import.
+Loading it lazily keeps that off the Study step's first paint; after the first
+call the module is cached like any other import.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_canvas():
+    """st_canvas from streamlit-drawable-canvas, or None if it can't be used."""
+    try:
+        from streamlit_drawable_canvas import st_canvas
+    except Exception:           # not installed, or the component failed to register
+        return None
+    return st_canvas
@@ -0,0 +1,33 @@
+"""Typed equation boxes for the Implement steps."""
+
+import streamlit as st
+
+from statics_core.equations import EquationError, compile_equation
+
+
+def equation_input(label, key, unknowns, solution, knowns=None, placeholder=None, expect=None):
+    """Text box for one equation with feedback under it.
+
+    expect is an optional statics_core.equations.Sum; an equation that
+    balances but is not that sum is flagged. Returns the
+    compiled Equation, or None while the box is empty or the text does not
+    parse. Parsing and checking are cached, so the feedback costs
+    microseconds on every rerun.
+    """
+    text = st.text_input(label, key=key, placeholder=placeholder)
+    if not text.strip():
+        return None
+    try:
+        eq = compile_equation(text, unknowns, knowns)
+    except EquationError as e:
+        st.caption(f"⚠️ {e}. Use {', '.join(unknowns)} for the unknowns.")
+        return None
+    if not eq.holds(solution):
+        st.caption("✗ This equation does not balance. Check signs, loads and moment arms.")
+    elif expect is not None and not expect.matches(eq):
+        hint = ("Give every force's moment its own term." if expect.kind == "M"
+                else "Include every force's component along this axis.")
+        st.caption(f"✗ This balances, but it is not {expect.name} = 0 written out. {hint}")
+    else:
+        st.caption("✓ This equation balances.")
+    return eq
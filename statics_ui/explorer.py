@@ -0,0 +1,55 @@
+"""What-if explorer panel: sliders over a problem's governing parameters.
+
+The panel body is an st.fragment, so moving a slider reruns only the panel:
+the STATICS steps above it are not re-executed and the progress checkpoint
+is not touched. Results come from the cached solvers and the redrawn diagram
+from the cached renderer, so a slider move costs milliseconds. The panel
+sits in an expander, whose body runs on every rerun even while collapsed,
+so it is drawn only after the student switches it on.
+"""
+
+import streamlit as st
+
+from statics_core.explorer import explore, explorer
+from statics_ui.assets import show_rendered
+
+
+def _fmt(value, unit):
+    text = f"{value:,.1f}" if abs(value) < 1e6 else f"{value:,.3g}"
+    return f"{text}°" if unit == "°" else f"{text} {unit}"
+
+
+def what_if(problem, expanded=False):
+    """Collapsible explorer for a problem; slider values persist per session."""
+    with st.expander("🔬 What if? Explore the parameters", expanded=expanded):
+        if st.toggle("Show the parameter explorer", key=f"whatif_{problem}_open"):
+            _panel(problem)
+
+
+@st.fragment
+def _panel(problem):
+    spec = explorer(problem)
+    st.caption("Move a slider to see how the answers change. Negative member forces are compression.")
+    values = {}
+    cols = st.columns(2)
+    for i, p in enumerate(spec.params):
+        with cols[i % 2]:
+            values[p.name] = st.slider(
+                f"{p.label} ({p.unit})", p.lo, p.hi, p.default, p.step,
+                key=f"whatif_{problem}_{p.name}",
+            )
+
+    args, results = explore(problem, values)
+    cols = st.columns(len(spec.outputs))
+    for col, out in zip(cols, spec.outputs):
+        col.metric(out.label, _fmt(results[out.key], out.unit))
+
+    if spec.diagram:
+        show_rendered(spec.diagram, **args)
+    st.button("Reset to the exercise values", key=f"whatif_{problem}_reset",
+              on_click=_reset, args=(problem,))
+
+
+def _reset(problem):
+    for p in explorer(problem).params:
+        st.session_state.pop(f"whatif_{problem}_{p.name}", None)
@@ -0,0 +1,51 @@
+"""Water-level study panel for a gate: reactions against the upstream level.
+
+The body is an st.fragment, like the other exploration panels. Every rerun
+sweeps the upstream level from empty to twice the gate height with
+statics_core.hydrostatics.sweep_levels() and answers "at what level does the
+sill reaction reach X" with level_for_reaction().
+
+An expander's body runs on every rerun even while it is collapsed, and the
+chart costs far more than the sweep, so the study is drawn only after the
+student switches it on.
+"""
+
+import streamlit as st
+
+from statics_core.hydrostatics import level_for_reaction, sweep_levels
+
+SWEEP_LEVELS = 1000
+
+
+def water_level_panel(problem, length, width=1.0, gamma=None, incline=90.0,
+                      target=None, expanded=False):
+    """Collapsible study of the gate's reactions as the water rises."""
+    with st.expander("🌊 Water level study", expanded=expanded):
+        if st.toggle("Show the water level study", key=f"levels_{problem}_open"):
+            _panel(problem, length, width, gamma, incline, target)
+
+
+@st.fragment
+def _panel(problem, length, width, gamma, incline, target):
+    top = 2.0 * length
+    c1, c2 = st.columns(2)
+    with c1:
+        downstream = st.slider("Downstream water level above the sill (m)", 0.0, float(length),
+                               0.0, 0.1, key=f"levels_{problem}_downstream")
+    with c2:
+        target = st.number_input("Sill reaction limit B_x (kN)", min_value=0.0,
+                                 value=float(target or 0.0), step=5.0,
+                                 key=f"levels_{problem}_target")
+
+    levels = [top * i / (SWEEP_LEVELS - 1) for i in range(SWEEP_LEVELS)]
+    sweep = sweep_levels(length, levels, downstream, incline, gamma, width)
+    x = "upstream level (m)"
+    st.line_chart({x: sweep.levels, "A_x": sweep.Ax, "B_x": sweep.Bx}, x=x)
+
+    level = level_for_reaction(length, target, "Bx", downstream, incline, gamma, width,
+                               max_level=top)
+    if level is None:
+        st.info(f"B_x stays below {target:g} kN until the water is {top:g} m above the sill.")
+    else:
+        st.write(f"B_x reaches **{target:g} kN** when the upstream water is "
+                 f"**{level:.2f} m** above the sill.")
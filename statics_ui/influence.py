@@ -0,0 +1,69 @@
+"""Moving-load panel: influence lines and a load train rolled across a beam.
+
+Like the what-if panel, the body is an st.fragment: changing the train, the
+section or the load position reruns only the panel. The sweep over every
+position comes from the cached statics_core.influence.moving_load(), so the
+charts update live.
+
+An expander's body runs on every rerun even while it is collapsed, and the
+two charts cost a few hundred ms to build, so the panel is drawn only after
+the student switches it on.
+"""
+
+import streamlit as st
+
+from statics_core.influence import influence_lines, influence_value, moving_load
+
+
+def moving_load_panel(problem, x_A, x_B, left, right, trains, section=None,
+                      length_unit="ft", force_unit="k", expanded=False):
+    """Collapsible moving-load mode for a beam.
+
+    trains is {label: ((offset, P), ...)}; offsets are measured from the train
+    position on the slider, so a train given at its drawn x positions sits
+    where the exercise puts it when the slider is at 0.
+    """
+    with st.expander("🚚 Moving load: influence lines", expanded=expanded):
+        if st.toggle("Show the moving-load study", key=f"moving_{problem}_open"):
+            _panel(problem, x_A, x_B, left, right, trains, section, length_unit, force_unit)
+
+
+@st.fragment
+def _panel(problem, x_A, x_B, left, right, trains, section, length_unit, force_unit):
+    label = st.selectbox("Load train", list(trains), key=f"moving_{problem}_train")
+    train = trains[label]
+    c1, c2 = st.columns(2)
+    with c1:
+        c = st.slider(f"Section for V and M ({length_unit})", float(left), float(right),
+                      float(section if section is not None else (left + right) / 2), 0.5,
+                      key=f"moving_{problem}_section")
+    sweep = moving_load(x_A, x_B, left, right, train, (c,))
+    first, last = sweep.positions[0], sweep.positions[-1]
+    with c2:
+        shift = st.slider(f"Train position ({length_unit})", first, last,
+                          min(max(0.0, first), last), 0.1, key=f"moving_{problem}_shift")
+
+    V, M = f"V@{c:g}", f"M@{c:g}"
+    lines = influence_lines(float(x_A), float(x_B), (float(c),))
+    now = {
+        name: sum(P * influence_value(lines[name], shift + o)
+                  for o, P in train if left <= shift + o <= right)
+        for name in ("Ay", "By", V, M)
+    }
+    cols = st.columns(4)
+    cols[0].metric("A_y", f"{now['Ay']:.2f} {force_unit}")
+    cols[1].metric("B_y", f"{now['By']:.2f} {force_unit}")
+    cols[2].metric(f"V at x = {c:g}", f"{now[V]:.2f} {force_unit}")
+    cols[3].metric(f"M at x = {c:g}", f"{now[M]:.1f} {force_unit}·{length_unit}")
+
+    x = f"train position ({length_unit})"
+    r = sweep.responses
+    st.line_chart({x: sweep.positions, "A_y": r["Ay"], "B_y": r["By"], f"V at {c:g}": r[V]}, x=x)
+    st.line_chart({x: sweep.positions, f"M at {c:g}": r[M]}, x=x)
+
+    ext = sweep.extremes
+    st.caption(
+        f"Largest A_y: {ext['Ay'].high:.2f} {force_unit} with the train at {ext['Ay'].at_high:.1f} {length_unit}. "
+        f"Largest B_y: {ext['By'].high:.2f} {force_unit} at {ext['By'].at_high:.1f} {length_unit}. "
+        f"Moment at x = {c:g} ranges from {ext[M].low:.1f} to {ext[M].high:.1f} {force_unit}·{length_unit}."
+    )
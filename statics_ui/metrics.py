@@ -0,0 +1,146 @@
+"""Per-step render timing for the apps (see statics_core.metrics).
+
+Create one RenderTimer at the top of the script and mark each STATICS step as
+its section starts rendering:
+
+    render = RenderTimer(PROBLEM_ID)
+    ...
+    if st.session_state.step_idx >= 2:
+        render.step(2)
+    ...
+    render.finish()
+
+Use render.stop() / render.rerun() instead of st.stop() / st.rerun() so the
+rerun is still closed off when the script ends early, and render.tick() for
+the focus-timer countdown: it closes the rerun before its one-second sleep,
+so the wait stays out of the step timings. record_attempt() marks Check
+handlers on the current timer. Ending the rerun also checkpoints the
+student's progress (statics_ui.progress.save_progress).
+
+The same timer starts and stops the sampled profiler (statics_core.profiling).
+A rerun that raises never reaches finish(), so the next rerun of the session
+stops and writes out its profile before sampling its own. With
+STATICS_METRICS and STATICS_PROFILE unset the timing and profiling calls
+return immediately.
+"""
+
+import threading
+import time
+
+import streamlit as st
+
+from statics_core.metrics import get_metrics, metrics_enabled
+from statics_core.profiling import PROFILE_RATE, start_sampled_profile
+from statics_ui.progress import save_progress
+
+_RERUNS = "_render_reruns"
+_OPEN_PROFILE = "_render_open_profile"
+_local = threading.local()      # one script thread per session rerun
+
+
+class RenderTimer:
+    """Monotonic lap timer for one script rerun."""
+
+    def __init__(self, problem):
+        self.enabled = metrics_enabled()
+        self.problem = problem
+        self._step = 0                  # 0 = setup before the first step
+        self._done = False
+        # STATICS_PROFILE: run a sampled share of reruns under cProfile
+        self._profile = None
+        if PROFILE_RATE:
+            _close_abandoned_profile()
+            self._profile = start_sampled_profile()
+            if self._profile is not None:
+                st.session_state[_OPEN_PROFILE] = self
+        _local.timer = self if self.enabled else None
+        if not self.enabled:
+            return
+        self.metrics = get_metrics()
+        self._labels = (("problem", problem),)
+        self._start = self._lap = time.perf_counter()
+        self._steps = {}
+        self._check = None
+
+        ss = st.session_state
+        ss[_RERUNS] = ss.get(_RERUNS, 0) + 1
+        self.metrics.inc("statics_reruns_total", self._labels)
+        if ss[_RERUNS] == 1:
+            self.metrics.inc("statics_sessions_total", self._labels)
+
+    def step(self, n):
+        """Start timing step n (1 Study ... 7 Sanity check)."""
+        if n == self._step:
+            return
+        if self.enabled:
+            self._close_lap(time.perf_counter())
+        self._step = n
+
+    def check(self, label):
+        """A Check handler on the current step has just graded an answer."""
+        if not self.enabled:
+            return
+        self._close_check(time.perf_counter())
+        self._check = (label, time.perf_counter())
+
+    def finish(self):
+        """Record the rerun; call once at the end of the script."""
+        if self._done:
+            return
+        self._done = True
+        save_progress(self.problem)
+        self._stop_profile()
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._close_lap(now)
+        for step, seconds in self._steps.items():
+            self.metrics.observe("statics_step_seconds", self._labels + (("step", str(step)),), seconds)
+        self.metrics.observe("statics_rerun_seconds", self._labels, now - self._start)
+        _local.timer = None
+
+    def stop(self):
+        self.finish()
+        st.stop()
+
+    def rerun(self):
+        self.finish()
+        st.rerun()
+
+    def tick(self, seconds=1.0):
+        """End this rerun, wait, then rerun (the focus-timer countdown)."""
+        self.finish()
+        time.sleep(seconds)
+        st.rerun()
+
+    def _stop_profile(self):
+        if self._profile is not None:
+            self._profile.stop(self.problem, self._step)
+            self._profile = None
+            st.session_state.pop(_OPEN_PROFILE, None)
+
+    def _close_lap(self, now):
+        self._steps[self._step] = self._steps.get(self._step, 0.0) + (now - self._lap)
+        self._lap = now
+        self._close_check(now)
+
+    def _close_check(self, now):
+        if self._check is not None:
+            label, started = self._check
+            self.metrics.observe("statics_check_seconds",
+                                 self._labels + (("check", label),), now - started)
+            self._check = None
+
+
+def _close_abandoned_profile():
+    """Stop and write out the profile of this session's last rerun if it never finished."""
+    timer = st.session_state.pop(_OPEN_PROFILE, None)
+    if timer is not None:
+        timer._stop_profile()
+
+
+def note_check(label):
+    """Mark a Check handler on this rerun's timer, if metrics are on."""
+    timer = getattr(_local, "timer", None)
+    if timer is not None:
+        timer.check(label)
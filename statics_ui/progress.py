@@ -0,0 +1,98 @@
+"""Per-session problem state, resumed after a refresh or server restart.
+
+Call S = problem_state(problem) once near the top of the app and keep the
+app's own bookkeeping on S (see statics_core.state for each problem's
+fields). On the first run of a session it restores the student's last
+checkpoint (one indexed read). save_progress() encodes S in one call and
+checkpoints it, canvas strokes included, whenever the text changed; the
+RenderTimer calls it as every rerun ends (finish/stop/rerun), so the last
+change of a session is saved too, and problem_state() calls it at the start
+of each later run to cover a rerun that raised before it finished. Writes go
+through the debounced ProgressStore, so reruns never wait on the disk.
+
+Widget values stay in st.session_state under their widget keys; only the
+state object itself lives under STATE_KEY. The answer widgets a problem lists
+in its schema (statics_core.state) are copied into the checkpoint and put
+back on resume. Other widgets, including every input created without a key,
+start from their defaults after a reload.
+"""
+
+import uuid
+
+import streamlit as st
+
+from statics_core.progress import get_progress_store
+from statics_core.state import state_class
+
+STATE_KEY = "_statics_state"
+_LAST = "_progress_last"
+_INITIAL_STROKES = "_progress_initial_strokes"
+
+
+def student_id():
+    """Stable id for this browser tab, kept in the ?sid= query parameter."""
+    sid = st.query_params.get("sid")
+    if not sid:
+        sid = uuid.uuid4().hex[:12]
+        st.query_params["sid"] = sid
+    return sid
+
+
+def problem_state(problem):
+    """This session's state object for a problem, restored on the first run."""
+    ss = st.session_state
+    state = ss.get(STATE_KEY)
+    if state is None:
+        saved = get_progress_store().load(student_id(), problem)
+        state = ss[STATE_KEY] = state_class(problem).from_saved(saved)
+        ss[_INITIAL_STROKES] = dict(state.canvas_strokes)
+        if state.WIDGETS:
+            for key, value in state.widget_values.items():
+                if key not in ss:
+                    ss[key] = value     # picked up when the widget is created
+        ss[_LAST] = state.to_blob() if saved else None
+        return state
+
+    save_progress(problem)
+    return state
+
+
+def save_progress(problem):
+    """Checkpoint this session's state if it changed since the last save."""
+    ss = st.session_state
+    state = ss.get(STATE_KEY)
+    if state is None:
+        return
+    if state.WIDGETS:
+        # a widget that is not on the page keeps the value it was saved with
+        state.widget_values.update((k, ss[k]) for k in state.WIDGETS if k in ss)
+    blob = state.to_blob()
+    if blob != ss.get(_LAST):
+        ss[_LAST] = blob
+        get_progress_store().save(student_id(), problem, blob)
+
+
+def reset_state(problem):
+    """Forget the checkpoint and start the problem over with a fresh state.
+
+    Widget values are dropped as well, so every input shows its default again.
+    """
+    get_progress_store().clear(student_id(), problem)
+    ss = st.session_state
+    ss.clear()
+    ss[STATE_KEY] = state_class(problem)()
+    ss[_INITIAL_STROKES] = {}
+    ss[_LAST] = None
+    return ss[STATE_KEY]
+
+
+def initial_strokes(canvas_key):
+    """Strokes to pre-load into st_canvas(initial_drawing=...) after a resume."""
+    return st.session_state.get(_INITIAL_STROKES, {}).get(canvas_key)
+
+
+def remember_strokes(canvas_key, json_data):
+    """Record the current drawing so the next checkpoint includes it."""
+    state = st.session_state.get(STATE_KEY)
+    if state is not None and json_data and json_data.get("objects"):
+        state.canvas_strokes[canvas_key] = json_data
@@ -0,0 +1,33 @@
+"""Attempt events from the Check buttons.
+
+Wrap the pass condition of a Check button in record_attempt():
+
+    if st.button("Check F_R"):
+        if record_attempt(PROBLEM_ID, 6, "Check F_R", within(fr_val, GATE["FR"], 0.5)):
+
+It logs one "attempt" event and returns the condition unchanged. Steps are
+numbered by position in the method: 1 Study, 2 Translate (diagram), 3 Assign,
+4 Translate (components), 5 Implement, 6 Compute, 7 Sanity check.
+"""
+
+import time
+
+from statics_core.telemetry import get_event_log
+from statics_ui.metrics import note_check
+from statics_ui.progress import student_id
+
+
+def record_attempt(problem, step, check, ok):
+    """Log one Check-button attempt and return ok."""
+    ok = bool(ok)
+    note_check(check)
+    get_event_log().emit({
+        "type": "attempt",
+        "ts": time.time(),
+        "sid": student_id(),
+        "problem": problem,
+        "step": step,
+        "check": check,
+        "ok": ok,
+    })
+    return ok
@@ -0,0 +1,39 @@
+"""Units check for the Sanity steps: final answers typed with their units.
+
+The answers and their units come from the problem's explorer spec
+(statics_core.explorer) at the exercise values. Each box accepts any
+consistent unit ("93.3 lb·ft" for a moment in lb·in), and a unit of the wrong
+kind is flagged as a unit error. The checks are cached in
+statics_core.units, so re-checking on a rerun is a dict lookup. Like the
+other Sanity Check panels, it is drawn only after the student switches it on.
+"""
+
+import streamlit as st
+
+from statics_core.explorer import explore, explorer
+from statics_core.units import check_quantity
+
+_ICONS = {"ok": "✓", "wrong": "✗", "units": "⚠️ Unit error:", "missing": "⚠️", "invalid": "⚠️"}
+
+
+def units_check(problem, expanded=False):
+    """Collapsible check of the final answers typed with their units."""
+    with st.expander("📏 Units check", expanded=expanded):
+        if st.toggle("Show the units check", key=f"units_{problem}_open"):
+            _panel(problem)
+
+
+@st.fragment
+def _panel(problem):
+    spec = explorer(problem)
+    results = explore(problem).results
+    st.caption("Type each answer with its unit, e.g. 2 ft, 24 in, 1120 lb-in or 6 k. "
+               "Any consistent unit is accepted.")
+    cols = st.columns(2)
+    for i, out in enumerate(spec.outputs):
+        with cols[i % 2]:
+            text = st.text_input(out.label, key=f"units_{problem}_{out.key}",
+                                 placeholder=f"value and unit ({out.unit})")
+            if text.strip():
+                check = check_quantity(text, results[out.key], out.unit)
+                st.caption(f"{_ICONS[check.status]} {check.message}")
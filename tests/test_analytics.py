@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from statics_core.analytics import SUMMARY_COLUMNS, iter_events, summarise
+
+FINAL = {"gate": ("Check F_R", "Check Reactions")}
+
+
+def attempt(sid, step, check, ok, ts, problem="gate"):
+    return {"type": "attempt", "sid": sid, "problem": problem, "step": step,
+            "check": check, "ok": ok, "ts": ts}
+
+
+def rows_by_check(rows):
+    return {(r[0], r[1], r[2]): dict(zip(SUMMARY_COLUMNS, r)) for r in rows}
+
+
+def test_checks_on_one_step_are_counted_apart():
+    rows = rows_by_check(summarise([
+        attempt("s1", 5, "Check F_R", False, 0.0),
+        attempt("s1", 5, "Check F_R", True, 10.0),
+        attempt("s1", 6, "Check Location", True, 12.0),
+        attempt("s1", 6, "Check Reactions", False, 20.0),
+        attempt("s1", 6, "Check Reactions", False, 25.0),
+        attempt("s1", 6, "Check Reactions", True, 30.0),
+        attempt("s1", 6, "Check Reactions", True, 31.0),     # re-check after a pass
+    ], FINAL))
+    fr = rows[("gate", 5, "Check F_R")]
+    assert (fr["students"], fr["passed"], fr["attempts"], fr["attempts_p50"]) == (1, 1, 2, 2)
+    assert fr["seconds_p50"] == pytest.approx(10.0, rel=0.02)
+    react = rows[("gate", 6, "Check Reactions")]
+    assert (react["attempts"], react["attempts_p50"], react["pass_rate"]) == (4, 3, 0.5)
+    assert rows[("gate", 6, "Check Location")]["attempts_p50"] == 1
+
+
+def test_completion_needs_every_final_check():
+    rows = rows_by_check(summarise([
+        attempt("s1", 5, "Check F_R", True, 0.0),
+        attempt("s1", 6, "Check Reactions", True, 40.0),
+        attempt("s2", 5, "Check F_R", True, 0.0),             # never reaches the reactions
+        attempt("s3", 6, "Check Reactions", True, 5.0),
+    ], FINAL))
+    module = rows[("gate", None, None)]
+    assert (module["students"], module["passed"]) == (3, 1)
+    assert module["seconds_p50"] == pytest.approx(40.0, rel=0.02)
+
+
+def test_undeclared_problems_have_no_completion_count():
+    rows = rows_by_check(summarise([attempt("s1", 1, "Check", True, 0.0, problem="other")], FINAL))
+    assert rows[("other", None, None)]["students"] == 1
+    assert rows[("other", None, None)]["passed"] is None
+
+
+def _write(path, events, torn=False):
+    text = "".join(json.dumps(e) + "\n" for e in events)
+    path.write_text(text + ('{"type": "att' if torn else ""), encoding="utf-8")
+
+
+def test_iter_events_merges_writers_by_time(tmp_path):
+    _write(tmp_path / "events-20260101-000000-111-0001.jsonl",
+           [attempt("a", 1, "c", True, 1.0), attempt("a", 1, "c", True, 4.0)])
+    _write(tmp_path / "events-20260101-000010-111-0002.jsonl", [attempt("a", 1, "c", True, 6.0)])
+    _write(tmp_path / "events-20260101-000005-222-0001.jsonl",
+           [attempt("b", 1, "c", True, 2.0), {"type": "other", "ts": 3.0}, attempt("b", 1, "c", True, 5.0)],
+           torn=True)
+    events = list(iter_events(sorted(tmp_path.iterdir())))
+    assert [e["ts"] for e in events] == [1.0, 2.0, 4.0, 5.0, 6.0]
@@ -0,0 +1,100 @@
+import pytest
+
+from statics_core import EquationError, Sum, check_system, compile_equation, pin, roller, SupportModel
+from statics_core.equations import parse_equation
+
+BEAM_LOADS = ((3.0, 15.0), (11.0, 6.0), (13.0, 6.0))
+BEAM_MODEL = SupportModel([roller("A", (0.0, 0.0)), pin("B", (9.0, 0.0))])
+UNKNOWNS = BEAM_MODEL.unknowns
+SOLUTION = {"Ay": 6.0, "By": 21.0, "Bx": 0.0}
+FX, FY, M = (Sum(kind, BEAM_MODEL.reactions, [((x, 0.0), (0.0, -P)) for x, P in BEAM_LOADS])
+             for kind in ("Fx", "Fy", "M"))
+
+
+def test_parse_splits_sides():
+    lhs, rhs = parse_equation("Ay + By = 27")
+    assert lhs[0] == "add"
+    assert rhs == ("num", 27.0)
+
+
+def test_parse_bare_expression_equals_zero():
+    assert parse_equation("ΣFy: Ay + By - 27") == parse_equation("Ay + By - 27 = 0")
+
+
+@pytest.mark.parametrize("text", ["", "ΣFy:", "Ay = By = 0", "Ay +* 3 = 0", "(Ay = 0"])
+def test_parse_rejects(text):
+    with pytest.raises(EquationError):
+        parse_equation(text)
+
+
+def test_compile_linear_form():
+    eq = compile_equation("ΣM_B: -9Ay + 15(6) - 6(2) - 6(4) = 0", UNKNOWNS)
+    assert dict(eq.coeffs) == {"Ay": -9.0}
+    assert eq.terms == (90.0, -12.0, -24.0)
+    assert eq.const == pytest.approx(54.0)
+    assert eq.holds(SOLUTION)
+
+
+def test_compile_ignores_case_and_underscores():
+    assert dict(compile_equation("a_y + BY = 27", UNKNOWNS).coeffs) == {"Ay": 1.0, "By": 1.0}
+
+
+def test_compile_knowns_and_functions():
+    eq = compile_equation("F cos(60) + 2^3 - sqrt(16) = Ay", ("Ay",), {"F": 10.0})
+    assert dict(eq.coeffs) == {"Ay": -1.0}
+    assert eq.const == pytest.approx(9.0)
+
+
+@pytest.mark.parametrize("text", ["Ay * By = 0", "1 / Ay = 2", "Cz = 0"])
+def test_compile_rejects_nonlinear_and_unknown_symbols(text):
+    with pytest.raises(EquationError):
+        compile_equation(text, UNKNOWNS)
+
+
+def test_check_system():
+    eqs = [compile_equation(t, UNKNOWNS) for t in ("Bx = 0", "Ay + By = 27", "9By - 189 = 0")]
+    result = check_system(eqs, UNKNOWNS, SOLUTION)
+    assert result.ok
+    assert result.values == pytest.approx(SOLUTION)
+
+
+def test_check_system_needs_independent_equations():
+    eqs = [compile_equation(t, UNKNOWNS) for t in ("Bx = 0", "Ay + By = 27", "2Ay + 2By = 54")]
+    result = check_system(eqs, UNKNOWNS, SOLUTION)
+    assert not result.ok
+    assert result.rank == 2
+
+
+@pytest.mark.parametrize("text", [
+    "Ay + By - 15 - 6 - 6 = 0",
+    "Ay + By - 15 - 12 = 0",
+    "Ay + By = 27",
+    "-2Ay - 2By + 54 = 0",
+])
+def test_force_sum_accepts_combined_loads(text):
+    assert FY.matches(compile_equation(text, UNKNOWNS))
+
+
+@pytest.mark.parametrize("text", ["Ay = 6", "By = 21", "Ay + By = 26"])
+def test_force_sum_rejects_other_equations(text):
+    assert not FY.matches(compile_equation(text, UNKNOWNS))
+
+
+def test_horizontal_sum():
+    assert FX.matches(compile_equation("Bx = 0", UNKNOWNS))
+    assert not FX.matches(compile_equation("Ay + By = 27", UNKNOWNS))
+
+
+@pytest.mark.parametrize("text", [
+    "-9Ay + 15(6) - 6(2) - 6(4) = 0",               # about B
+    "9By - 15(3) - 6(11) - 6(13) = 0",              # about A
+])
+def test_moment_sum_about_any_point(text):
+    assert M.matches(compile_equation(text, UNKNOWNS))
+
+
+@pytest.mark.parametrize("text", ["Ay = 6", "-9Ay + 54 = 0"])
+def test_moment_sum_is_checked_term_by_term(text):
+    eq = compile_equation(text, UNKNOWNS)
+    assert eq.holds(SOLUTION)
+    assert not M.matches(eq)
@@ -0,0 +1,53 @@
+import pytest
+
+from statics_core import Frame, member, pin, roller
+from statics_core.frames import load
+
+
+def _lever_frame(**overrides):
+    spec = dict(
+        nodes={"A": (0, 0), "B": (14, 0), "C": (30, 0), "D": (38, -10)},
+        members=[member("ABC", "A", "B", "C"), member("BD", "B", "D")],
+        supports=[pin("C", (30, 0)), pin("D", (38, -10))],
+        loads=[load("A", fy=-160)],
+    )
+    spec.update(overrides)
+    return Frame(**spec)
+
+
+def test_two_force_member():
+    sol = _lever_frame().solve()
+    assert sol.status == "determinate"
+    assert sol.two_force == ("BD",)
+    assert sol.axial["BD"] == pytest.approx(-780.0)          # compression
+
+
+def test_reactions_balance_the_load():
+    sol = _lever_frame().solve()
+    r = sol.reactions
+    assert r["Cx"] + r["Dx"] == pytest.approx(0.0)
+    assert r["Cy"] + r["Dy"] == pytest.approx(160.0)
+    assert r["Dy"] == pytest.approx(780.0 * 10 / 26)
+
+
+def test_loaded_member_is_not_two_force():
+    frame = _lever_frame(loads=[load("A", fy=-160), load((34, -5), fy=-10, member="BD")])
+    assert frame.two_force_members() == ()
+    assert frame.solve().status == "determinate"
+
+
+@pytest.mark.parametrize("supports, status", [
+    ([roller("A", (0, 0))], "unstable"),
+    ([pin("A", (0, 0)), pin("B", (10, 0))], "indeterminate"),
+])
+def test_status(supports, status):
+    frame = Frame(nodes={"A": (0, 0), "B": (10, 0)}, members=[member("AB", "A", "B")],
+                  supports=supports, loads=[load("B", fy=-1)])
+    sol = frame.solve()
+    assert sol.status == status
+    assert not sol.reactions
+
+
+def test_rejects_unknown_nodes():
+    with pytest.raises(ValueError):
+        Frame(nodes={"A": (0, 0)}, members=[member("AB", "A", "B")])
@@ -0,0 +1,47 @@
+import pytest
+
+from statics_core import moving_load, solve_beam_reactions
+from statics_core.influence import influence_lines, influence_value
+
+
+def test_unit_load_extremes():
+    sweep = moving_load(0, 9, 0, 9, sections=(4.5,))
+    ay, m = sweep.extremes["Ay"], sweep.extremes["M@4.5"]
+    assert (ay.high, ay.at_high, ay.low, ay.at_low) == pytest.approx((1.0, 0.0, 0.0, 9.0))
+    assert m.high == pytest.approx(4.5 * 4.5 / 9)          # a b / L under the load
+    assert m.at_high == pytest.approx(4.5)
+
+
+def test_overhang_lifts_the_roller():
+    ay = moving_load(0, 9, 0, 13).extremes["Ay"]
+    assert ay.low == pytest.approx(-4 / 9)
+    assert ay.at_low == pytest.approx(13.0)
+
+
+def test_shear_jumps_at_the_section():
+    lines = influence_lines(0.0, 9.0, (3.0,))
+    assert influence_value(lines["V@3"], 3.0 - 1e-9) == pytest.approx(-1 / 3)
+    assert influence_value(lines["V@3"], 3.0) == pytest.approx(2 / 3)
+
+
+def test_train_matches_the_static_solution():
+    loads = ((3.0, 15.0), (11.0, 6.0), (13.0, 6.0))
+    # Positions run from -13 to 10 in steps of 1; at 0 the train sits as drawn
+    sweep = moving_load(0, 9, 0, 13, train=loads, n=24)
+    i = sweep.positions.index(0.0)
+    static = solve_beam_reactions(loads=loads)
+    assert sweep.responses["Ay"][i] == pytest.approx(static["Ay"])
+    assert sweep.responses["By"][i] == pytest.approx(static["By"])
+
+
+def test_loads_off_the_beam_carry_nothing():
+    sweep = moving_load(0, 9, 0, 9, train=((0.0, 1.0), (20.0, 5.0)), n=11)
+    total = [a + b for a, b in zip(sweep.responses["Ay"], sweep.responses["By"])]
+    for p, t in zip(sweep.positions, total):
+        on = [P for o, P in ((0.0, 1.0), (20.0, 5.0)) if 0 <= p + o <= 9]
+        assert t == pytest.approx(sum(on))
+
+
+def test_rejects_coincident_supports():
+    with pytest.raises(ValueError):
+        moving_load(3, 3, 0, 9)
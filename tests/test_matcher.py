@@ -0,0 +1,35 @@
+from statics_core import TextMatcher, get_matcher
+
+PATTERNS = {
+    "area": r"\barea\b",
+    "centroid": r"centroid|cent(?:er|re) of (?:area|mass)",
+}
+
+
+def test_match_patterns():
+    m = TextMatcher(patterns=PATTERNS)
+    assert m.match_patterns("The AREA under the load") == {"area"}
+    assert m.match_patterns("its centre of mass") == {"centroid"}
+    assert m.match_patterns("no idea") == set()
+    assert m.match_patterns("") == set()
+
+
+def test_overlapping_patterns_are_all_reported():
+    # "center of area" matches both patterns at overlapping positions
+    assert TextMatcher(patterns=PATTERNS).match_patterns("the center of area") == {"area", "centroid"}
+
+
+def test_find_terms_whole_words_in_given_order():
+    m = TextMatcher(["resultant force", "force", "moment"])
+    assert m.find_terms("The Force and the resultant force.") == ["resultant force", "force"]
+    assert m.find_terms("forces and momentum") == []
+
+
+def test_scan():
+    m = TextMatcher(["pin"], PATTERNS)
+    assert m.scan("a pin at the centroid") == (["pin"], {"centroid"})
+
+
+def test_get_matcher_is_cached():
+    assert get_matcher(["pin"], PATTERNS) is get_matcher(["pin"], dict(PATTERNS))
+    assert get_matcher(["pin"]) is not get_matcher(["roller"])
@@ -0,0 +1,121 @@
+import math
+
+import pytest
+
+from statics_core import components
+from statics_core.solvers import (
+    RING_3D_ANCHORS,
+    solve_beam_reactions,
+    solve_force_triangle,
+    solve_frame_internal,
+    solve_gate_hydrostatic,
+    solve_gate_load,
+    solve_gate_triangular,
+    solve_joints_truss,
+    solve_lever_moment,
+    solve_ring_3d,
+    solve_three_force_tank,
+)
+
+
+def test_force_triangle_closes():
+    sol = solve_force_triangle()
+    F1x, F1y = components(400.0, 30.0)
+    F2x, F2y = components(250.0, 135.0)
+    assert sol["F3x"] == pytest.approx(-(F1x + F2x))
+    assert sol["F3y"] == pytest.approx(-(F1y + F2y))
+    assert sol["F3"] == pytest.approx(math.hypot(F1x + F2x, F1y + F2y))
+    assert sol["th3"] == pytest.approx(-114.238, abs=1e-3)
+    assert sol["gamma"] == pytest.approx(75.0)
+
+
+def test_ring_3d_balances():
+    sol = solve_ring_3d()
+    F1x, F1y = components(400.0, 30.0)
+    F2x, F2y = components(250.0, 135.0)
+    total = [F1x + F2x, F1y + F2y, -300.0]
+    for name, anchor in zip("ABC", RING_3D_ANCHORS):
+        assert sol[f"u_{name}"] == pytest.approx([c / math.dist((0, 0, 0), anchor) for c in anchor])
+        total = [t + sol[f"T_{name}"] * u for t, u in zip(total, sol[f"u_{name}"])]
+    assert total == pytest.approx([0.0, 0.0, 0.0], abs=1e-9)
+    assert sol["balanced"]
+
+
+def test_lever_moment():
+    sol = solve_lever_moment(L=24.0, theta=60.0, Fv=100.0)
+    assert sol["M"] == pytest.approx(1200.0)            # 100 lb × 24 cos 60° in
+    assert sol["M_dir"] == "Clockwise (CW)"
+    assert sol["Fh"] * sol["ry"] == pytest.approx(sol["M"])
+
+
+def test_joints_truss():
+    sol = solve_joints_truss(P=500.0, height=2.0, base=2.0)
+    assert sol["angle_bc"] == pytest.approx(45.0)
+    assert sol["F_BC"] == pytest.approx(-500.0 * math.sqrt(2))
+    assert sol["F_AB"] == pytest.approx(500.0)
+    assert sol["F_AC"] == pytest.approx(500.0)
+
+
+def test_beam_reactions():
+    sol = solve_beam_reactions(x_A=0.0, x_B=9.0, loads=((3.0, 15.0), (11.0, 6.0), (13.0, 6.0)))
+    assert sol["By"] == pytest.approx((3 * 15 + 11 * 6 + 13 * 6) / 9)
+    assert sol["Ay"] == pytest.approx(27.0 - sol["By"])
+    assert sol["Bx"] == 0.0
+
+
+def test_beam_reactions_accept_lists():
+    assert solve_beam_reactions(loads=[[3.0, 15.0], [11.0, 6.0], [13.0, 6.0]]) == solve_beam_reactions()
+
+
+def test_gate_triangular_load():
+    sol = solve_gate_load(3.0, ((0.0, 0.0), (3.0, 45.0)))
+    assert sol["FR"] == pytest.approx(67.5)
+    assert sol["y_bar"] == pytest.approx(2.0)
+    assert sol["Bx"] == pytest.approx(45.0)
+    assert sol["Ax"] == pytest.approx(22.5)
+    assert dict(solve_gate_triangular()) == pytest.approx(dict(sol))
+
+
+@pytest.mark.parametrize("sol", [
+    solve_gate_load(3.0, ((0.0, 0.0), (3.0, 0.0))),
+    solve_gate_hydrostatic(upstream=0.0),
+    solve_gate_hydrostatic(upstream=2.0, downstream=2.0),
+])
+def test_gate_without_net_load(sol):
+    assert sol["FR"] == pytest.approx(0.0)
+    assert sol["y_bar"] is None
+    assert sol["Ax"] == pytest.approx(0.0)
+    assert sol["Bx"] == pytest.approx(0.0)
+
+
+def test_gate_load_that_sums_to_a_couple():
+    sol = solve_gate_load(2.0, ((0.0, -10.0), (2.0, 10.0)))
+    assert sol["FR"] == pytest.approx(0.0)
+    assert sol["Ax"] == pytest.approx(-sol["Bx"])
+    assert sol["Bx"] == pytest.approx(20.0 / 3.0 / 2.0)  # ∫ w(s) s ds = 20/3 about A, over the height
+
+
+def test_gate_hydrostatic():
+    sol = solve_gate_hydrostatic(length=3.0, upstream=3.0)
+    assert sol["FR"] == pytest.approx(0.5 * 9.81 * 3.0 ** 2)
+    assert sol["y_bar"] == pytest.approx(2.0)
+    assert sol["Bx"] == pytest.approx(2.0 / 3.0 * sol["FR"])
+
+
+def test_frame_internal():
+    sol = solve_frame_internal()
+    assert sol["hyp"] == pytest.approx(26.0)
+    # ΣM_C on ABC: the vertical part of F_BD at 16 ft balances 160 lb at 30 ft
+    assert sol["F_BD"] * 10.0 / 26.0 * 16.0 == pytest.approx(160.0 * 30.0)
+
+
+def test_three_force_tank():
+    sol = solve_three_force_tank(W=500.0, diameter=8.0, obstruction=2.0)
+    assert sol["theta"] == pytest.approx(30.0)
+    assert sol["T"] == pytest.approx(500.0 * math.tan(math.radians(30.0)))
+    assert sol["R_A"] == pytest.approx(500.0 / math.cos(math.radians(30.0)))
+
+
+def test_answer_keys_are_read_only():
+    with pytest.raises(TypeError):
+        solve_beam_reactions()["Ay"] = 0.0
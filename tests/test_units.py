@@ -0,0 +1,70 @@
+import pytest
+
+from statics_core.units import UnitError, check_quantity, convert, parse_quantity, parse_unit
+
+
+@pytest.mark.parametrize("text, unit", [
+    ("kN/m", "kN / m"),
+    ("lb·in", "lb*in"),
+    ("lb-in", "lb in"),
+    ("k-ft", "kip*ft"),
+    ("KN", "kN"),
+])
+def test_equivalent_unit_spellings(text, unit):
+    assert parse_unit(text) == parse_unit(unit)
+
+
+@pytest.mark.parametrize("text", ["", "kN/", "furlong", "N%"])
+def test_bad_units(text):
+    with pytest.raises(UnitError):
+        parse_unit(text)
+
+
+def test_convert():
+    assert convert(2.0, "ft", "in") == pytest.approx(24.0)
+    assert convert(1120.0, "lb-in", "lb-ft") == pytest.approx(1120.0 / 12.0)
+    with pytest.raises(UnitError):
+        convert(1.0, "ft", "lb")
+
+
+@pytest.mark.parametrize("text, value, symbol", [
+    ("2 ft", 2.0, "ft"),
+    ("-6.5k", -6.5, "k"),
+    ("2'", 2.0, "ft"),
+    ("30°", 30.0, "°"),
+    ("1,200 lb", 1200.0, "lb"),
+    ("1,200.5 lb", 1200.5, "lb"),
+])
+def test_parse_quantity(text, value, symbol):
+    q = parse_quantity(text)
+    assert (q.value, q.symbol) == (pytest.approx(value), symbol)
+
+
+@pytest.mark.parametrize("text", ["ft 2", "1,2 lb", "12,00 lb"])
+def test_parse_quantity_rejects(text):
+    with pytest.raises(UnitError):
+        parse_quantity(text)
+
+
+@pytest.mark.parametrize("text, status", [
+    ("93.33 lb·ft", "ok"),
+    ("1,120 lb-in", "ok"),
+    ("-1120 lb-in", "ok"),              # moments: magnitude only
+    ("1000 lb-in", "wrong"),
+    ("1120 in", "units"),
+    ("1120", "missing"),
+    ("lots", "invalid"),
+])
+def test_check_quantity(text, status):
+    assert check_quantity(text, 1120.0, "lb·in").status == status
+
+
+@pytest.mark.parametrize("text, status", [
+    ("-114.2°", "ok"),
+    ("245.8°", "ok"),                   # the same direction
+    ("-1.994 rad", "ok"),
+    ("114.2°", "wrong"),                # angles keep their sign
+    ("65.8°", "wrong"),
+])
+def test_check_quantity_angles(text, status):
+    assert check_quantity(text, -114.2, "°").status == status